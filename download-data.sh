@@ -3,12 +3,17 @@
 # Freqtrade Data Downloader (Spot + Futures)
 # 
 # Downloads historical data for both spot and futures trading
+# Only the missing candles are fetched (user_data/tools/coverage.py keeps a
+# coverage manifest next to the data, futures include the mark and funding
+# rate candles); --erase does a full re-download
 #
 # Usage:
 #   ./download-data.sh                    # Use defaults
 #   ./download-data.sh --timerange 20230101-20251230
 #   ./download-data.sh --timeframes "1h 4h 1d"
 #   ./download-data.sh --pairs "BTC/USDT ETH/USDT"
+#   ./download-data.sh --derive "15m 30m"   # built locally from 5m
+#   ./download-data.sh --erase              # full re-download (freqtrade)
 #===============================================================================
 
 set -e
@@ -20,6 +25,9 @@ set -e
 # Timeframes to download (1h for entry, 15m for trade detail)
 TIMEFRAMES="1h 5m"
 
+# Timeframes built locally from the downloaded 5m candles (no download)
+DERIVE_TIMEFRAMES="30m 15m"
+
 # Time range for data
 TIMERANGE="20211231-20260101"
 
@@ -31,6 +39,7 @@ EXCHANGE="binance"
 
 # Flags
 ERASE_EXISTING=false  # Default: incremental download (only missing data)
+RECHECK=false         # Ask the exchange again for ranges it had no candles for
 
 #-------------------------------------------------------------------------------
 # Parse command line arguments
@@ -53,6 +62,14 @@ while [[ $# -gt 0 ]]; do
             EXCHANGE="$2"
             shift 2
             ;;
+        --derive|-d)
+            DERIVE_TIMEFRAMES="$2"
+            shift 2
+            ;;
+        --no-derive)
+            DERIVE_TIMEFRAMES=""
+            shift
+            ;;
         --no-erase)
             ERASE_EXISTING=false
             shift
@@ -61,6 +78,10 @@ while [[ $# -gt 0 ]]; do
             ERASE_EXISTING=true
             shift
             ;;
+        --recheck)
+            RECHECK=true
+            shift
+            ;;
         --help|-h)
             echo "Usage: ./download-data.sh [OPTIONS]"
             echo ""
@@ -69,8 +90,11 @@ while [[ $# -gt 0 ]]; do
             echo "  --timerange, -r 20220101-20251230  Date range for data"
             echo "  --pairs, -p \"BTC/USDT ETH/USDT\"   Pairs (space-separated)"
             echo "  --exchange, -e binance           Exchange name"
-            echo "  --erase                          Erase existing data and redownload"
+            echo "  --derive, -d \"30m 15m\"          Timeframes resampled from 5m locally (default: 30m 15m)"
+            echo "  --no-derive                      Skip the resampling"
+            echo "  --erase                          Erase existing data and redownload (full download)"
             echo "  --no-erase                       Keep existing data (default)"
+            echo "  --recheck                        Re-request ranges the exchange had no candles for"
             echo "  --help, -h                       Show this help"
             exit 0
             ;;
@@ -83,12 +107,16 @@ while [[ $# -gt 0 ]]; do
 done
 
 #-------------------------------------------------------------------------------
-# Build erase flag
+# Build erase / recheck flags
 #-------------------------------------------------------------------------------
 ERASE_FLAG=""
 if [ "$ERASE_EXISTING" = true ]; then
     ERASE_FLAG="--erase"
 fi
+RECHECK_FLAG=""
+if [ "$RECHECK" = true ]; then
+    RECHECK_FLAG="--recheck"
+fi
 
 #-------------------------------------------------------------------------------
 # Colors
@@ -107,45 +135,74 @@ echo -e "${BLUE}========================================${NC}"
 echo ""
 echo -e "Exchange:    ${YELLOW}${EXCHANGE}${NC}"
 echo -e "Timeframes:  ${YELLOW}${TIMEFRAMES}${NC}"
+echo -e "Derive:      ${YELLOW}${DERIVE_TIMEFRAMES:-none}${NC}"
 echo -e "Timerange:   ${YELLOW}${TIMERANGE}${NC}"
 echo -e "Pairs:       ${YELLOW}${PAIRS}${NC}"
 echo -e "Erase:       ${YELLOW}${ERASE_EXISTING}${NC}"
 echo ""
 
-#-------------------------------------------------------------------------------
-# Download Spot Data
-#-------------------------------------------------------------------------------
-echo -e "${YELLOW}[1/2] Downloading SPOT data (${TIMEFRAMES})...${NC}"
-docker compose run --rm freqtrade download-data \
-    --exchange "$EXCHANGE" \
-    --trading-mode spot \
-    --timeframes $TIMEFRAMES \
-    --timerange "$TIMERANGE" \
-    $ERASE_FLAG \
-    --pairs $PAIRS
-
-echo ""
-
-#-------------------------------------------------------------------------------
-# Download Futures Data
-#-------------------------------------------------------------------------------
-echo -e "${YELLOW}[2/2] Downloading FUTURES data (${TIMEFRAMES})...${NC}"
-
 # Convert pairs to futures format (add :USDT suffix)
 FUTURES_PAIRS=""
 for PAIR in $PAIRS; do
     FUTURES_PAIRS="$FUTURES_PAIRS ${PAIR}:USDT"
 done
 
-docker compose run --rm freqtrade download-data \
-    --exchange "$EXCHANGE" \
-    --trading-mode futures \
-    --timeframes $TIMEFRAMES \
-    --timerange "$TIMERANGE" \
-    $ERASE_FLAG \
-    --pairs $FUTURES_PAIRS
+if [ "$ERASE_EXISTING" = true ]; then
+    #-------------------------------------------------------------------------------
+    # Download Spot Data
+    #-------------------------------------------------------------------------------
+    echo -e "${YELLOW}[1/2] Downloading SPOT data (${TIMEFRAMES})...${NC}"
+    docker compose run --rm freqtrade download-data \
+        --exchange "$EXCHANGE" \
+        --trading-mode spot \
+        --timeframes $TIMEFRAMES \
+        --timerange "$TIMERANGE" \
+        $ERASE_FLAG \
+        --pairs $PAIRS
+
+    echo ""
+
+    #-------------------------------------------------------------------------------
+    # Download Futures Data
+    #-------------------------------------------------------------------------------
+    echo -e "${YELLOW}[2/2] Downloading FUTURES data (${TIMEFRAMES})...${NC}"
+
+    docker compose run --rm freqtrade download-data \
+        --exchange "$EXCHANGE" \
+        --trading-mode futures \
+        --timeframes $TIMEFRAMES \
+        --timerange "$TIMERANGE" \
+        $ERASE_FLAG \
+        --pairs $FUTURES_PAIRS
+else
+    #---------------------------------------------------------------------------
+    # Download only the missing candles (spot + futures at once)
+    #---------------------------------------------------------------------------
+    echo -e "${YELLOW}[1/1] Downloading missing SPOT + FUTURES candles (${TIMEFRAMES}, + mark / funding rate)...${NC}"
+    docker compose run --rm --entrypoint python3 freqtrade \
+        user_data/tools/coverage.py \
+        --exchange "$EXCHANGE" \
+        --timeframes $TIMEFRAMES \
+        --timerange "$TIMERANGE" \
+        $RECHECK_FLAG \
+        --pairs $PAIRS
+fi
 
 echo ""
+
+#-------------------------------------------------------------------------------
+# Derive coarser timeframes (local, only the new tail on refresh)
+#-------------------------------------------------------------------------------
+if [ -n "$DERIVE_TIMEFRAMES" ]; then
+    echo -e "${YELLOW}[+] Resampling ${DERIVE_TIMEFRAMES} from stored candles...${NC}"
+    docker compose run --rm --entrypoint python3 freqtrade \
+        user_data/tools/resample.py \
+        --exchange "$EXCHANGE" \
+        --timeframes $DERIVE_TIMEFRAMES \
+        --pairs $PAIRS
+    echo ""
+fi
+
 echo -e "${GREEN}========================================${NC}"
 echo -e "${GREEN}  ✓ Data Download Complete!${NC}"
 echo -e "${GREEN}  - Spot: ${PAIRS}${NC}"
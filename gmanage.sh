@@ -10,6 +10,8 @@
 # Commands:
 #   ssh      - Connect to VM
 #   run      - Run hyperopt (supports passing hyperopt options)
+#   queue    - Manage the job queue (add / list / cancel, see user_data/tools/jobqueue.py)
+#   queue-run - Work through the job queue in background, then stop VM
 #   update   - Pull latest code
 #   start    - Start stopped VM
 #   stop     - Stop VM (saves costs)
@@ -67,6 +69,8 @@ show_help() {
     echo "  ssh      Connect to VM"
     echo "  run      Run hyperopt (foreground)"
     echo "  run-bg   Run hyperopt in background"
+    echo "  queue    Manage job queue: queue add|list|cancel ..."
+    echo "  queue-run Work through the job queue in background, then stop VM"
     echo "  check    Check if hyperopt is running"
     echo "  progress Show epochs completed + best result"
     echo "  output   View hyperopt output log"
@@ -90,12 +94,14 @@ show_help() {
     echo "  --epochs, -e       Number of epochs"
     echo "  --timerange, -t    Time range"
     echo "  --spaces           Optimization spaces"
-    echo "  --jobs, -j         Parallel jobs"
+    echo "  --jobs, -j         Parallel jobs (auto, -1 or a number)"
     echo ""
     echo "Examples:"
     echo "  ./gcloud-manage-vm.sh ssh"
     echo "  ./gcloud-manage-vm.sh run"
     echo "  ./gcloud-manage-vm.sh run --epochs 500"
+    echo "  ./gcloud-manage-vm.sh queue add hyperopt --strategy OptPerps --cores 4"
+    echo "  ./gcloud-manage-vm.sh queue list"
     echo "  ./gcloud-manage-vm.sh download"
     echo "  ./gcloud-manage-vm.sh download --timeframes '1h 4h 1d'"
     echo "  ./gcloud-manage-vm.sh stop"
@@ -226,6 +232,30 @@ case "$COMMAND" in
         esac
         ;;
     
+    queue)
+        gcloud compute ssh "$INSTANCE_NAME" --zone="$ZONE" -- \
+            "cd /opt/freqtrade && sudo python3 user_data/tools/jobqueue.py $HYPEROPT_ARGS"
+        ;;
+
+    queue-run)
+        echo -e "${YELLOW}Starting job queue in background on ${INSTANCE_NAME}...${NC}"
+        echo -e "${YELLOW}VM will auto-stop when the queue is empty.${NC}"
+        gcloud compute ssh "$INSTANCE_NAME" --zone="$ZONE" -- "
+            which screen > /dev/null || sudo apt-get install -y screen > /dev/null 2>&1
+            if sudo screen -list | grep -q jobqueue; then
+                echo 'Job queue is already running'
+                exit 0
+            fi
+            cd /opt/freqtrade
+            sudo screen -dmS jobqueue bash -c 'python3 user_data/tools/jobqueue.py run --exit-when-empty $HYPEROPT_ARGS 2>&1 | tee -a /opt/freqtrade/jobqueue.log; sleep 30; sudo shutdown -h now'
+            sleep 2
+            sudo screen -list | grep -q jobqueue && echo 'Job queue started' || echo 'ERROR: Failed to start job queue'
+        "
+        echo ""
+        echo -e "Commands to monitor:"
+        echo -e "  ${YELLOW}./gcloud-manage-vm.sh queue list${NC}"
+        ;;
+
     check)
         echo -e "${YELLOW}Checking hyperopt status on ${INSTANCE_NAME}...${NC}"
         gcloud compute ssh "$INSTANCE_NAME" --zone="$ZONE" -- '
@@ -263,12 +293,15 @@ case "$COMMAND" in
         echo -e "${YELLOW}Current best hyperopt results on ${INSTANCE_NAME}:${NC}"
         gcloud compute ssh "$INSTANCE_NAME" --zone="$ZONE" -- '
             cd /opt/freqtrade
+            # Resident service if running (docker compose up -d ftservice), else a fresh container
+            FREQTRADE="docker compose run --rm freqtrade"
+            [ -S user_data/freqtrade.sock ] && FREQTRADE="python3 user_data/tools/service.py"
             # Find the latest .fthypt file
             LATEST_FILE=$(ls -t user_data/hyperopt_results/*.fthypt 2>/dev/null | head -1)
             if [ -n "$LATEST_FILE" ]; then
                 FILENAME=$(basename "$LATEST_FILE")
                 echo "=== Using: $FILENAME ==="
-                docker compose run --rm freqtrade hyperopt-show --best --config user_data/config-long.json --hyperopt-filename "$FILENAME" 2>/dev/null
+                $FREQTRADE hyperopt-show --best --config user_data/config-long.json --hyperopt-filename "$FILENAME" 2>/dev/null
             else
                 echo "No hyperopt results found"
             fi
@@ -279,6 +312,9 @@ case "$COMMAND" in
         echo -e "${YELLOW}Checking hyperopt progress on ${INSTANCE_NAME}...${NC}"
         gcloud compute ssh "$INSTANCE_NAME" --zone="$ZONE" -- '
             cd /opt/freqtrade
+            # Resident service if running (docker compose up -d ftservice), else a fresh container
+            FREQTRADE="docker compose run --rm freqtrade"
+            [ -S user_data/freqtrade.sock ] && FREQTRADE="python3 user_data/tools/service.py"
             # Find the latest .fthypt file
             LATEST_FILE=$(ls -t user_data/hyperopt_results/*.fthypt 2>/dev/null | head -1)
             if [ -n "$LATEST_FILE" ]; then
@@ -293,7 +329,7 @@ case "$COMMAND" in
                 echo "Last update: $MOD_TIME"
                 echo ""
                 echo "=== Best Result So Far ==="
-                docker compose run --rm freqtrade hyperopt-show --best --config user_data/config-long.json --hyperopt-filename "$FILENAME" 2>/dev/null | head -20
+                $FREQTRADE hyperopt-show --best --config user_data/config-long.json --hyperopt-filename "$FILENAME" 2>/dev/null | head -20
             else
                 echo "No hyperopt results found yet"
             fi
@@ -23,12 +23,15 @@ SPACES="buy sell"
 TIMERANGE="20220101-20251230"
 CONFIG="user_data/config-long.json"
 EPOCHS=2000
-JOBS=-1  # -1 = use all cores
+JOBS=auto  # auto = as many cores as memory allows, -1 = all cores
 WALLET=100000  # Starting balance for hyperopt
 TIMEFRAME_DETAIL="30m"  # Timeframe detail for more accurate simulation
 UPLOAD_TO_GCS=true  # Upload results to GCS by default
 AUTO_STOP=false  # Auto-shutdown VM after completion
 FRESH_START=false  # Set to true to start fresh (no resume)
+SHARED_FRAMES=true  # Workers share one memory-mapped copy of the candle data
+SKIP_IDLE=true  # Jump over candles without open trades and without entry signals
+PROFILE=false  # Sample the workers, flamegraph profile next to the results
 
 #-------------------------------------------------------------------------------
 # Parse command line arguments
@@ -80,6 +83,18 @@ while [[ $# -gt 0 ]]; do
             FRESH_START=true
             shift
             ;;
+        --no-shared-frames)
+            SHARED_FRAMES=false
+            shift
+            ;;
+        --no-skip-idle)
+            SKIP_IDLE=false
+            shift
+            ;;
+        --profile)
+            PROFILE=true
+            shift
+            ;;
         --detail|-d)
             TIMEFRAME_DETAIL="$2"
             shift 2
@@ -94,12 +109,15 @@ while [[ $# -gt 0 ]]; do
             echo "  --timerange, -t   Time range (default: 20220101-20251230)"
             echo "  --config, -c      Config file (default: user_data/config-long.json)"
             echo "  --epochs, -e      Number of epochs (default: 2000)"
-            echo "  --jobs, -j        Number of parallel jobs, -1=all cores (default: -1)"
+            echo "  --jobs, -j        Parallel jobs, -1=all cores, auto=fit to memory (default: auto)"
             echo "  --wallet, -w      Starting balance (default: 100000)"
             echo "  --no-upload       Skip uploading results to GCS"
             echo "  --detail, -d      Timeframe detail for simulation (default: 30m)"
             echo "  --auto-stop       Shutdown VM after completion"
             echo "  --fresh           Start fresh hyperopt (don't resume from previous)"
+            echo "  --no-shared-frames  Give every worker its own copy of the data (stock freqtrade)"
+            echo "  --no-skip-idle    Simulate every candle, also when nothing is open or signalled"
+            echo "  --profile         Write a flamegraph profile of the workers next to the results"
             echo "  --help, -h        Show this help"
             exit 0
             ;;
@@ -111,6 +129,18 @@ while [[ $# -gt 0 ]]; do
     esac
 done
 
+#-------------------------------------------------------------------------------
+# Short freqtrade commands go to the resident service when it is running
+# (docker compose up -d ftservice), otherwise to a fresh container
+#-------------------------------------------------------------------------------
+freqtrade_cmd() {
+    if [ -S user_data/freqtrade.sock ]; then
+        python3 user_data/tools/service.py "$@"
+    else
+        docker compose run --rm freqtrade "$@"
+    fi
+}
+
 #-------------------------------------------------------------------------------
 # Colors
 #-------------------------------------------------------------------------------
@@ -134,6 +164,9 @@ echo -e "Config:      ${YELLOW}${CONFIG}${NC}"
 echo -e "Epochs:      ${YELLOW}${EPOCHS}${NC}"
 echo -e "Jobs:        ${YELLOW}${JOBS}${NC}"
 echo -e "Wallet:      ${YELLOW}${WALLET} USDT${NC}"
+echo -e "Shared data: ${YELLOW}${SHARED_FRAMES}${NC}"
+echo -e "Skip idle:   ${YELLOW}${SKIP_IDLE}${NC}"
+echo -e "Profile:     ${YELLOW}${PROFILE}${NC}"
 echo ""
 echo -e "Started at:  ${YELLOW}$(date)${NC}"
 echo ""
@@ -157,7 +190,37 @@ else
 fi
 echo ""
 
-docker compose run --rm freqtrade hyperopt \
+# Shared frames: data is written once to user_data/hyperopt_results/shared_frames
+# and memory-mapped by every worker (see user_data/tools/shared_frames.py)
+LAUNCHER_ARGS=""
+if [ "$SHARED_FRAMES" = true ]; then
+    LAUNCHER_ARGS="$LAUNCHER_ARGS --shared-frames"
+fi
+# Auto jobs: all cores is the upper limit, the pool is sized from measured
+# worker memory (see user_data/tools/worker_memory.py)
+FT_JOBS="$JOBS"
+if [ "$JOBS" = "auto" ]; then
+    LAUNCHER_ARGS="$LAUNCHER_ARGS --auto-jobs"
+    FT_JOBS=-1
+fi
+# Skip idle: epochs jump between entry candles while no trade is open
+# (see user_data/tools/signal_index.py)
+if [ "$SKIP_IDLE" = true ]; then
+    LAUNCHER_ARGS="$LAUNCHER_ARGS --skip-idle"
+fi
+# Profile: strategy_<name>_<date>.collapsed / .profile.txt next to the .fthypt
+# (see user_data/tools/profiler.py)
+if [ "$PROFILE" = true ]; then
+    LAUNCHER_ARGS="$LAUNCHER_ARGS --profile"
+fi
+
+if [ -n "$LAUNCHER_ARGS" ]; then
+    FREQTRADE_CMD="--entrypoint python3 freqtrade user_data/tools/launcher.py$LAUNCHER_ARGS"
+else
+    FREQTRADE_CMD="freqtrade"
+fi
+
+docker compose run --rm $FREQTRADE_CMD hyperopt \
     --strategy "$STRATEGY" \
     --hyperopt-loss "$HYPEROPT_LOSS" \
     --spaces $SPACES \
@@ -165,7 +228,7 @@ docker compose run --rm freqtrade hyperopt \
     --timeframe-detail "$TIMEFRAME_DETAIL" \
     --config "$CONFIG" \
     --dry-run-wallet "$WALLET" \
-    -j "$JOBS" \
+    -j "$FT_JOBS" \
     -e "$EPOCHS"
 
 # Capture exit code
@@ -218,7 +281,7 @@ RESULT_FILE="hyperopt_${STRATEGY}_${TIMESTAMP}.json"
 echo -e "${YELLOW}Exporting best result...${NC}"
 
 # Export best result as JSON (using --print-json and redirect)
-docker compose run --rm freqtrade hyperopt-show --best --print-json \
+freqtrade_cmd hyperopt-show --best --print-json \
     --config "$CONFIG" > "user_data/${RESULT_FILE}" 2>/dev/null
 
 if [ -s "user_data/${RESULT_FILE}" ]; then
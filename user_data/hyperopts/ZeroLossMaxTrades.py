@@ -1,5 +1,6 @@
 
 from freqtrade.optimize.hyperopt import IHyperOptLoss
+import pandas as pd
 from pandas import DataFrame
 import numpy as np
 
@@ -49,3 +50,56 @@ class ZeroLossMaxTrades(IHyperOptLoss):
         Required by IHyperOptLoss interface.
         """
         return self.calculate_loss(results, trade_count, min_date, max_date, *args, **kwargs)
+
+
+class ZeroLossMultiPeriod(ZeroLossMaxTrades):
+    """
+    ZeroLossMaxTrades on several periods of one simulation:
+    1. The trade list is sliced by open date into periods ending at the end of
+       the timerange (2022-2025, 2023-2025, 2024-2025, 2025 - the consistency
+       check that used to be four separate backtests).
+    2. Every period must pass the win rate / avg profit checks. Otherwise the
+       worst period's penalty is the loss.
+    3. All periods pass: maximize trades, discounted by how unevenly they are
+       spread over the calendar years (coefficient of variation of trades/day).
+    Trades still open at a period start count for the period they opened in.
+    """
+
+    # Period start dates, None = every 1 January inside the timerange
+    PERIOD_STARTS: list[str] | None = None
+    CONSISTENCY_WEIGHT = 0.5
+
+    def period_starts(self, min_date, max_date) -> list:
+        if self.PERIOD_STARTS:
+            starts = [pd.Timestamp(s, tz="UTC") for s in self.PERIOD_STARTS]
+        else:
+            starts = [pd.Timestamp(year=y, month=1, day=1, tz="UTC")
+                      for y in range(min_date.year + 1, max_date.year + 1)]
+        return [pd.Timestamp(min_date)] + [s for s in starts if min_date < s < max_date]
+
+    def calculate_loss(self, results: DataFrame, trade_count: int,
+                       min_date, max_date,
+                       *args, **kwargs) -> float:
+
+        if trade_count == 0:
+            return 1000.0
+
+        opened = results['open_date']
+        losses = []
+        for start in self.period_starts(min_date, max_date):
+            period = results[opened >= start]
+            losses.append(super().calculate_loss(period, len(period), start, max_date))
+        if max(losses) > 0:
+            return max(losses)
+
+        # Trades per day in each calendar year (first / last year partial)
+        years = opened.dt.year
+        rates = []
+        for year in range(min_date.year, max_date.year + 1):
+            first = max(pd.Timestamp(min_date), pd.Timestamp(year=year, month=1, day=1, tz="UTC"))
+            last = min(pd.Timestamp(max_date), pd.Timestamp(year=year + 1, month=1, day=1, tz="UTC"))
+            days = (last - first).total_seconds() / 86400
+            if days >= 1:
+                rates.append((years == year).sum() / days)
+        spread = np.std(rates) / np.mean(rates) if len(rates) > 1 else 0.0
+        return -1.0 * trade_count * (1 - self.CONSISTENCY_WEIGHT * min(spread, 1.0))
@@ -12,6 +12,7 @@ PAIRS = ['SOL/USDC', 'BTC/USDC', 'ETH/USDC', 'HYPE/USDC']
 TIMEFRAME = '1h'
 SINCE_STR = '2024-11-01 00:00:00'
 DATA_DIR = 'user_data/data/hyperliquid'
+COMPACT = False  # float32 prices (volume stays float64), see user_data/tools/compact.py
 
 async def download_pair(ex, pair):
     print(f"Downloading {pair}...")
@@ -68,11 +69,13 @@ async def save_to_file(pair, ohlcv):
     # Convert date to datetime if needed, but Freqtrade might expect int timestamps 
     # OR datetime objects.
     # Freqtrade Feather expects: date (datetime64[ns, UTC]), open, high, low, close, volume (float64)
+    # (float32 prices load fine - freqtrade casts back to float64 unless launched with --compact)
+    price_dtype = 'float32' if COMPACT else 'float64'
     df['date'] = pd.to_datetime(df['date'], unit='ms', utc=True)
-    df['open'] = df['open'].astype('float64')
-    df['high'] = df['high'].astype('float64')
-    df['low'] = df['low'].astype('float64')
-    df['close'] = df['close'].astype('float64')
+    df['open'] = df['open'].astype(price_dtype)
+    df['high'] = df['high'].astype(price_dtype)
+    df['low'] = df['low'].astype(price_dtype)
+    df['close'] = df['close'].astype(price_dtype)
     df['volume'] = df['volume'].astype('float64')
 
     # Freqtrade format: pair name in filename should use underscore? 
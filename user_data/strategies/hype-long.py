@@ -12,10 +12,11 @@ from pandas import DataFrame
 import pandas as pd
 import numpy as np
 import talib.abstract as ta
-import logging
 from datetime import datetime
 from typing import Optional
 
+from sekka_logging import callbacks_enabled, strategy_logger
+
 
 class HypeLong(IStrategy):
     timeframe = "1h"
@@ -44,9 +45,15 @@ class HypeLong(IStrategy):
     
     #max_entry_position_adjustment = -1
 
-    logger = logging.getLogger(__name__)
+    logger = strategy_logger(__name__, rate=1, period=300)  # Per line and pair: at most once per 5 min
+    LOG_CALLBACKS = False  # Log from callbacks in backtest / hyperopt too
+    _log_callbacks = True
     _last_dca_stage = None
 
+    # ------------------ Logging ------------------
+    def bot_start(self, **kwargs) -> None:
+        self._log_callbacks = callbacks_enabled(self.config, self.LOG_CALLBACKS)
+
     # ------------------ Informative Pairs ------------------
     def informative_pairs(self):
         return []
@@ -147,7 +154,8 @@ class HypeLong(IStrategy):
 
     # ------------------ DCA Logic ------------------
     def adjust_trade_position(self, trade, current_time, current_rate, current_profit, **kwargs):
-        self.logger.info(f"[{current_time}] {trade.pair} | DCA check stage={trade.nr_of_successful_entries}")
+        if self._log_callbacks:
+            self.logger.info("[%s] %s | DCA check stage=%s", current_time, trade.pair, trade.nr_of_successful_entries)
         if self._last_dca_stage is None:
             self._last_dca_stage = {}
 
@@ -174,10 +182,11 @@ class HypeLong(IStrategy):
             tag = f"DCA_{next_stage}"
             self._last_dca_stage[trade_id] = current_stage
 
-            self.logger.info(
-                f"[{current_time}] {trade.pair} | Triggering {tag} at {current_rate:.4f} "
-                f"({drop_ratio*100:.2f}%) | Free={free_balance:.2f} Stake={est_stake:.2f}"
-            )
+            if self._log_callbacks:
+                self.logger.info(
+                    "[%s] %s | Triggering %s at %.4f (%.2f%%) | Free=%.2f Stake=%.2f",
+                    current_time, trade.pair, tag, current_rate, drop_ratio * 100, free_balance, est_stake,
+                )
             trade.enter_tag = tag
             return est_stake  # ✅ FIXED: execute with actual stake
 
@@ -196,13 +205,15 @@ class HypeLong(IStrategy):
             rsi_1h = 50
             
         if rel >= self.TP_THRESHOLD and rsi_1h >= self.RSI_TP: 
-            self.logger.info(f"[{current_time}] {pair} | TAKE_PROFIT reached +{rel*100:.2f}%")
+            if self._log_callbacks:
+                self.logger.info("[%s] %s | TAKE_PROFIT reached +%.2f%%", current_time, pair, rel * 100)
             self._last_dca_stage.pop(f"{pair}_{trade.open_date}", None)
             return "TAKE_PROFIT"
 
         # Stop loss after all DCAs are used
         #if dca_stage >= (self.DCA_STEP + 1) and rel <= -self.DCA_THRESHOLD:
-        #    self.logger.info(f"[{current_time}] {pair} | STOP_LOSS_AFTER_DCA triggered {rel*100:.2f}%")
+        #    if self._log_callbacks:
+        self.logger.info("[%s] %s | STOP_LOSS_AFTER_DCA triggered %.2f%%", current_time, pair, rel * 100)
         #    self._last_dca_stage.pop(f"{pair}_{trade.open_date}", None)
         #    return "STOP_LOSS_AFTER_DCA"
 
@@ -10,10 +10,11 @@ from pandas import DataFrame
 import pandas as pd
 import numpy as np
 import talib.abstract as ta
-import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
+from sekka_logging import callbacks_enabled, strategy_logger
+
 
 class OptLong(IStrategy):
     timeframe = "1h"
@@ -51,10 +52,16 @@ class OptLong(IStrategy):
     minimal_roi = {}  # We use custom_exit instead
     stoploss = -0.7
 
-    logger = logging.getLogger(__name__)
+    logger = strategy_logger(__name__, rate=1, period=300)  # Per line and pair: at most once per 5 min
+    LOG_CALLBACKS = False  # Log from callbacks in backtest / hyperopt too
+    _log_callbacks = True
     _last_dca_stage = None
     _stoploss_cooldown = {}  # Track pairs in cooldown after STOP_LOSS_AFTER_DCA
 
+    # ------------------ Logging ------------------
+    def bot_start(self, **kwargs) -> None:
+        self._log_callbacks = callbacks_enabled(self.config, self.LOG_CALLBACKS)
+
     # ------------------ Informative Pairs ------------------
     def informative_pairs(self):
         pairs = self.dp.current_whitelist()
@@ -114,7 +121,8 @@ class OptLong(IStrategy):
         
         cooldown_until = self._stoploss_cooldown.get(pair)
         if cooldown_until and current_time < cooldown_until:
-            self.logger.info(f"[{pair}] Entry blocked - cooldown until {cooldown_until}")
+            if self._log_callbacks:
+                self.logger.info("[%s] Entry blocked - cooldown until %s", pair, cooldown_until)
             return False
         
         # Clear expired cooldown
@@ -11,9 +11,11 @@ from pandas import DataFrame
 import pandas as pd
 import numpy as np
 import talib.abstract as ta
-import logging
 
-class SekkaAi(IStrategy):
+from sekka_logging import callbacks_enabled, strategy_logger
+from sekka_metrics import SekkaMetrics
+
+class SekkaAi(SekkaMetrics, IStrategy):
     timeframe = "1m"
     informative_timeframes = ["30m", "1h"]
     process_only_new_candles = True
@@ -34,9 +36,15 @@ class SekkaAi(IStrategy):
     stoploss = -0.99
     max_entry_position_adjustment = 3
 
-    logger = logging.getLogger(__name__)
+    logger = strategy_logger(__name__, rate=1, period=300)  # Per line and pair: at most once per 5 min
+    LOG_CALLBACKS = False  # Log from callbacks in backtest / hyperopt too
+    _log_callbacks = True
     _last_dca_stage = None
 
+    # ------------------ Logging ------------------
+    def bot_start(self, **kwargs) -> None:
+        self._log_callbacks = callbacks_enabled(self.config, self.LOG_CALLBACKS)
+
     # ------------------ Helper Methods ------------------
     def hlc3(self, df: DataFrame) -> pd.Series:
         return (df["high"] + df["low"] + df["close"]) / 3.0
@@ -141,7 +149,8 @@ class SekkaAi(IStrategy):
         return float(max(min(stake, remaining), 0.0))
 
     def adjust_trade_position(self, trade, current_time, current_rate, current_profit, **kwargs):
-        self.logger.info(f"[{current_time}] {trade.pair} | DCA check stage={trade.nr_of_successful_entries}")
+        if self._log_callbacks:
+            self.logger.info("[%s] %s | DCA check stage=%s", current_time, trade.pair, trade.nr_of_successful_entries)
         if self._last_dca_stage is None:
             self._last_dca_stage = {}
 
@@ -166,10 +175,11 @@ class SekkaAi(IStrategy):
             tag = f"DCA_{next_stage}"
             self._last_dca_stage[trade_id] = current_stage
 
-            self.logger.info(
-                f"[{current_time}] {trade.pair} | Triggering {tag} at {current_rate:.4f} "
-                f"({drop_ratio*100:.2f}%) | Free={free_balance:.2f} Stake={est_stake:.2f}"
-            )
+            if self._log_callbacks:
+                self.logger.info(
+                    "[%s] %s | Triggering %s at %.4f (%.2f%%) | Free=%.2f Stake=%.2f",
+                    current_time, trade.pair, tag, current_rate, drop_ratio * 100, free_balance, est_stake,
+                )
             trade.enter_tag = tag
             return est_stake
 
@@ -190,12 +200,14 @@ class SekkaAi(IStrategy):
             rsi_1m = 50
             
         if rel >= self.TP_THRESHOLD and rsi_1m >= 70: 
-            self.logger.info(f"[{current_time}] {pair} | TAKE_PROFIT reached +{rel*100:.2f}%")
+            if self._log_callbacks:
+                self.logger.info("[%s] %s | TAKE_PROFIT reached +%.2f%%", current_time, pair, rel * 100)
             self._last_dca_stage.pop(f"{pair}_{trade.open_date}", None)
             return "TAKE_PROFIT"
 
         if dca_stage >= 4 and rel <= -self.DCA_STEP:
-            self.logger.info(f"[{current_time}] {pair} | STOP_LOSS_AFTER_DCA triggered {rel*100:.2f}%")
+            if self._log_callbacks:
+                self.logger.info("[%s] %s | STOP_LOSS_AFTER_DCA triggered %.2f%%", current_time, pair, rel * 100)
             self._last_dca_stage.pop(f"{pair}_{trade.open_date}", None)
             return "STOP_LOSS_AFTER_DCA"
 
@@ -11,9 +11,11 @@ from pandas import DataFrame
 import pandas as pd
 import numpy as np
 import talib.abstract as ta
-import logging
 
-class SekkaHour(IStrategy):
+from sekka_logging import callbacks_enabled, strategy_logger
+from sekka_metrics import SekkaMetrics
+
+class SekkaHour(SekkaMetrics, IStrategy):
     timeframe = "1h"
     informative_timeframes = []
     process_only_new_candles = True
@@ -53,9 +55,15 @@ class SekkaHour(IStrategy):
     minimal_roi = {}
     stoploss = -0.99
 
-    logger = logging.getLogger(__name__)
+    logger = strategy_logger(__name__, rate=1, period=300)  # Per line and pair: at most once per 5 min
+    LOG_CALLBACKS = False  # Log from callbacks in backtest / hyperopt too
+    _log_callbacks = True
     _last_dca_stage = None
 
+    # ------------------ Logging ------------------
+    def bot_start(self, **kwargs) -> None:
+        self._log_callbacks = callbacks_enabled(self.config, self.LOG_CALLBACKS)
+
     # ------------------ Plot Config ------------------
     plot_config = {
         "main_plot": {
@@ -211,7 +219,8 @@ class SekkaHour(IStrategy):
 
     # ------------------ DCA Logic ------------------
     def adjust_trade_position(self, trade, current_time, current_rate, current_profit, **kwargs):
-        self.logger.info(f"[{current_time}] {trade.pair} | DCA check stage={trade.nr_of_successful_entries}")
+        if self._log_callbacks:
+            self.logger.info("[%s] %s | DCA check stage=%s", current_time, trade.pair, trade.nr_of_successful_entries)
         if self._last_dca_stage is None:
             self._last_dca_stage = {}
 
@@ -252,7 +261,8 @@ class SekkaHour(IStrategy):
             self._last_dca_stage[trade_id] = current_stage
             
             # Log
-            self.logger.info(f"Triggering DCA {tag} for {trade.pair} ({trade.trade_direction})")
+            if self._log_callbacks:
+                self.logger.info("Triggering DCA %s for %s (%s)", tag, trade.pair, trade.trade_direction)
             
             trade.enter_tag = tag
             return est_stake
@@ -302,13 +312,15 @@ class SekkaHour(IStrategy):
              
              # Placeholder for Short TP Custom: Just use ROI for now or symmetric
              if rel >= self.TP_THRESHOLD_SHORT and rsi_val <= self.RSI_TP_SHORT:
-                self.logger.info(f"[{current_time}] {pair} | TAKE_PROFIT reached +{rel*100:.2f}%")
+                if self._log_callbacks:
+                    self.logger.info("[%s] %s | TAKE_PROFIT reached +%.2f%%", current_time, pair, rel * 100)
                 self._last_dca_stage.pop(f"{pair}_{trade.open_date}", None)
                 return "TAKE_PROFIT"
         else:
              # Long
              if rel >= self.TP_THRESHOLD and rsi_val >= self.RSI_TP: 
-                 self.logger.info(f"[{current_time}] {pair} | TAKE_PROFIT reached +{rel*100:.2f}%")
+                 if self._log_callbacks:
+                     self.logger.info("[%s] %s | TAKE_PROFIT reached +%.2f%%", current_time, pair, rel * 100)
                  self._last_dca_stage.pop(f"{pair}_{trade.open_date}", None)
                  return "TAKE_PROFIT"
 
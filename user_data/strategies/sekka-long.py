@@ -10,12 +10,15 @@ from pandas import DataFrame
 import pandas as pd
 import numpy as np
 import talib.abstract as ta
-import logging
 from datetime import datetime
 from typing import Optional
 
+from sekka_logging import callbacks_enabled, strategy_logger
+from sekka_metrics import SekkaMetrics
+from timeframe_align import CandleIndex
 
-class SekkaLong(IStrategy):
+
+class SekkaLong(SekkaMetrics, IStrategy):
     timeframe = "1h"
     informative_timeframes = []  # Single timeframe only - no multi-timeframe
     process_only_new_candles = True
@@ -41,6 +44,9 @@ class SekkaLong(IStrategy):
 
     # Sell parameters
     TP_PERCENTAGE = 0.02
+    TP_RSI = 55
+    EXIT_RSI_FILTER = False  # Take profit only when RSI on EXIT_TIMEFRAME >= TP_RSI
+    EXIT_TIMEFRAME = "5m"  # Timeframe for exit RSI check (match with --timeframe-detail)
 
     COOLDOWN_HOURS = 24  # Hours to wait before re-entering after stop loss
     stoploss = -0.7
@@ -53,11 +59,18 @@ class SekkaLong(IStrategy):
 
     #max_entry_position_adjustment = -1
 
-    logger = logging.getLogger(__name__)
+    logger = strategy_logger(__name__, rate=1, period=300)  # Per line and pair: at most once per 5 min
+    LOG_CALLBACKS = False  # Log from callbacks in backtest / hyperopt too
+    _log_callbacks = True
     _last_dca_stage = None
     _stoploss_cooldown = {}  # Track pairs in cooldown after STOP_LOSS_AFTER_DCA
+    _exit_rsi = {}  # pair -> (CandleIndex, RSI values) of the EXIT_TIMEFRAME candles
     
 
+    # ------------------ Logging ------------------
+    def bot_start(self, **kwargs) -> None:
+        self._log_callbacks = callbacks_enabled(self.config, self.LOG_CALLBACKS)
+
     # ------------------ Informative Pairs ------------------
     def informative_pairs(self):
         pairs = self.dp.current_whitelist()
@@ -66,7 +79,7 @@ class SekkaLong(IStrategy):
             # Add main timeframe (for entry indicators)
             informative_pairs.append((pair, self.timeframe))
             # Add exit timeframe (for exit RSI calculation)
-            if self.EXIT_TIMEFRAME != self.timeframe:
+            if self.EXIT_RSI_FILTER and self.EXIT_TIMEFRAME != self.timeframe:
                 informative_pairs.append((pair, self.EXIT_TIMEFRAME))
         return informative_pairs
 
@@ -132,7 +145,8 @@ class SekkaLong(IStrategy):
         
         cooldown_until = self._stoploss_cooldown.get(pair)
         if cooldown_until and current_time < cooldown_until:
-            self.logger.info(f"[{pair}] Entry blocked - cooldown until {cooldown_until}")
+            if self._log_callbacks:
+                self.logger.info("[%s] Entry blocked - cooldown until %s", pair, cooldown_until)
             return False
         
         # Clear expired cooldown
@@ -202,6 +216,28 @@ class SekkaLong(IStrategy):
 
         return 0
 
+    # ------------------ Exit RSI ------------------
+    def exit_rsi(self, pair: str, current_time) -> float:
+        """
+        RSI of the last EXIT_TIMEFRAME candle closed at current_time.
+        RSI is calculated once per pair (again only when a newer exit candle is
+        needed), every call after that is an index lookup - no look-ahead.
+        """
+        cached = self._exit_rsi.get(pair)
+        if cached is None or not cached[0].covers(current_time):
+            df = self.dp.get_pair_dataframe(pair, self.EXIT_TIMEFRAME)
+            if df.empty:
+                return 50.0
+            cached = (CandleIndex(df["date"], self.EXIT_TIMEFRAME),
+                      ta.RSI(df, timeperiod=self.GENERAL_PERIOD).to_numpy())
+            self._exit_rsi[pair] = cached
+
+        index, rsi = cached
+        row = min(int(index.last_closed(current_time)), len(index) - 1)
+        if row < 0 or np.isnan(rsi[row]):
+            return 50.0  # Default if no RSI yet
+        return float(rsi[row])
+
     # ------------------ Exit Logic ------------------
     def custom_exit(self, pair: str, trade, current_time, current_rate, **kwargs):
         avg_price = trade.open_rate
@@ -210,18 +246,10 @@ class SekkaLong(IStrategy):
         # For spot trading, use current_rate directly
         rel = (current_rate / avg_price) - 1.0
 
-        # Get RSI from exit timeframe (matches --timeframe-detail)
-        #try:
-            #df, _ = self.dp.get_analyzed_dataframe(pair, self.EXIT_TIMEFRAME)
-            # Calculate RSI on the exit timeframe data
-            #import talib.abstract as ta_exit
-            #rsi_exit = ta_exit.RSI(df, timeperiod=self.GENERAL_PERIOD).iloc[-1]
-            #rsi_exit = 50
-        #except Exception:
-        #    rsi_exit = 50  # Default if unable to get RSI
-
-        # Take profit based on price percentage & RSI
-        if rel >= self.TP_PERCENTAGE: # and rsi_exit >= self.TP_RSI:
+        # Take profit based on price percentage & RSI of the last closed EXIT_TIMEFRAME candle
+        if rel >= self.TP_PERCENTAGE and (
+            not self.EXIT_RSI_FILTER or self.exit_rsi(pair, current_time) >= self.TP_RSI
+        ):
             return "TAKE_PROFIT"
 
         # Stop loss after all DCAs are used
@@ -234,7 +262,8 @@ class SekkaLong(IStrategy):
             from datetime import timedelta
             cooldown_until = current_time + timedelta(hours=self.COOLDOWN_HOURS)
             self._stoploss_cooldown[pair] = cooldown_until
-            self.logger.info(f"[{pair}] STOP_LOSS_AFTER_DCA - cooldown until {cooldown_until}")
+            if self._log_callbacks:
+                self.logger.info("[%s] STOP_LOSS_AFTER_DCA - cooldown until %s", pair, cooldown_until)
             
             return "STOP_LOSS_AFTER_DCA"
 
@@ -14,8 +14,11 @@ import logging
 from datetime import datetime
 from typing import Optional
 
+from sekka_metrics import SekkaMetrics
+from timeframe_align import CandleIndex
 
-class SekkaPerps(IStrategy):
+
+class SekkaPerps(SekkaMetrics, IStrategy):
     timeframe = "1h"
     informative_timeframes = []  # Single timeframe only - no multi-timeframe
     process_only_new_candles = True
@@ -41,6 +44,9 @@ class SekkaPerps(IStrategy):
 
     # Sell parameters
     TP_PERCENTAGE = 0.02
+    TP_RSI = 55
+    EXIT_RSI_FILTER = False  # Take profit only when RSI on EXIT_TIMEFRAME >= TP_RSI
+    EXIT_TIMEFRAME = "5m"  # Timeframe for exit RSI check (match with --timeframe-detail)
 
     # Futures settings
     LEVERAGE = 1  # 3x leverage for futures
@@ -54,6 +60,7 @@ class SekkaPerps(IStrategy):
     logger = logging.getLogger(__name__)
     _last_dca_stage = None
     _stoploss_cooldown = {}  # Track pairs in cooldown after STOP_LOSS_AFTER_DCA
+    _exit_rsi = {}  # pair -> (CandleIndex, RSI values) of the EXIT_TIMEFRAME candles
     _entry_stake = {}  # Track per-entry stake for each pair (consistent throughout trade cycle)
     
 
@@ -64,6 +71,9 @@ class SekkaPerps(IStrategy):
         for pair in pairs:
             # Add main timeframe (for entry indicators)
             informative_pairs.append((pair, self.timeframe))
+            # Add exit timeframe (for exit RSI calculation)
+            if self.EXIT_RSI_FILTER and self.EXIT_TIMEFRAME != self.timeframe:
+                informative_pairs.append((pair, self.EXIT_TIMEFRAME))
         return informative_pairs
 
     # ------------------ Leverage (Futures) ------------------
@@ -247,6 +257,28 @@ class SekkaPerps(IStrategy):
 
         return 0
 
+    # ------------------ Exit RSI ------------------
+    def exit_rsi(self, pair: str, current_time) -> float:
+        """
+        RSI of the last EXIT_TIMEFRAME candle closed at current_time.
+        RSI is calculated once per pair (again only when a newer exit candle is
+        needed), every call after that is an index lookup - no look-ahead.
+        """
+        cached = self._exit_rsi.get(pair)
+        if cached is None or not cached[0].covers(current_time):
+            df = self.dp.get_pair_dataframe(pair, self.EXIT_TIMEFRAME)
+            if df.empty:
+                return 50.0
+            cached = (CandleIndex(df["date"], self.EXIT_TIMEFRAME),
+                      ta.RSI(df, timeperiod=self.GENERAL_PERIOD).to_numpy())
+            self._exit_rsi[pair] = cached
+
+        index, rsi = cached
+        row = min(int(index.last_closed(current_time)), len(index) - 1)
+        if row < 0 or np.isnan(rsi[row]):
+            return 50.0  # Default if no RSI yet
+        return float(rsi[row])
+
     # ------------------ Exit Logic ------------------
     def custom_exit(self, pair: str, trade, current_time, current_rate, **kwargs):
         avg_price = trade.open_rate
@@ -255,18 +287,10 @@ class SekkaPerps(IStrategy):
         # For spot trading, use current_rate directly
         rel = (current_rate / avg_price) - 1.0
 
-        # Get RSI from exit timeframe (matches --timeframe-detail)
-        #try:
-            #df, _ = self.dp.get_analyzed_dataframe(pair, self.EXIT_TIMEFRAME)
-            # Calculate RSI on the exit timeframe data
-            #import talib.abstract as ta_exit
-            #rsi_exit = ta_exit.RSI(df, timeperiod=self.GENERAL_PERIOD).iloc[-1]
-            #rsi_exit = 50
-        #except Exception:
-        #    rsi_exit = 50  # Default if unable to get RSI
-
-        # Take profit based on price percentage 
-        if rel >= self.TP_PERCENTAGE: # and rsi_exit >= self.TP_RSI:
+        # Take profit based on price percentage & RSI of the last closed EXIT_TIMEFRAME candle
+        if rel >= self.TP_PERCENTAGE and (
+            not self.EXIT_RSI_FILTER or self.exit_rsi(pair, current_time) >= self.TP_RSI
+        ):
             return "TAKE_PROFIT"
 
         # Stop loss after all DCAs are used
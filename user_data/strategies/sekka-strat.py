@@ -12,10 +12,12 @@ from pandas import DataFrame
 import pandas as pd
 import numpy as np
 import talib.abstract as ta
-import logging
 
+from sekka_logging import callbacks_enabled, strategy_logger
+from sekka_metrics import SekkaMetrics
 
-class SekkaStrat(IStrategy):
+
+class SekkaStrat(SekkaMetrics, IStrategy):
     timeframe = "1m"
     informative_timeframes = []
     process_only_new_candles = True
@@ -41,9 +43,15 @@ class SekkaStrat(IStrategy):
     stoploss = -0.99
     max_entry_position_adjustment = DCA_STEP
 
-    logger = logging.getLogger(__name__)
+    logger = strategy_logger(__name__, rate=1, period=300)  # Per line and pair: at most once per 5 min
+    LOG_CALLBACKS = False  # Log from callbacks in backtest / hyperopt too
+    _log_callbacks = True
     _last_dca_stage = None
 
+    # ------------------ Logging ------------------
+    def bot_start(self, **kwargs) -> None:
+        self._log_callbacks = callbacks_enabled(self.config, self.LOG_CALLBACKS)
+
     # ------------------ Plot Config ------------------
     plot_config = {
         "main_plot": {
@@ -137,7 +145,8 @@ class SekkaStrat(IStrategy):
 
     # ------------------ DCA Logic ------------------
     def adjust_trade_position(self, trade, current_time, current_rate, current_profit, **kwargs):
-        self.logger.info(f"[{current_time}] {trade.pair} | DCA check stage={trade.nr_of_successful_entries}")
+        if self._log_callbacks:
+            self.logger.info("[%s] %s | DCA check stage=%s", current_time, trade.pair, trade.nr_of_successful_entries)
         if self._last_dca_stage is None:
             self._last_dca_stage = {}
 
@@ -164,10 +173,11 @@ class SekkaStrat(IStrategy):
             tag = f"DCA_{next_stage}"
             self._last_dca_stage[trade_id] = current_stage
 
-            self.logger.info(
-                f"[{current_time}] {trade.pair} | Triggering {tag} at {current_rate:.4f} "
-                f"({drop_ratio*100:.2f}%) | Free={free_balance:.2f} Stake={est_stake:.2f}"
-            )
+            if self._log_callbacks:
+                self.logger.info(
+                    "[%s] %s | Triggering %s at %.4f (%.2f%%) | Free=%.2f Stake=%.2f",
+                    current_time, trade.pair, tag, current_rate, drop_ratio * 100, free_balance, est_stake,
+                )
             trade.enter_tag = tag
             return est_stake  # ✅ FIXED: execute with actual stake
 
@@ -187,14 +197,16 @@ class SekkaStrat(IStrategy):
             rsi_1m = 50
             
         if rel >= self.TP_THRESHOLD and rsi_1m >= self.RSI_TP: 
-            self.logger.info(f"[{current_time}] {pair} | TAKE_PROFIT reached +{rel*100:.2f}%")
+            if self._log_callbacks:
+                self.logger.info("[%s] %s | TAKE_PROFIT reached +%.2f%%", current_time, pair, rel * 100)
             self._last_dca_stage.pop(f"{pair}_{trade.open_date}", None)
             return "TAKE_PROFIT"
 
         # DISABLED CUT LOSS
         # Stop loss after all DCAs are used
         #if dca_stage >= (self.DCA_STEP + 1) and rel <= -self.DCA_THRESHOLD:
-        #    self.logger.info(f"[{current_time}] {pair} | STOP_LOSS_AFTER_DCA triggered {rel*100:.2f}%")
+        #    if self._log_callbacks:
+        self.logger.info("[%s] %s | STOP_LOSS_AFTER_DCA triggered %.2f%%", current_time, pair, rel * 100)
         #    self._last_dca_stage.pop(f"{pair}_{trade.open_date}", None)
         #    return "STOP_LOSS_AFTER_DCA"
 
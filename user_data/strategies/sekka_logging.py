@@ -0,0 +1,127 @@
+# ================================================================
+# Sekka Logging – cheap logging for strategy callbacks
+# ---------------------------------------------------------------
+# adjust_trade_position / confirm_trade_entry run for every open trade
+# on every candle (backtest) or every loop (live). Their log lines were
+# f-strings, formatted even when dropped, written synchronously:
+# - strategy_logger(): plain logging.Logger (pickles by name, so it is
+#   safe on hyperopt workers) with
+#   - RateLimit: per event (message template + pair) at most `rate`
+#     records per `period` seconds, every `sample`-th record kept;
+#     the next record that passes carries the suppressed count
+#   - QueueHandler: records formatted / written by a background thread
+#     (handed to the root logger's handlers, whatever freqtrade set up)
+# - Call sites use %-style arguments - formatted only when emitted
+# - QUIET_MODES: run modes without callback logging (backtest /
+#   hyperopt); strategies set a flag in bot_start from
+#   callbacks_enabled(), so a dropped line costs one attribute lookup
+#
+# Not a strategy - lives here so the strategy files can import it.
+# Hyperopt workers can not import this module: the returned Logger
+# pickles by name, the functions strategy methods call are pickled by
+# value (registered with joblib's cloudpickle below).
+# ================================================================
+
+import atexit
+import logging
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+
+# No callback logging in these run modes unless the strategy sets LOG_CALLBACKS = True
+QUIET_MODES = ("backtest", "hyperopt")
+
+
+def callbacks_enabled(config: dict, force: bool = False) -> bool:
+    """
+    Callbacks run for every open trade on every candle - silent in backtest /
+    hyperopt unless forced (LOG_CALLBACKS).
+    """
+    return force or config.get("runmode") not in QUIET_MODES
+
+
+class RateLimit(logging.Filter):
+    """
+    At most `rate` records per event and `period` seconds (None = no limit),
+    of which only every `sample`-th is kept.
+    """
+
+    def __init__(self, rate: int | None = None, period: float = 60.0, sample: int = 1):
+        super().__init__()
+        self.rate = rate
+        self.period = period
+        self.sample = max(1, sample)
+        self._events: dict[tuple, list] = {}   # event -> [window start, passed, seen, suppressed]
+
+    @staticmethod
+    def event(record: logging.LogRecord) -> tuple:
+        args = record.args if isinstance(record.args, tuple) else ()
+        return record.msg, next((a for a in args if isinstance(a, str) and "/" in a), None)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        now = time.monotonic()
+        state = self._events.setdefault(self.event(record), [now, 0, 0, 0])
+        if now - state[0] >= self.period:
+            state[0], state[1] = now, 0
+        state[2] += 1
+        if (state[2] - 1) % self.sample or (self.rate is not None and state[1] >= self.rate):
+            state[3] += 1
+            return False
+        state[1] += 1
+        if state[3]:
+            record.msg = f"{record.msg} (+{state[3]} suppressed)"
+            state[3] = 0
+        return True
+
+
+class _ToRoot(logging.Handler):
+    """
+    Listener side: hand records to the root logger's handlers of the moment.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger().handle(record)
+
+
+_listener: QueueListener | None = None
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+def _start_listener() -> None:
+    global _listener
+    if _listener is None:
+        _listener = QueueListener(_queue, _ToRoot())
+        _listener.start()
+        atexit.register(_listener.stop)
+
+
+def _pickle_by_value() -> None:
+    # joblib uses the cloudpickle package, older versions a vendored copy
+    for name in ("cloudpickle", "joblib.externals.cloudpickle"):
+        try:
+            module = __import__(name, fromlist=["register_pickle_by_value"])
+        except ImportError:
+            continue
+        module.register_pickle_by_value(sys.modules[__name__])
+
+
+_pickle_by_value()
+
+
+def strategy_logger(name: str, rate: int | None = None, period: float = 60.0,
+                    sample: int = 1, asynchronous: bool = True) -> logging.Logger:
+    """
+    Logger for strategy callbacks, configured once per name.
+    """
+    logger = logging.getLogger(name)
+    if not any(isinstance(f, RateLimit) for f in logger.filters):
+        logger.addFilter(RateLimit(rate, period, sample))
+        if asynchronous:
+            _start_listener()
+            logger.addHandler(QueueHandler(_queue))
+            logger.propagate = False
+    return logger
@@ -0,0 +1,318 @@
+# ================================================================
+# Sekka Metrics – per-callback latency of live strategies
+# ---------------------------------------------------------------
+# How long populate_indicators / custom_stake_amount /
+# adjust_trade_position / custom_exit take per pair, and how long the
+# whole analysis after a candle close takes as the whitelist grows:
+# - SekkaMetrics mixin: class SekkaLong(SekkaMetrics, IStrategy)
+# - Live / dry-run only: the callbacks of the instance are wrapped with
+#   a perf_counter pair + one histogram update (backtest / hyperopt run
+#   the plain methods)
+# - Histograms per callback and pair (fixed ms buckets) + the last
+#   ANALYSIS_HISTORY analyses that computed indicators (pairs, ms)
+# - GET /api/v1/strategy/metrics on the api_server (same login as the
+#   UI), ?format=prometheus for a scraper
+# - user_data/logs/metrics-<Strategy>.json rewritten every
+#   METRICS_INTERVAL seconds
+#
+# Not a strategy - lives here so the strategy files can import it.
+# Hyperopt strategies must not use the mixin (hyperopt workers can not
+# import this module).
+# ================================================================
+
+import bisect
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import UTC, datetime
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in ms, last bucket open
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+ANALYSIS_HISTORY = 48
+CALLBACKS = (
+    "populate_indicators", "populate_entry_trend", "populate_exit_trend",
+    "custom_stake_amount", "adjust_trade_position", "custom_exit", "confirm_trade_entry",
+)
+ANALYZE = "analyze"   # the whole whitelist, one call per bot loop
+
+
+# ------------------ Histogram ------------------
+class Histogram:
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def merge(self, other: "Histogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-quantile (max for the open bucket).
+        """
+        target, seen = q * self.count, 0
+        for bound, n in zip(BUCKETS_MS, self.counts):
+            seen += n
+            if seen >= target:
+                return round(min(bound, self.max), 3)
+        return round(self.max, 3)
+
+    def summary(self) -> dict:
+        count = self.count
+        return {
+            "count": count,
+            "mean_ms": round(self.total / count, 3) if count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "max_ms": round(self.max, 3),
+        }
+
+
+# ------------------ Metrics ------------------
+def pair_getter(fn):
+    """
+    (args, kwargs) -> pair of a strategy callback, from `pair`, `metadata` or `trade`.
+    """
+    names = list(inspect.signature(fn).parameters)
+
+    def arg(name, args, kwargs):
+        if name in kwargs:
+            return kwargs[name]
+        i = names.index(name)
+        return args[i] if i < len(args) else None
+
+    if "pair" in names:
+        return lambda args, kwargs: arg("pair", args, kwargs)
+    if "metadata" in names:
+        return lambda args, kwargs: (arg("metadata", args, kwargs) or {}).get("pair")
+    if "trade" in names:
+        return lambda args, kwargs: getattr(arg("trade", args, kwargs), "pair", None)
+    return lambda args, kwargs: None
+
+
+class CallbackMetrics:
+    def __init__(self, strategy_name: str):
+        self.strategy = strategy_name
+        self.started = datetime.now(UTC)
+        self.histograms: dict[tuple[str, str | None], Histogram] = {}
+        self.analyses: deque = deque(maxlen=ANALYSIS_HISTORY)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._indicator_calls = 0
+
+    def record(self, callback: str, pair: str | None, seconds: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get((callback, pair))
+            if histogram is None:
+                histogram = self.histograms[(callback, pair)] = Histogram()
+            histogram.add(seconds * 1000)
+            if callback == "populate_indicators":
+                self._indicator_calls += 1
+
+    def timed(self, callback: str, fn):
+        pair_of = pair_getter(fn)
+        record = self.record
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(callback, pair_of(args, kwargs), time.perf_counter() - start)
+
+        wrapper.__wrapped__ = fn
+        return wrapper
+
+    def timed_analyze(self, fn):
+        def analyze(pairs):
+            before = self._indicator_calls
+            start = time.perf_counter()
+            try:
+                return fn(pairs)
+            finally:
+                seconds = time.perf_counter() - start
+                self.record(ANALYZE, None, seconds)
+                analyzed = self._indicator_calls - before
+                # Only loops that ran populate_indicators (new candle) - the rest is bookkeeping
+                if analyzed:
+                    self.analyses.append({
+                        "time": datetime.now(UTC).isoformat(timespec="seconds"),
+                        "whitelist": len(pairs),
+                        "analyzed": analyzed,
+                        "ms": round(seconds * 1000, 1),
+                    })
+
+        analyze.__wrapped__ = fn
+        return analyze
+
+    def instrument(self, strategy) -> None:
+        """
+        Replace the callbacks of this strategy instance with timed ones.
+        """
+        for name in CALLBACKS:
+            method = getattr(strategy, name, None)
+            if method is not None:
+                setattr(strategy, name, self.timed(name, method))
+        strategy.analyze = self.timed_analyze(strategy.analyze)
+
+    # ------------------ Export ------------------
+    def snapshot(self) -> dict:
+        with self._lock:
+            items = [(key, h.counts[:], h.total, h.max) for key, h in self.histograms.items()]
+            analyses = list(self.analyses)
+        callbacks: dict[str, dict] = {}
+        totals: dict[str, Histogram] = {}
+        for (callback, pair), counts, total, peak in items:
+            histogram = Histogram()
+            histogram.counts, histogram.total, histogram.max = counts, total, peak
+            totals.setdefault(callback, Histogram()).merge(histogram)
+            if pair is not None:
+                callbacks.setdefault(callback, {}).setdefault("pairs", {})[pair] = histogram.summary()
+        for callback, histogram in totals.items():
+            entry = callbacks.setdefault(callback, {})
+            entry.update(histogram.summary(), buckets=histogram.counts)
+        return {
+            "strategy": self.strategy,
+            "started": self.started.isoformat(timespec="seconds"),
+            "updated": datetime.now(UTC).isoformat(timespec="seconds"),
+            "buckets_ms": list(BUCKETS_MS),
+            "callbacks": callbacks,
+            "analyses": analyses,
+        }
+
+    def prometheus(self) -> str:
+        lines = [
+            "# TYPE sekka_callback_seconds histogram",
+        ]
+        with self._lock:
+            items = sorted(
+                ((key, h.counts[:], h.total) for key, h in self.histograms.items()),
+                key=lambda i: (i[0][0], i[0][1] or ""),
+            )
+            last = self.analyses[-1] if self.analyses else None
+        for (callback, pair), counts, total in items:
+            labels = f'strategy="{self.strategy}",callback="{callback}",pair="{pair or ""}"'
+            seen = 0
+            for bound, n in zip(BUCKETS_MS, counts):
+                seen += n
+                lines.append(f'sekka_callback_seconds_bucket{{{labels},le="{bound / 1000:g}"}} {seen}')
+            lines.append(f'sekka_callback_seconds_bucket{{{labels},le="+Inf"}} {sum(counts)}')
+            lines.append(f"sekka_callback_seconds_sum{{{labels}}} {total / 1000:.6f}")
+            lines.append(f"sekka_callback_seconds_count{{{labels}}} {sum(counts)}")
+        if last:
+            labels = f'strategy="{self.strategy}"'
+            lines += [
+                "# TYPE sekka_analysis_last_seconds gauge",
+                f"sekka_analysis_last_seconds{{{labels}}} {last['ms'] / 1000:.4f}",
+                "# TYPE sekka_analysis_last_pairs gauge",
+                f"sekka_analysis_last_pairs{{{labels}}} {last['analyzed']}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.snapshot(), indent=1))
+        tmp.replace(path)
+
+    def start_writer(self, path: Path, interval: float) -> None:
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.write(path)
+                except OSError as error:
+                    logger.warning(f"Could not write {path}: {error}")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        threading.Thread(target=loop, name="strategy-metrics", daemon=True).start()
+
+    def stop_writer(self) -> None:
+        self._stop.set()
+
+
+def register_endpoint(metrics: CallbackMetrics) -> bool:
+    """
+    GET /api/v1/strategy/metrics on the running api_server. False without api_server.
+    """
+    from fastapi import APIRouter, Depends
+    from fastapi.responses import PlainTextResponse
+    from freqtrade.rpc.api_server.api_auth import http_basic_or_jwt_token
+    from freqtrade.rpc.api_server.webserver import ApiServer
+
+    server = getattr(ApiServer, "_ApiServer__instance", None)
+    app = getattr(server, "app", None)
+    if app is None:
+        return False
+
+    router = APIRouter()
+
+    @router.get("/strategy/metrics", tags=["Strategy"])
+    def strategy_metrics(format: str = "json"):
+        if format == "prometheus":
+            return PlainTextResponse(metrics.prometheus())
+        return metrics.snapshot()
+
+    routes = app.router.routes
+    before = len(routes)
+    app.include_router(router, prefix="/api/v1", dependencies=[Depends(http_basic_or_jwt_token)])
+    # The UI catch-all route is registered last and would answer first
+    added = routes[before:]
+    del routes[before:]
+    routes[0:0] = added
+    return True
+
+
+# ------------------ Mixin ------------------
+class SekkaMetrics:
+    """
+    Strategy mixin - must come before IStrategy in the bases.
+    """
+
+    METRICS_ENABLED = True
+    METRICS_INTERVAL = 60  # seconds between metrics file writes
+
+    def __init__(self, config: dict) -> None:
+        super().__init__(config)
+        self._metrics = None
+        if self.METRICS_ENABLED and config.get("runmode") in ("live", "dry_run"):
+            self._metrics = CallbackMetrics(self.get_strategy_name())
+            self._metrics.instrument(self)
+
+    def ft_bot_start(self, **kwargs) -> None:
+        super().ft_bot_start(**kwargs)
+        if self._metrics is None:
+            return
+        user_data = Path(self.config.get("user_data_dir", "user_data"))
+        path = user_data / "logs" / f"metrics-{self.get_strategy_name()}.json"
+        self._metrics.start_writer(path, self.METRICS_INTERVAL)
+        endpoint = register_endpoint(self._metrics)
+        logger.info(
+            f"Callback metrics: {path}"
+            + (", GET /api/v1/strategy/metrics" if endpoint else " (no api_server)")
+        )
+
+    def ft_bot_cleanup(self) -> None:
+        # Stop / reload_config: the new strategy instance starts its own writer
+        super().ft_bot_cleanup()
+        if self._metrics is not None:
+            self._metrics.stop_writer()
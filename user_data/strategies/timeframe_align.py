@@ -0,0 +1,76 @@
+# ================================================================
+# Timeframe Align – O(1) row lookups between timeframes
+# ---------------------------------------------------------------
+# Strategies on 1h that read a finer EXIT_TIMEFRAME (15m / 5m) inside
+# callbacks should not merge or re-run indicators on every call:
+# - CandleIndex: row of a candle by time, index arithmetic for gap-free
+#   candles, sorted-timestamp search (searchsorted) otherwise
+# - last_closed(): row of the last candle that was closed at a time
+#   (no look-ahead: the candle opened at 10:00 on 5m is usable at 10:05)
+# - index_map(): row map between two timeframes, computed once, then
+#   cross-timeframe reads are plain array reads
+#
+# Not a strategy - lives here so the strategy files can import it.
+# ================================================================
+
+import numpy as np
+import pandas as pd
+
+
+def to_ns(values):
+    """
+    Dates (Series / DatetimeIndex / array / single value) as int64 nanoseconds.
+    """
+    if np.ndim(values) == 0:
+        return np.int64(pd.Timestamp(values).value)
+    return pd.DatetimeIndex(values).as_unit("ns").asi8
+
+
+class CandleIndex:
+    """
+    Row lookups by time for the candles of one dataframe (one timeframe).
+    """
+
+    def __init__(self, dates, timeframe: str):
+        from freqtrade.exchange import timeframe_to_seconds
+
+        self.dates = to_ns(dates)
+        self.step = np.int64(timeframe_to_seconds(timeframe) * 1_000_000_000)
+        self.first = self.dates[0] if len(self.dates) else np.int64(0)
+        # Gap-free candles: the row is plain arithmetic
+        self.contiguous = bool(
+            len(self.dates) and self.dates[-1] - self.first == (len(self.dates) - 1) * self.step
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def row(self, times):
+        """
+        Row of the candle open at `times` (open <= time < close), -1 before the
+        first candle. Rows >= len() mean the candle is not in the data yet.
+        """
+        t = to_ns(times)
+        if self.contiguous:
+            return np.floor_divide(t - self.first, self.step)
+        return self.dates.searchsorted(t, side="right") - 1
+
+    def last_closed(self, times):
+        """
+        Row of the last candle closed at `times`.
+        """
+        return self.row(to_ns(times) - self.step)
+
+    def covers(self, time) -> bool:
+        return 0 <= self.last_closed(time) < len(self)
+
+
+def index_map(source: CandleIndex, target: CandleIndex) -> np.ndarray:
+    """
+    For every source candle: row of the last target candle closed when the
+    source candle closes (-1 = none yet). With 5m source and 1h target, row k
+    of the map is the 1h candle a 5m candle may see; the other way round,
+    the last closed 5m candle of every 1h candle.
+    """
+    rows = target.last_closed(source.dates + source.step)
+    return np.where(rows < len(target), rows, len(target) - 1).astype(np.int64)
@@ -0,0 +1,251 @@
+# ================================================================
+# BacktestPool – many backtests over data loaded once
+# ---------------------------------------------------------------
+# - Candles (and detail / informative data) loaded once in the parent
+# - Indicators computed once per strategy in the parent
+# - Backtests run in forked worker processes, which see all of that
+#   copy-on-write instead of reloading / unpickling it
+# - Each task picks its strategy, parameters, window and pairs
+#
+# Building block for walkforward.py and the other batch tools.
+# Fork only (Linux / the docker image).
+# ================================================================
+
+import logging
+import multiprocessing
+import os
+from datetime import datetime
+from typing import Any, Callable
+
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+# The pool of the running batch - forked workers inherit it
+_POOL: "BacktestPool | None" = None
+
+
+def backtest_config(argv: list[str]) -> dict:
+    """
+    Freqtrade config for `freqtrade backtesting <argv>` (same options, same config files).
+    """
+    from freqtrade.commands import Arguments
+    from freqtrade.commands.optimize_commands import setup_optimize_configuration
+    from freqtrade.enums import RunMode
+
+    args = Arguments(["backtesting", *argv]).get_parsed_arg()
+    return setup_optimize_configuration(args, RunMode.BACKTEST)
+
+
+def set_params(strategy, params: dict | None) -> None:
+    """
+    Apply parameter values - hyperopt parameters or plain class attributes.
+    """
+    from freqtrade.strategy.parameters import BaseParameter
+
+    for name, value in (params or {}).items():
+        current = getattr(strategy, name, None)
+        if isinstance(current, BaseParameter):
+            current.value = value
+        else:
+            setattr(strategy, name, value)
+
+
+def reset_state(strategy) -> None:
+    """
+    Clear the strategy's own bookkeeping (_last_dca_stage, _stoploss_cooldown, ...).
+    The pool reuses one strategy object for all backtests, so DCA stages keyed by
+    trade id or cooldowns from another window would leak into the next run.
+    """
+    for name, value in vars(type(strategy)).items():
+        if name.startswith("__") or name.startswith("_ft") or not name.startswith("_"):
+            continue
+        if value is None or isinstance(value, (dict, list, set)):
+            setattr(strategy, name, None if value is None else type(value)())
+
+
+def _call(task: tuple) -> Any:
+    fn, args = task
+    return fn(_POOL, *args)
+
+
+class BacktestPool:
+    """
+    Loads the data for a backtesting config once and runs backtests on it,
+    in this process (`backtest`) or in forked workers (`map`).
+    """
+
+    def __init__(self, config: dict, processes: int | None = None, skip_idle: bool = False):
+        from freqtrade.optimize.backtesting import Backtesting
+        from freqtrade.util.dry_run_wallet import get_dry_run_wallet
+
+        self.config = config
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.bt = Backtesting(config)
+        if skip_idle:
+            from signal_index import SignalIndex
+
+            SignalIndex.install(self.bt)
+        self.strategies = {s.get_strategy_name(): s for s in self.bt.strategylist}
+        self.max_open_trades = {name: s.max_open_trades for name, s in self.strategies.items()}
+        self.data, self.timerange = self.bt.load_bt_data()
+        self.analyzed: dict[str, dict[str, DataFrame]] = {}
+        self.wallet = get_dry_run_wallet(config)
+        self._bt_wallet = self.wallet
+
+    @property
+    def pairs(self) -> list[str]:
+        return list(self.data)
+
+    # ------------------ Parent ------------------
+    def analyze(self, name: str) -> dict[str, DataFrame]:
+        """
+        Indicators for one strategy, computed once and shared with the workers.
+        Indicators must not depend on the parameters being varied.
+        """
+        if name not in self.analyzed:
+            strategy = self.strategies[name]
+            self.bt._set_strategy(strategy)
+            logger.info(f"Calculating indicators for {name}")
+            self.analyzed[name] = strategy.advise_all_indicators(self.data)
+        return self.analyzed[name]
+
+    def map(self, fn: Callable, tasks: list[tuple]) -> list:
+        """
+        Run fn(pool, *task) for every task in forked workers, results in task order.
+        fn must be a module level function (it is pickled by name).
+        """
+        global _POOL
+
+        for name in self.strategies:
+            self.analyze(name)
+        processes = min(self.processes, len(tasks))
+        if processes <= 1:
+            return [fn(self, *task) for task in tasks]
+
+        _POOL = self
+        try:
+            ctx = multiprocessing.get_context("fork")
+            with ctx.Pool(processes) as pool:
+                return pool.map(_call, [(fn, task) for task in tasks], chunksize=1)
+        finally:
+            _POOL = None
+
+    # ------------------ Backtest ------------------
+    def window(self, name: str, start: datetime | None = None, end: datetime | None = None,
+               pairs: list[str] | None = None) -> dict[str, DataFrame]:
+        """
+        Fresh copies of the analyzed frames for [start, end) plus the startup candles
+        before start (indicators are already warm from the full history).
+        """
+        startup = self.bt.required_startup
+        frames = {}
+        for pair, df in self.analyze(name).items():
+            if pairs is not None and pair not in pairs:
+                continue
+            first = df["date"].searchsorted(start) if start else startup
+            last = df["date"].searchsorted(end) if end else len(df)
+            if last <= first:
+                continue
+            # ft_advise_signals adds the signal columns to the frame it gets
+            frames[pair] = df.iloc[max(0, first - startup):last].copy()
+        return frames
+
+    def backtest(self, name: str, params: dict | None = None,
+                 start: datetime | None = None, end: datetime | None = None,
+                 pairs: list[str] | None = None, wallet: float | None = None,
+                 max_open_trades: int | None = None) -> dict:
+        """
+        One backtest. Returns the backtest content (trades in content["results"])
+        plus min_date / max_date of the simulated range.
+        """
+        from freqtrade.wallets import Wallets
+
+        bt = self.bt
+        strategy = self.strategies[name]
+        wallet = wallet or self.wallet
+        if wallet != self._bt_wallet:
+            bt.wallets = Wallets({**self.config, "dry_run_wallet": wallet}, bt.exchange,
+                                 is_backtest=True)
+            self._bt_wallet = wallet
+        # _set_strategy reloads parameters from the strategy / json - apply ours afterwards
+        bt._set_strategy(strategy)
+        set_params(strategy, params)
+        reset_state(strategy)
+        max_open_trades = self.max_open_trades[name] if max_open_trades is None else max_open_trades
+        if max_open_trades < 0:
+            max_open_trades = float("inf")   # as freqtrade's strategy resolver
+        strategy.max_open_trades = max_open_trades
+        # Stake code reads config["max_open_trades"] (SekkaHour: total balance / max trades) -
+        # the same number there, on the strategy's and Backtesting's config (one dict or two)
+        configs = {id(c): c for c in (strategy.config, bt.config)}.values()
+        saved = [(c, c.get("max_open_trades")) for c in configs]
+        for config, _ in saved:
+            config["max_open_trades"] = max_open_trades
+        try:
+            return self._run(name, bt, start, end, pairs)
+        finally:
+            for config, value in saved:
+                config["max_open_trades"] = value
+
+    def _run(self, name: str, bt, start: datetime | None, end: datetime | None,
+             pairs: list[str] | None) -> dict:
+        from freqtrade.configuration import TimeRange
+        from freqtrade.data import history
+        from freqtrade.data.converter import trim_dataframes
+
+        whitelist = list(self.data) if pairs is None else list(pairs)
+        bt.pairlists._whitelist = whitelist
+        # Startup candles are part of the window already, trimming is by count only
+        bt.timerange = TimeRange(None, None, 0, 0)
+
+        processed = self.window(name, start, end, whitelist)
+        trimmed = trim_dataframes(processed, bt.timerange, bt.required_startup)
+        if not trimmed:
+            return {"results": DataFrame(), "min_date": start, "max_date": end, "pairs": []}
+
+        min_date, max_date = history.get_timerange(trimmed)
+        started = datetime.now()
+        content = bt.backtest(processed=processed, start_date=min_date, end_date=max_date)
+        content.update({
+            "run_id": "",
+            "backtest_start_time": int(started.timestamp()),
+            "backtest_end_time": int(datetime.now().timestamp()),
+            "min_date": min_date,
+            "max_date": max_date,
+            "pairs": sorted(trimmed),
+            # PairLocks are database objects - keep them as json for the parent
+            "locks": [lock.to_json() for lock in content["locks"]],
+        })
+        return content
+
+    def stats(self, name: str, content: dict) -> dict:
+        """
+        Freqtrade's strategy statistics for one backtest content.
+        """
+        from freqtrade.optimize.optimize_reports import generate_strategy_stats
+
+        stats = generate_strategy_stats(
+            content["pairs"], name, {**content, "locks": []}, content["min_date"],
+            content["max_date"], market_change=0, is_hyperopt=True,
+        )
+        stats["locks"] = content["locks"]
+        return stats
+
+    def backtest_stats(self, contents: dict[str, dict]) -> dict:
+        """
+        Freqtrade's full backtest result (as written by `freqtrade backtesting`)
+        for {strategy: content}.
+        """
+        from freqtrade.optimize.optimize_reports import generate_backtest_stats
+
+        min_date = min(c["min_date"] for c in contents.values())
+        max_date = max(c["max_date"] for c in contents.values())
+        results = generate_backtest_stats(
+            self.data, {name: {**c, "locks": []} for name, c in contents.items()},
+            min_date, max_date, notes=self.config.get("backtest_notes"),
+        )
+        for name, content in contents.items():
+            results["strategy"][name]["locks"] = content["locks"]
+        return results
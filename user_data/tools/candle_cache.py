@@ -0,0 +1,205 @@
+# ================================================================
+# Candle Cache – warm start for live / dry-run bots
+# ---------------------------------------------------------------
+# A restarted bot downloads the startup history of every pair and candle
+# type again (SekkaHour: futures + spot informative, 300 startup candles)
+# before the first analysis. With the cache:
+# - After every refresh the closed candles the exchange holds in memory
+#   are written to <dir>/<PAIR>-<timeframe>-<candle type>.feather (a
+#   background thread, once per new candle, written atomically)
+# - On the first refresh after a restart each pair / timeframe / candle
+#   type is seeded from its file:
+#   - last closed candle already stored (restart within the candle):
+#     no request at all
+#   - otherwise one request for the candles since the last stored one,
+#     merged by freqtrade like a normal refresh
+#   - files missing, too short (less history than a normal start) or
+#     too old (gap larger than one request) -> normal startup download
+# - The forming candle is never stored
+#
+# Only live / dry-run. Installed with launcher.py --candle-cache.
+# ================================================================
+
+import atexit
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+GRACE = 5   # candles, as freqtrade's startup candle check
+
+
+# ------------------ Store ------------------
+class CandleCache:
+    """
+    One feather file per (pair, timeframe, candle type), written by a
+    background thread - the bot loop only hands over frames.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.stored: dict[tuple, pd.Timestamp] = {}   # last candle on disk / queued
+        self.tails: dict[tuple, int] = {}             # seeded, first fetch from (ms)
+        self.seen: set[tuple] = set()
+        self._pending: dict[tuple, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        threading.Thread(target=self._run, name="candle-cache", daemon=True).start()
+        atexit.register(self.flush)
+
+    def path(self, key: tuple) -> Path:
+        from freqtrade.enums import CandleType
+        from freqtrade.misc import pair_to_filename
+
+        pair, timeframe, candle_type = key
+        name = f"{pair_to_filename(pair)}-{timeframe}-{CandleType.from_string(candle_type).value}"
+        return self.directory / f"{name}.feather"
+
+    def load(self, key: tuple) -> pd.DataFrame | None:
+        path = self.path(key)
+        if not path.exists():
+            return None
+        try:
+            return pd.read_feather(path)
+        except Exception as e:
+            logger.warning(f"Candle cache: cannot read {path.name} ({e}), downloading")
+            return None
+
+    def save(self, key: tuple, data: pd.DataFrame) -> None:
+        if data.empty or self.stored.get(key) == data["date"].iloc[-1]:
+            return
+        self.stored[key] = data["date"].iloc[-1]
+        with self._lock:
+            self._pending[key] = data.copy()
+        self._wake.set()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for key, data in pending.items():
+            path = self.path(key)
+            tmp = path.with_suffix(".tmp")
+            try:
+                data.reset_index(drop=True).to_feather(tmp)
+                tmp.replace(path)
+            except Exception as e:
+                logger.warning(f"Candle cache: cannot write {path.name}: {e}")
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self.flush()
+
+
+# ------------------ Warm Start ------------------
+def closed_candles(data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    from freqtrade.exchange import timeframe_to_prev_date
+
+    return data[data["date"] < timeframe_to_prev_date(timeframe)]
+
+
+def seed(exchange, cache: CandleCache, pair_list) -> None:
+    """
+    First refresh of a pair / timeframe / candle type: stored candles into the
+    exchange's own candle cache (_klines), so freqtrade only asks for the tail.
+    """
+    from freqtrade.enums import CandleType
+    from freqtrade.exchange import timeframe_to_msecs, timeframe_to_prev_date
+    from freqtrade.util import dt_ts
+
+    warm = current = 0
+    started = time.perf_counter()
+    for pair, timeframe, candle_type in set(pair_list):
+        if candle_type == CandleType.FUNDING_RATE:
+            timeframe = exchange.get_option("funding_fee_timeframe")
+        key = (pair, timeframe, candle_type)
+        if key in cache.seen or key in exchange._klines:
+            continue
+        cache.seen.add(key)
+        data = cache.load(key)
+        if data is None:
+            continue
+        data = closed_candles(data, timeframe)
+        if data.empty:
+            continue
+
+        # Gap must fit one request, stored + missing candles a normal startup download
+        # (required_candle_call_count requests, at most what the exchange keeps)
+        limit = exchange.ohlcv_candle_limit(timeframe, CandleType.from_string(candle_type))
+        kept = exchange.ohlcv_candle_limit(timeframe, exchange._config["candle_type_def"]) \
+            + exchange._startup_candle_count
+        needed = min(limit * exchange.required_candle_call_count, kept)
+        last = dt_ts(data["date"].iloc[-1])
+        forming = dt_ts(timeframe_to_prev_date(timeframe))
+        missing = (forming - last) // timeframe_to_msecs(timeframe) - 1
+        if missing > limit - GRACE or len(data) + missing < needed - GRACE:
+            logger.info(f"Candle cache: {pair} {timeframe} {candle_type} too old / short, downloading")
+            continue
+
+        exchange._klines[key] = data.tail(kept).reset_index(drop=True)
+        exchange._pairs_last_refresh_time[key] = last
+        cache.stored[key] = data["date"].iloc[-1]
+        warm += 1
+        if missing > 0:
+            cache.tails[key] = last
+        else:
+            current += 1
+    if warm:
+        logger.info(f"Candle cache: {warm} pair / timeframes from {cache.directory} "
+                    f"({current} up to date, {warm - current} fetch the tail only) "
+                    f"in {time.perf_counter() - started:.2f}s")
+
+
+# ------------------ Launcher ------------------
+def install(directory: Path | None = None) -> None:
+    """
+    Warm start from / keep writing the candle cache (launcher.py --candle-cache).
+    """
+    from freqtrade.enums import RunMode
+    from freqtrade.exchange import Exchange
+
+    caches: dict[int, CandleCache | None] = {}
+
+    def get_cache(exchange) -> CandleCache | None:
+        if id(exchange) not in caches:
+            config = exchange._config
+            cache = None
+            if config.get("runmode") in (RunMode.LIVE, RunMode.DRY_RUN):
+                path = Path(directory) if directory else \
+                    Path(config["user_data_dir"]) / "data" / "candle_cache" / exchange.id
+                cache = CandleCache(path)
+                logger.info(f"Candle cache in {path}")
+            caches[id(exchange)] = cache
+        return caches[id(exchange)]
+
+    refresh_latest_ohlcv = Exchange.refresh_latest_ohlcv
+    build_coroutine = Exchange._build_coroutine
+
+    def refresh_cached(self, pair_list, *, since_ms=None, cache=True, drop_incomplete=None):
+        store = get_cache(self) if cache and since_ms is None else None
+        if store:
+            seed(self, store, pair_list)
+        results = refresh_latest_ohlcv(self, pair_list, since_ms=since_ms, cache=cache,
+                                       drop_incomplete=drop_incomplete)
+        if store:
+            for key in results:
+                if key in self._klines:
+                    store.save(key, closed_candles(self._klines[key], key[1]))
+        return results
+
+    def build_coroutine_tail(self, pair, timeframe, candle_type, since_ms, cache):
+        store = caches.get(id(self))
+        if store and cache and since_ms is None:
+            # First fetch of a seeded pair: from the last stored candle on
+            since_ms = store.tails.pop((pair, timeframe, candle_type), None)
+        return build_coroutine(self, pair, timeframe, candle_type, since_ms, cache)
+
+    Exchange.refresh_latest_ohlcv = refresh_cached
+    Exchange._build_coroutine = build_coroutine_tail
@@ -0,0 +1,228 @@
+# ================================================================
+# Compact – float32 candles and indicators (opt-in)
+# ---------------------------------------------------------------
+# Every candle file and indicator column is float64, which doubles the
+# memory of multi-year 5m data in each hyperopt worker. Compact mode:
+# - open / high / low / close and float indicator columns as float32
+#   (7 significant digits - far below the tick size of the pairs traded)
+# - volume stays float64: large volumes and their rolling sums (VWAP)
+#   lose whole units in float32
+# - talib's abstract API still computes in float64 (it converts the
+#   inputs), only the stored results are narrowed
+#
+# - convert: writes a float32 copy of a data directory (feather)
+# - report:  float64 vs float32 indicators / entry + exit signals of a
+#            strategy on the same candles, before trusting compact results
+# - install(): launcher.py --compact (candles narrowed on load,
+#   indicators after populate_indicators)
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/compact.py convert --datadir user_data/data/binance
+#   python3 user_data/tools/compact.py report --strategy SekkaLong \
+#     --config user_data/config-long.json --timerange 20230101-20251230
+#   python3 user_data/tools/launcher.py --compact hyperopt --datadir user_data/data/binance-f32 ...
+# ================================================================
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+SIGNAL_COLUMNS = ["enter_long", "enter_short", "exit_long", "exit_short"]
+
+
+# ------------------ Frames ------------------
+def compact_candles(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Price columns as float32, everything else (volume, date) unchanged.
+    """
+    columns = {c: np.float32 for c in PRICE_COLUMNS if c in df.columns and df[c].dtype != np.float32}
+    return df.astype(columns) if columns else df
+
+
+def compact_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    float64 columns other than volume as float32.
+    """
+    columns = {
+        c: np.float32 for c, dtype in df.dtypes.items()
+        if dtype == np.float64 and c != "volume"
+    }
+    return df.astype(columns) if columns else df
+
+
+def frame_bytes(frames: dict) -> int:
+    return sum(int(df.memory_usage(index=True, deep=False).sum()) for df in frames.values())
+
+
+# ------------------ Convert ------------------
+def convert(datadir: Path, output: Path, data_format: str, trading_modes: list[str]) -> None:
+    from freqtrade.data.history.datahandlers import get_datahandler
+    from freqtrade.enums import TradingMode
+
+    source = get_datahandler(datadir, data_format)
+    target = get_datahandler(output, data_format)
+    load = {"fill_missing": False, "warn_no_data": False}
+    before = after = files = 0
+    for mode in trading_modes:
+        for pair, timeframe, candle_type in source.ohlcv_get_available_data(datadir, TradingMode(mode)):
+            df = source.ohlcv_load(pair, timeframe, candle_type, **load)
+            if df.empty:
+                continue
+            target.ohlcv_store(pair, timeframe, compact_candles(df), candle_type)
+            before += source._pair_data_filename(datadir, pair, timeframe, candle_type).stat().st_size
+            after += target._pair_data_filename(output, pair, timeframe, candle_type).stat().st_size
+            files += 1
+    logger.info(
+        f"Converted {files} files to {output}: {before / 2**20:.1f} MB -> {after / 2**20:.1f} MB"
+    )
+
+
+# ------------------ Report ------------------
+def compare(pair: str, full: pd.DataFrame, compact: pd.DataFrame) -> tuple[list, list]:
+    """
+    Indicator differences and signal flips of one pair.
+    """
+    indicators = []
+    for col in full.columns:
+        if col == "volume" or full[col].dtype != np.float64 or col not in compact.columns:
+            continue
+        a = full[col].to_numpy()
+        b = compact[col].to_numpy(dtype=np.float64)
+        both = ~(np.isnan(a) | np.isnan(b))
+        diff = np.abs(a[both] - b[both])
+        rel = diff / np.maximum(np.abs(a[both]), 1e-12)
+        indicators.append([
+            pair, col,
+            f"{diff.max() if len(diff) else 0:.3g}",
+            f"{rel.max() if len(rel) else 0:.3g}",
+            int((np.isnan(a) != np.isnan(b)).sum()),
+        ])
+    signals = []
+    for col in SIGNAL_COLUMNS:
+        if col not in full.columns:
+            continue
+        a = full[col].fillna(0).to_numpy() == 1
+        b = compact[col].fillna(0).to_numpy() == 1
+        signals.append([pair, col, int(a.sum()), int(b.sum()), int((a & ~b).sum()), int((b & ~a).sum())])
+    return indicators, signals
+
+
+def report(config: dict) -> int:
+    """
+    Returns the number of signal flips (0 = compact mode safe for this strategy).
+    """
+    from freqtrade.optimize.backtesting import Backtesting
+    from freqtrade.util import print_rich_table
+
+    bt = Backtesting(config)
+    data, _ = bt.load_bt_data()
+    compact_data = {pair: compact_candles(df) for pair, df in data.items()}
+
+    flips = 0
+    for strategy in bt.strategylist:
+        bt._set_strategy(strategy)
+        start = time.time()
+        full = strategy.advise_all_indicators(data)
+        compact = {
+            pair: compact_indicators(df)
+            for pair, df in strategy.advise_all_indicators(compact_data).items()
+        }
+        logger.info(
+            f"{strategy.get_strategy_name()}: {frame_bytes(full) / 2**20:.1f} MB float64, "
+            f"{frame_bytes(compact) / 2**20:.1f} MB compact ({time.time() - start:.1f}s)"
+        )
+        indicator_rows, signal_rows = [], []
+        for pair in full:
+            metadata = {"pair": pair}
+            i_rows, s_rows = compare(
+                pair,
+                strategy.ft_advise_signals(full[pair], metadata),
+                strategy.ft_advise_signals(compact[pair], metadata),
+            )
+            indicator_rows += i_rows
+            signal_rows += s_rows
+        flips += sum(row[4] + row[5] for row in signal_rows)
+
+        print_rich_table(
+            indicator_rows, ["Pair", "Indicator", "Max abs diff", "Max rel diff", "NaN diff"],
+            summary=f"{strategy.get_strategy_name()} INDICATORS (float64 vs compact)",
+        )
+        print_rich_table(
+            signal_rows, ["Pair", "Signal", "float64", "compact", "Lost", "Added"],
+            summary=f"{strategy.get_strategy_name()} SIGNALS (float64 vs compact)",
+        )
+    return flips
+
+
+# ------------------ Launcher ------------------
+def install() -> None:
+    """
+    Candles narrowed right after loading (the data handlers cast to float64
+    on load), indicators right after populate_indicators.
+    """
+    from freqtrade.data.history.datahandlers.idatahandler import IDataHandler
+    from freqtrade.strategy import IStrategy
+
+    ohlcv_load = IDataHandler.ohlcv_load
+    advise_indicators = IStrategy.advise_indicators
+
+    def ohlcv_load_compact(self, *args, **kwargs):
+        return compact_candles(ohlcv_load(self, *args, **kwargs))
+
+    def advise_indicators_compact(self, dataframe, metadata):
+        return compact_indicators(advise_indicators(self, dataframe, metadata))
+
+    IDataHandler.ohlcv_load = ohlcv_load_compact
+    IStrategy.advise_indicators = advise_indicators_compact
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="float32 candles / indicators.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    conv = sub.add_parser("convert", help="Write a float32 copy of a data directory.")
+    conv.add_argument("--datadir", type=Path, default=TOOLS_DIR.parent / "data" / "binance",
+                      help="Source directory (default: user_data/data/binance).")
+    conv.add_argument("--output", type=Path, default=None,
+                      help="Target directory (default: <datadir>-f32).")
+    conv.add_argument("--data-format", default="feather", help="Data format (default: feather).")
+    conv.add_argument("--trading-mode", nargs="+", default=["spot", "futures"],
+                      choices=["spot", "futures"], help="Candle types (default: both).")
+
+    sub.add_parser(
+        "report", help="Compare float64 and compact indicators / signals of a strategy.",
+        usage="%(prog)s --strategy X --config Y [backtesting options]", add_help=False,
+    )
+    args, freqtrade_args = parser.parse_known_args(argv)
+
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+    if args.command == "convert":
+        if freqtrade_args:
+            parser.error(f"unrecognized arguments: {' '.join(freqtrade_args)}")
+        output = args.output or args.datadir.with_name(f"{args.datadir.name}-f32")
+        convert(args.datadir, output, args.data_format, args.trading_mode)
+        return
+
+    if str(TOOLS_DIR) not in sys.path:
+        sys.path.insert(0, str(TOOLS_DIR))
+    from backtest_pool import backtest_config
+
+    flips = report(backtest_config(freqtrade_args))
+    logger.info(f"{flips} signal flips" + (" - compact mode is safe here" if not flips else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+# ================================================================
+# Coverage – manifest of stored candles, download only what is missing
+# ---------------------------------------------------------------
+# download-data.sh used to run freqtrade download-data twice (spot, then
+# futures) over every pair and the full TIMERANGE, and --erase was the
+# only answer to a suspected hole. Instead:
+# - coverage.json (next to the data) records per candle type / pair /
+#   timeframe: first / last candle, count and the gaps inside; files are
+#   only re-read when their size or mtime changed
+# - Futures also get the mark and funding rate candles backtesting needs
+#   for funding fees, at the exchange's mark / funding fee timeframe (as
+#   freqtrade download-data --trading-mode futures)
+# - Missing intervals = before the first candle + gaps + after the last
+#   candle, clipped to the timerange
+# - Intervals are fetched concurrently: all pairs of a market in one
+#   asyncio batch, spot and futures on their own thread (own exchange)
+# - Ranges the exchange has no candles for (before listing, exchange
+#   outages) are remembered and not requested again
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/coverage.py --pairs BTC/USDT ETH/USDT --timeframes 1h 5m
+#   python3 user_data/tools/coverage.py --pairs BTC/USDT --timeframes 5m --dry-run
+# ================================================================
+
+import argparse
+import asyncio
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+MANIFEST = "coverage.json"
+CONCURRENCY = 8   # intervals in flight per market
+NEW_PAIR_DAYS = 30   # history of a pair without data and without --timerange start
+
+
+# ------------------ Intervals ------------------
+# Intervals are [start, end) in ms of candle open times.
+def gaps(dates_ms: np.ndarray, step_ms: int) -> list[list[int]]:
+    """
+    Missing candles between the first and the last one.
+    """
+    if len(dates_ms) < 2:
+        return []
+    holes = np.flatnonzero(np.diff(dates_ms) > step_ms)
+    return [[int(dates_ms[i] + step_ms), int(dates_ms[i + 1])] for i in holes]
+
+
+def subtract(intervals: list[list[int]], remove: list[list[int]]) -> list[list[int]]:
+    out = []
+    for start, end in intervals:
+        for r_start, r_end in sorted(remove):
+            if r_end <= start or r_start >= end:
+                continue
+            if r_start > start:
+                out.append([start, r_start])
+            start = max(start, r_end)
+            if start >= end:
+                break
+        if start < end:
+            out.append([start, end])
+    return out
+
+
+def merge(intervals: list[list[int]]) -> list[list[int]]:
+    out: list[list[int]] = []
+    for start, end in sorted(intervals):
+        if out and start <= out[-1][1]:
+            out[-1][1] = max(out[-1][1], end)
+        else:
+            out.append([start, end])
+    return out
+
+
+def missing(entry: dict | None, start: int, end: int, step_ms: int) -> list[list[int]]:
+    """
+    Intervals of [start, end) without stored candles, known exchange-side
+    holes excluded, shorter than one candle dropped.
+    """
+    if end - start < step_ms:
+        return []
+    if not entry or not entry["candles"]:
+        wanted = [[start, end]]
+    else:
+        wanted = [[start, entry["first"]], *entry["gaps"], [entry["last"] + step_ms, end]]
+    wanted = [[max(s, start), min(e, end)] for s, e in wanted]
+    wanted = subtract([w for w in wanted if w[1] > w[0]], (entry or {}).get("empty", []))
+    return [w for w in wanted if w[1] - w[0] >= step_ms]
+
+
+# ------------------ Manifest ------------------
+def key(candle_type, pair: str, timeframe: str) -> str:
+    return f"{candle_type}|{pair}|{timeframe}"
+
+
+class Manifest:
+    """
+    coverage.json of one data directory.
+    """
+
+    def __init__(self, datadir: Path, handler):
+        self.datadir = datadir
+        self.handler = handler
+        self.path = datadir / MANIFEST
+        self.entries: dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text()).get("entries", {})
+            except (OSError, ValueError) as error:
+                logger.warning(f"{self.path}: unreadable ({error}), rebuilding")
+
+    def save(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": 1, "entries": self.entries}, indent=1, sort_keys=True))
+        tmp.replace(self.path)
+
+    def scan(self, pair: str, timeframe: str, candle_type) -> dict | None:
+        """
+        Entry of one file, re-read only when the file changed.
+        """
+        from freqtrade.exchange import timeframe_to_msecs
+
+        name = key(candle_type, pair, timeframe)
+        entry = self.entries.get(name)
+        file = self.handler._pair_data_filename(self.datadir, pair, timeframe, candle_type)
+        if not file.exists():
+            if entry:
+                entry.update(first=0, last=0, candles=0, gaps=[], size=0, mtime=0)
+            return entry
+        stat = file.stat()
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            return entry
+
+        df = self.handler.ohlcv_load(
+            pair, timeframe, candle_type, fill_missing=False, warn_no_data=False
+        )
+        from freqtrade.enums import CandleType
+
+        dates = pd.DatetimeIndex(df["date"]).as_unit("ms").asi8 if len(df) else np.array([], np.int64)
+        entry = {
+            "first": int(dates[0]) if len(dates) else 0,
+            "last": int(dates[-1]) if len(dates) else 0,
+            "candles": len(dates),
+            # Funding is paid every few hours, not every funding candle - no gaps
+            "gaps": [] if candle_type == CandleType.FUNDING_RATE
+            else gaps(dates, timeframe_to_msecs(timeframe)),
+            "empty": (entry or {}).get("empty", []),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
+        self.entries[name] = entry
+        return entry
+
+    def mark_empty(self, name: str, intervals: list[list[int]]) -> None:
+        if intervals:
+            entry = self.entries[name]
+            entry["empty"] = merge(entry.get("empty", []) + intervals)
+
+
+# ------------------ Download ------------------
+def make_exchange(exchange: str, mode: str):
+    from freqtrade.configuration import setup_utils_configuration
+    from freqtrade.enums import RunMode
+    from freqtrade.resolvers import ExchangeResolver
+
+    config = setup_utils_configuration(
+        {"config": None, "exchange": exchange, "trading_mode": mode,
+         "user_data_dir": TOOLS_DIR.parent},
+        RunMode.UTIL_EXCHANGE,
+    )
+    if mode == "futures":
+        config.setdefault("margin_mode", "isolated")
+    return ExchangeResolver.load_exchange(config, validate=False)
+
+
+def market_candles(exchange: str, mode: str, timeframes: list[str]) -> list[tuple]:
+    """
+    (timeframe, candle type) of every file a market needs. Futures: + mark
+    and funding rate candles at the exchange's timeframes for them.
+    """
+    from freqtrade import exchange as exchanges
+    from freqtrade.enums import CandleType
+
+    if mode != "futures":
+        return [(timeframe, CandleType.SPOT) for timeframe in timeframes]
+    name = exchanges.MAP_EXCHANGE_CHILDCLASS.get(exchange, exchange).title()
+    ft_has = getattr(exchanges, name, exchanges.Exchange).combine_ft_has(include_futures=True)
+    return [(timeframe, CandleType.FUTURES) for timeframe in timeframes] + [
+        (ft_has["mark_ohlcv_timeframe"], CandleType.from_string(ft_has["mark_ohlcv_price"])),
+        (ft_has["funding_fee_timeframe"], CandleType.FUNDING_RATE),
+    ]
+
+
+async def fetch_all(exchange, jobs: list[tuple]) -> list:
+    """
+    Candles of every (pair, timeframe, candle_type, start, end) job, CONCURRENCY
+    jobs at a time (ccxt throttles the requests themselves).
+    """
+    from freqtrade.data.converter import ohlcv_to_dataframe
+
+    limit = asyncio.Semaphore(CONCURRENCY)
+
+    async def fetch(pair, timeframe, candle_type, start, end):
+        async with limit:
+            _, _, _, data, drop_incomplete = await exchange._async_get_historic_ohlcv(
+                pair, timeframe, start, candle_type, raise_=True, until_ms=end
+            )
+        df = ohlcv_to_dataframe(
+            data, timeframe, pair, fill_missing=False, drop_incomplete=drop_incomplete,
+            candle_type=candle_type,
+        )
+        dates = pd.DatetimeIndex(df["date"]).as_unit("ms").asi8
+        return df[(dates >= start) & (dates < end)]
+
+    return await asyncio.gather(*(fetch(*job) for job in jobs), return_exceptions=True)
+
+
+def store(handler, pair: str, timeframe: str, candle_type, new: list[pd.DataFrame]) -> int:
+    """
+    Merge the fetched candles into the stored file. Returns candles added.
+    """
+    from freqtrade.data.converter import clean_ohlcv_dataframe
+
+    new = [df for df in new if len(df)]
+    if not new:
+        return 0
+    existing = handler.ohlcv_load(pair, timeframe, candle_type, fill_missing=False, warn_no_data=False)
+    data = clean_ohlcv_dataframe(
+        pd.concat([existing, *new], axis=0), timeframe, pair,
+        fill_missing=False, drop_incomplete=False, candle_type=candle_type,
+    )
+    handler.ohlcv_store(pair, timeframe, data, candle_type)
+    return len(data) - len(existing)
+
+
+def download_market(exchange_name: str, mode: str, handler, jobs: list[tuple]) -> dict:
+    """
+    One market (thread): fetch every job, store per file. Returns
+    {file key: (candles added, fetched intervals) | exception}.
+    """
+    exchange = make_exchange(exchange_name, mode)
+    try:
+        results = exchange.loop.run_until_complete(fetch_all(exchange, jobs))
+    finally:
+        exchange.close()
+
+    by_file: dict[tuple, list] = {}
+    for job, result in zip(jobs, results):
+        by_file.setdefault(job[:3], []).append((job[3:], result))
+    done = {}
+    for (pair, timeframe, candle_type), fetched in by_file.items():
+        errors = [r for _, r in fetched if isinstance(r, BaseException)]
+        ok = [(interval, r) for interval, r in fetched if not isinstance(r, BaseException)]
+        added = store(handler, pair, timeframe, candle_type, [r for _, r in ok])
+        done[key(candle_type, pair, timeframe)] = (added, [list(i) for i, _ in ok], errors)
+    return done
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Download only the candles missing from the stored data.",
+    )
+    parser.add_argument("--pairs", nargs="+", required=True,
+                        help="Spot pairs, e.g. BTC/USDT (futures: PAIR:USDT added automatically).")
+    parser.add_argument("--timeframes", nargs="+", required=True, help="Timeframes, e.g. 1h 5m.")
+    parser.add_argument("--timerange", default=None,
+                        help="Wanted range, e.g. 20211231-20260101 (open end: up to now).")
+    parser.add_argument("--trading-mode", nargs="+", default=["spot", "futures"],
+                        choices=["spot", "futures"], help="Markets (default: both).")
+    parser.add_argument("--exchange", default="binance", help="Exchange (default: binance).")
+    parser.add_argument("--datadir", type=Path, default=None,
+                        help="Data directory (default: user_data/data/<exchange>).")
+    parser.add_argument("--data-format", default="feather", help="Data format (default: feather).")
+    parser.add_argument("--dry-run", action="store_true", help="Only report the missing intervals.")
+    parser.add_argument("--recheck", action="store_true",
+                        help="Request ranges remembered as empty on the exchange again.")
+    args = parser.parse_args(argv)
+
+    from freqtrade.configuration import TimeRange
+    from freqtrade.data.history.datahandlers import get_datahandler
+    from freqtrade.enums import CandleType
+    from freqtrade.exchange import timeframe_to_msecs, timeframe_to_prev_date
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+    datadir = args.datadir or TOOLS_DIR.parent / "data" / args.exchange
+    datadir.mkdir(parents=True, exist_ok=True)
+    handler = get_datahandler(datadir, args.data_format)
+    manifest = Manifest(datadir, handler)
+    timerange = TimeRange.parse_timerange(args.timerange) if args.timerange else TimeRange()
+    started = time.time()
+
+    # Missing intervals per market
+    jobs: dict[str, list[tuple]] = {}
+    for mode in args.trading_mode:
+        candles = market_candles(args.exchange, mode, args.timeframes)
+        for spot_pair in args.pairs:
+            pair = f"{spot_pair}:{spot_pair.split('/')[1]}" if mode == "futures" else spot_pair
+            for timeframe, candle_type in candles:
+                step = timeframe_to_msecs(timeframe)
+                # Only closed candles
+                now = int(timeframe_to_prev_date(timeframe).timestamp() * 1000)
+                start = timerange.startts * 1000 if timerange.starttype else 0
+                end = min(timerange.stopts * 1000, now) if timerange.stoptype else now
+                entry = manifest.scan(pair, timeframe, candle_type)
+                if not start and not (entry and entry["candles"]):
+                    start = now - NEW_PAIR_DAYS * 86_400_000
+                if entry and args.recheck:
+                    entry["empty"] = []
+                for s, e in missing(entry, start, end, step):
+                    jobs.setdefault(mode, []).append((pair, timeframe, candle_type, s, e))
+                    logger.info(
+                        f"{pair} {timeframe} {candle_type}: missing {pd.to_datetime(s, unit='ms')} "
+                        f"- {pd.to_datetime(e, unit='ms')} ({(e - s) // step} candles)"
+                    )
+    manifest.save()
+
+    total = sum(len(j) for j in jobs.values())
+    if not total or args.dry_run:
+        logger.info(f"{total} missing intervals" + (" (dry run)" if args.dry_run else ", nothing to download"))
+        return
+
+    # Download, one thread per market
+    results: dict[str, dict] = {}
+
+    def run(mode: str) -> None:
+        try:
+            results[mode] = download_market(args.exchange, mode, handler, jobs[mode])
+        except Exception as error:
+            logger.error(f"{mode}: download failed: {error}")
+            results[mode] = {}
+
+    threads = [threading.Thread(target=run, args=(mode,), name=f"download-{mode}") for mode in jobs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Re-scan and remember what the exchange does not have
+    added_total = failed = 0
+    for done in results.values():
+        for name, (added, fetched, errors) in done.items():
+            candle_type, pair, timeframe = name.split("|")
+            candle_type = CandleType.from_string(candle_type)
+            entry = manifest.scan(pair, timeframe, candle_type)
+            step = timeframe_to_msecs(timeframe)
+            if not (entry and entry["candles"]):
+                # Nothing at all on the exchange in the wanted range
+                if entry is None:
+                    manifest.entries[name] = {
+                        "first": 0, "last": 0, "candles": 0, "gaps": [], "empty": [], "size": 0, "mtime": 0,
+                    }
+                manifest.mark_empty(name, fetched)
+            else:
+                # Still missing inside a fetched interval, before the newest candle
+                still = missing(entry, 0, entry["last"], step)
+                manifest.mark_empty(name, [
+                    [max(s, f_start), min(e, f_end)]
+                    for f_start, f_end in fetched for s, e in still
+                    if s < f_end and e > f_start
+                ])
+            for error in errors:
+                logger.warning(f"{pair} {timeframe} {candle_type}: {error!r}")
+            added_total += added
+            failed += len(errors)
+            logger.info(f"{pair} {timeframe} {candle_type}: {added:+d} candles")
+    manifest.save()
+    logger.info(
+        f"Downloaded {total - failed}/{total} intervals, {added_total} candles, "
+        f"in {time.time() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+# ================================================================
+# CrossPair – RSI / VWAP for the whole whitelist in one pass
+# ---------------------------------------------------------------
+# populate_indicators runs once per pair, so every RSI / VWAP is a small
+# pandas / talib pipeline of its own. Here all candles of the whitelist
+# (and informative pairs, e.g. spot for SekkaHour) are stacked into
+# (pairs x time) arrays aligned on the candle date:
+# - First ta.RSI / compute_vwap call for a period computes it for every
+#   stacked pair at once. Only the VWAP rolling sums are truly cross-pair
+#   (one pandas call over all pairs); RSI is still one talib call per
+#   pair, straight on the float64 row - what is saved is the DataFrame
+#   wrapping of ta.RSI
+# - vwap_gap is not stacked: the strategies compute it inline in
+#   populate_indicators, from the stacked vwap column
+# - The calling pair gets its row back as a view, same values as talib /
+#   compute_vwap
+# - Candles not in the stack (merged frames, NaNs, gaps) use the normal
+#   function
+#
+# Live / dry-run: stacked in analyze, before the per-pair loop. This is
+#   where it pays off - a few hundred candles per pair, so the per-call
+#   pandas overhead is most of the cost (50 pairs: about half the time)
+# Backtesting / hyperopt: stacked in advise_all_indicators (long frames,
+#   about as fast as per pair - mainly to check the results are the same)
+# Installed with launcher.py --cross-pair.
+# ================================================================
+
+import inspect
+import logging
+import textwrap
+import threading
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# compute_vwap / hlc3 as written in the Sekka strategies - only those are served
+VWAP_SOURCE = '''
+def hlc3(self, df: DataFrame) -> pd.Series:
+    return (df["high"] + df["low"] + df["close"]) / 3.0
+def compute_vwap(self, df: DataFrame, window: int) -> pd.Series:
+    hlc3 = self.hlc3(df)
+    pv = hlc3 * df["volume"]
+    pv_sum = pv.rolling(window, min_periods=1).sum()
+    vol_sum = df["volume"].rolling(window, min_periods=1).sum()
+    vwap = (pv_sum / vol_sum.replace(0, np.nan)).ffill().fillna(df["close"])
+    return vwap
+'''
+
+
+def _normalized(source: str) -> str:
+    return "\n".join(line.strip() for line in source.splitlines() if line.strip())
+
+
+def same_vwap(strategy) -> bool:
+    try:
+        source = "".join(
+            textwrap.dedent(inspect.getsource(getattr(type(strategy), name)))
+            for name in ("hlc3", "compute_vwap")
+        )
+    except (AttributeError, OSError, TypeError):
+        return False
+    return _normalized(source) == _normalized(VWAP_SOURCE)
+
+
+# ------------------ Kernels ------------------
+def left_align(values: np.ndarray, start: np.ndarray, length: np.ndarray) -> np.ndarray:
+    """
+    Rows moved so every pair starts in column 0 (NaN behind its last candle).
+    """
+    out = np.full((len(start), length.max()), np.nan)
+    for row, (s, n) in enumerate(zip(start, length)):
+        out[row, :n] = values[row, s:s + n]
+    return out
+
+
+def back_to_grid(aligned: np.ndarray, start: np.ndarray, length: np.ndarray,
+                 width: int) -> np.ndarray:
+    out = np.full((len(start), width), np.nan)
+    for row, (s, n) in enumerate(zip(start, length)):
+        out[row, s:s + n] = aligned[row, :n]
+    return out
+
+
+def rsi(close: np.ndarray, length: np.ndarray, period: int) -> np.ndarray:
+    """
+    talib RSI of left-aligned rows. The Wilder smoothing is a recursion over
+    time, talib's C loop on a plain float64 row beats any 2D formulation -
+    what is saved is the DataFrame wrapping of ta.RSI on every call.
+    """
+    import talib
+
+    out = np.full_like(close, np.nan)
+    for row, n in enumerate(length):
+        out[row, :n] = talib.RSI(close[row, :n], timeperiod=period)
+    return out
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sum of left-aligned rows with min_periods=1 - pandas sums all
+    columns in one call, with the same rounding as the per-pair rolling().
+    """
+    return pd.DataFrame(values.T).rolling(window, min_periods=1).sum().to_numpy().T
+
+
+def ffill(values: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(values)
+    idx = np.where(valid, np.arange(values.shape[1]), 0)
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    return np.take_along_axis(values, idx, axis=1)
+
+
+def vwap(high, low, close, volume, window: int) -> np.ndarray:
+    """
+    Rolling VWAP of left-aligned rows, same as compute_vwap.
+    """
+    volume = np.nan_to_num(volume)
+    pv_sum = rolling_sum((high + low + close) / 3.0 * volume, window)
+    vol_sum = rolling_sum(volume, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = np.where(vol_sum != 0, pv_sum / vol_sum, np.nan)
+    out = ffill(out)
+    return np.where(np.isnan(out), close, out)
+
+
+# ------------------ Stack ------------------
+
+CANDLE_COLUMNS = ("close", "high", "low", "volume")
+
+
+def candles(df: pd.DataFrame) -> dict[str, np.ndarray] | None:
+    """
+    Date (ns) and price / volume arrays of contiguous candles without NaN
+    prices - only then does the stacked row equal the per-pair result.
+    """
+    if len(df) < 2 or "date" not in df.columns or not set(CANDLE_COLUMNS) <= set(df.columns):
+        return None
+    arrays = {col: df[col].to_numpy(dtype=np.float64) for col in CANDLE_COLUMNS}
+    if np.isnan(arrays["close"] + arrays["high"] + arrays["low"]).any():
+        return None
+    dates = df["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    steps = np.diff(dates)
+    if steps[0] <= 0 or (steps != steps[0]).any():
+        return None
+    arrays["date"] = dates
+    return arrays
+
+
+class PairStack:
+    """
+    Candles of several frames (one timeframe) on one date grid.
+    """
+
+    def __init__(self, frames: list[dict[str, np.ndarray]], step: int):
+        first = np.array([f["date"][0] for f in frames])
+        self.length = np.array([len(f["date"]) for f in frames])
+        # Contiguous candles on a common boundary -> plain range as grid
+        self.start = (first - first.min()) // step
+        self.grid = first.min() + np.arange((self.start + self.length).max()) * step
+        self.columns: dict[str, np.ndarray] = {}
+        for col in CANDLE_COLUMNS:
+            stacked = np.full((len(frames), len(self.grid)), np.nan)
+            for row, f in enumerate(frames):
+                stacked[row, self.start[row]:self.start[row] + self.length[row]] = f[col]
+            self.columns[col] = stacked
+        self.results: dict[tuple, np.ndarray] = {}
+
+    def matches(self, row: int, df: pd.DataFrame) -> bool:
+        start, length = self.start[row], self.length[row]
+        return length == len(df) and all(
+            np.array_equal(self.columns[col][row, start:start + length], df[col].to_numpy(),
+                           equal_nan=True)
+            for col in CANDLE_COLUMNS
+        )
+
+    def aligned(self, col: str) -> np.ndarray:
+        return left_align(self.columns[col], self.start, self.length)
+
+    def compute(self, key: tuple) -> np.ndarray:
+        if key not in self.results:
+            name, period = key
+            if name == "rsi":
+                result = rsi(self.aligned("close"), self.length, period)
+            else:
+                result = vwap(*(self.aligned(c) for c in ("high", "low", "close", "volume")), period)
+            self.results[key] = back_to_grid(result, self.start, self.length, len(self.grid))
+        return self.results[key]
+
+    def row(self, key: tuple, row: int) -> np.ndarray:
+        start = self.start[row]
+        return self.compute(key)[row, start:start + self.length[row]]
+
+
+# ------------------ Engine ------------------
+class CrossPairIndicators:
+    def __init__(self):
+        self.frames: list[pd.DataFrame] = []
+        self.stacks: dict[tuple, PairStack] = {}
+        self.rows: dict[tuple, list[tuple[tuple, int]]] = {}   # (first, length) -> [(grid, row)]
+        self.stacked = 0
+        self.served = 0
+        self._last = None      # (frame, grid, row) - RSI and VWAP come from the same frame
+        self._lock = threading.Lock()   # pairs may be analyzed on threads (parallel_analysis.py)
+        self._rsi = None
+
+    def register(self, frames: list[pd.DataFrame]) -> None:
+        """
+        Candles the next per-pair calls will be served from (stacked lazily).
+        """
+        self.frames = frames
+        self.stacks = {}
+        self.rows = {}
+        self.served = 0
+        self._last = None
+
+    def _build(self) -> None:
+        groups: dict[tuple, list[dict]] = {}
+        for df in self.frames:
+            arrays = candles(df)
+            if arrays is None:
+                continue
+            first, second = int(arrays["date"][0]), int(arrays["date"][1])
+            # Same candle length and candle boundaries -> rows are contiguous on one grid
+            grid = (second - first, first % (second - first))
+            self.rows.setdefault((first, len(df)), []).append(
+                (grid, len(groups.setdefault(grid, [])))
+            )
+            groups[grid].append(arrays)
+        self.stacks = {grid: PairStack(frames, grid[0]) for grid, frames in groups.items()}
+        self.stacked = sum(len(frames) for frames in groups.values())
+        self.frames = []
+
+    def find(self, df: pd.DataFrame) -> tuple | None:
+        last = self._last
+        if last is not None and last[0] is df:
+            return last[1:]
+        if len(df) < 2 or "date" not in df.columns or not set(CANDLE_COLUMNS) <= set(df.columns):
+            return None
+        # Candidates by first date and length, then the candles are compared
+        first = pd.Timestamp(df["date"].iloc[0]).value
+        for grid, row in self.rows.get((first, len(df)), []):
+            if self.stacks[grid].matches(row, df):
+                self._last = (df, grid, row)
+                return grid, row
+        return None
+
+    def lookup(self, df, key: tuple) -> pd.Series | None:
+        if not isinstance(df, pd.DataFrame):
+            return None
+        with self._lock:
+            if self.frames:
+                self._build()
+            found = self.find(df)
+            if found is None:
+                return None
+            grid, row = found
+            self.served += 1
+            values = self.stacks[grid].row(key, row)
+        return pd.Series(values, index=df.index, copy=False)
+
+    # ------------------ Install ------------------
+    def wrap_rsi(self, fn):
+        engine = self
+
+        @wraps(fn)
+        def cross_pair_rsi(df, *args, **kwargs):
+            period = kwargs.get("timeperiod", args[0] if args else 14)
+            if len(args) <= 1 and set(kwargs) <= {"timeperiod"} and isinstance(period, int):
+                value = engine.lookup(df, ("rsi", period))
+                if value is not None:
+                    return value
+            return fn(df, *args, **kwargs)
+
+        return cross_pair_rsi
+
+    def wrap_vwap(self, fn):
+        engine = self
+
+        @wraps(fn)
+        def cross_pair_vwap(df, window):
+            value = engine.lookup(df, ("vwap", int(window)))
+            return value if value is not None else fn(df, window)
+
+        return cross_pair_vwap
+
+    def install_talib(self) -> None:
+        import talib.abstract as ta
+
+        if self._rsi is None:
+            self._rsi = ta.RSI
+            ta.RSI = self.wrap_rsi(self._rsi)
+
+    def uninstall_talib(self) -> None:
+        import talib.abstract as ta
+
+        if self._rsi is not None:
+            ta.RSI = self._rsi
+            self._rsi = None
+
+    def install_strategy(self, strategy) -> None:
+        if "compute_vwap" in vars(strategy):
+            return
+        if same_vwap(strategy):
+            strategy.compute_vwap = self.wrap_vwap(strategy.compute_vwap)
+        else:
+            logger.info(f"{type(strategy).__name__}: own compute_vwap, only RSI is stacked")
+
+
+def informative_frames(strategy, known: set[tuple]) -> list[pd.DataFrame]:
+    """
+    Informative candles (e.g. spot pairs of SekkaHour) not in the main data.
+    """
+    try:
+        informative = strategy.gather_informative_pairs()
+    except Exception as e:
+        logger.warning(f"Cross-pair indicators: no informative pairs ({e})")
+        return []
+    frames = []
+    for pair, timeframe, *candle_type in informative:
+        key = (pair, timeframe, candle_type[0] if candle_type else "")
+        if key in known:
+            continue
+        try:
+            df = strategy.dp.get_pair_dataframe(pair, timeframe, *candle_type)
+        except Exception:
+            continue
+        if len(df):
+            frames.append(df)
+    return frames
+
+
+def install(engine: CrossPairIndicators | None = None) -> CrossPairIndicators:
+    """
+    Stack the candles of all pairs before freqtrade calls populate_indicators
+    per pair.
+    """
+    from freqtrade.strategy import IStrategy
+
+    engine = engine or CrossPairIndicators()
+    engine.install_talib()
+    advise_all_indicators = IStrategy.advise_all_indicators
+    analyze = IStrategy.analyze
+
+    def advise_all_stacked(self, data: dict) -> dict:
+        engine.install_strategy(self)
+        candle_type = self.config.get("candle_type_def", "")
+        known = {(pair, self.timeframe, candle_type) for pair in data}
+        engine.register(list(data.values()) + informative_frames(self, known))
+        result = advise_all_indicators(self, data)
+        logger.info(f"Cross-pair indicators: {engine.stacked} pairs stacked, "
+                    f"{engine.served} calls served")
+        return result
+
+    def analyze_stacked(self, pairs: list[str]) -> None:
+        engine.install_strategy(self)
+        candle_type = self.config.get("candle_type_def", "")
+        frames = [self.dp.ohlcv(pair, self.timeframe, copy=False, candle_type=candle_type)
+                  for pair in pairs]
+        known = {(pair, self.timeframe, candle_type) for pair in pairs}
+        engine.register([f for f in frames if len(f)] + informative_frames(self, known))
+        analyze(self, pairs)
+
+    IStrategy.advise_all_indicators = advise_all_stacked
+    IStrategy.analyze = analyze_stacked
+    return engine
@@ -0,0 +1,292 @@
+# ================================================================
+# Distributed Hyperopt – coordinator / worker over the local network
+# ---------------------------------------------------------------
+# Coordinator: a normal `freqtrade hyperopt` run (optuna, .fthypt
+#   output, best-result export all unchanged) whose epoch batches are
+#   handed out to remote workers instead of the local process pool.
+# Worker: gets the coordinator's hyperopt command line, loads its own
+#   local data once, then evaluates parameter sets on its own cores.
+# Results go into one SQLite store keyed by run + parameters, so a
+#   parameter set is never evaluated twice (also across restarts).
+#
+# Usage (inside the container, from /freqtrade):
+#   export FREQ_DIST_KEY=some-secret      # same on all machines
+#   python3 user_data/tools/launcher.py --coordinator 0.0.0.0:7777 hyperopt -j 16 ...
+#   python3 user_data/tools/launcher.py --worker 10.148.0.2:7777 --processes 4
+# ================================================================
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import queue
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+AUTHKEY_ENV = "FREQ_DIST_KEY"
+# Config entries that change backtest results - part of the run fingerprint
+RUN_KEYS = (
+    "strategy", "timerange", "spaces", "hyperopt_loss", "timeframe", "timeframe_detail",
+    "dry_run_wallet", "stake_amount", "max_open_trades", "trading_mode", "margin_mode",
+    "hyperopt_min_trades", "fee",
+)
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "0.0.0.0", int(port)
+
+
+def get_authkey() -> bytes:
+    key = os.environ.get(AUTHKEY_ENV)
+    if not key:
+        # Messages are pickles - never listen / connect without a shared secret
+        raise SystemExit(f"Set {AUTHKEY_ENV} to the same secret on coordinator and workers.")
+    return key.encode()
+
+
+def run_fingerprint(hyperopter) -> str:
+    """
+    Identifies "the same hyperopt": relevant config plus the strategy source,
+    so cached results are dropped as soon as the strategy file changes.
+    """
+    config = hyperopter.config
+    run = {key: config.get(key) for key in RUN_KEYS}
+    run["pairs"] = sorted(hyperopter.pairlist)
+    strategy_file = getattr(hyperopter.backtesting.strategy, "__file__", None)
+    if strategy_file:
+        run["source"] = hashlib.sha1(Path(strategy_file).read_bytes()).hexdigest()
+    return hashlib.sha1(json.dumps(run, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def params_key(run: str, params: dict) -> str:
+    return hashlib.sha1(
+        (run + json.dumps(params, sort_keys=True, default=str)).encode()
+    ).hexdigest()
+
+
+# ------------------ Result Store ------------------
+class ResultStore:
+    """
+    SQLite store of evaluated parameter sets. First result for a key wins.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key        TEXT PRIMARY KEY,
+                run        TEXT NOT NULL,
+                params     TEXT NOT NULL,
+                loss       REAL,
+                result     BLOB NOT NULL,
+                worker     TEXT,
+                created_at TEXT NOT NULL
+            )
+        """)
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self.lock:
+            row = self.conn.execute("SELECT result FROM results WHERE key=?", (key,)).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def put(self, key: str, run: str, result: dict, worker: str) -> None:
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO results VALUES (?,?,?,?,?,?,?)",
+                (key, run, json.dumps(result["params_dict"], default=str), result["loss"],
+                 pickle.dumps(result), worker, datetime.now().isoformat(timespec="seconds")),
+            )
+
+
+# ------------------ Coordinator ------------------
+class Coordinator:
+    """
+    Accepts workers and hands out tasks. Each worker pulls up to its capacity
+    from one shared queue, so fast machines simply get more work. Tasks of a
+    worker that disconnects (spot VM preempted) go back into the queue.
+    """
+
+    def __init__(self, address: str, argv: list[str], store_path: Path | None = None):
+        self.argv = argv
+        self.store_path = store_path
+        self.store: ResultStore | None = None
+        self.run: str | None = None
+        self.tasks: queue.Queue = queue.Queue()
+        self.results: dict[str, dict] = {}
+        self.done = threading.Condition()
+        self.workers: dict[str, int] = {}
+        self.closed = False
+
+        self.listener = Listener(parse_address(address), authkey=get_authkey())
+        threading.Thread(target=self._accept, name="coordinator", daemon=True).start()
+        logger.info(f"Coordinator listening on {address}")
+
+    def _accept(self) -> None:
+        while not self.closed:
+            try:
+                conn = self.listener.accept()
+            except (OSError, EOFError) as e:
+                # Wrong authkey / port scanners - keep listening
+                if not self.closed:
+                    logger.warning(f"Rejected connection: {e}")
+                continue
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn) -> None:
+        name = "?"
+        batch: list = []
+        try:
+            _, hello = conn.recv()
+            name, capacity = hello["name"], hello["capacity"]
+            conn.send(("config", self.argv))
+            _, ready = conn.recv()
+            while self.run is None and not self.closed:
+                time.sleep(1)
+            if ready["run"] != self.run:
+                logger.warning(f"Worker {name} rejected: different strategy / config "
+                               "(update the code on that machine)")
+                conn.send(("stop", None))
+                return
+
+            self.workers[name] = capacity
+            logger.info(f"Worker {name} joined with {capacity} processes "
+                        f"({sum(self.workers.values())} total)")
+
+            while not self.closed:
+                batch = self._take(capacity)
+                if not batch:
+                    continue
+                conn.send(("work", batch))
+                _, results = conn.recv()
+                for task_id, result in results:
+                    self.store.put(task_id, self.run, result, name)
+                with self.done:
+                    self.results.update(results)
+                    self.done.notify_all()
+                batch = []
+            conn.send(("stop", None))
+        except (EOFError, OSError) as e:
+            logger.warning(f"Worker {name} lost ({e}), re-queueing {len(batch)} tasks")
+            for task in batch:
+                self.tasks.put(task)
+        finally:
+            self.workers.pop(name, None)
+            conn.close()
+
+    def _take(self, n: int) -> list:
+        try:
+            batch = [self.tasks.get(timeout=1)]
+        except queue.Empty:
+            return []
+        while len(batch) < n:
+            try:
+                batch.append(self.tasks.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def start(self, hyperopter) -> None:
+        self.run = run_fingerprint(hyperopter)
+        path = self.store_path or (
+            hyperopter.config["user_data_dir"] / "hyperopt_results" / "distributed.sqlite"
+        )
+        self.store = ResultStore(Path(path))
+
+    def run_batch(self, hyperopter, asked: list[dict]) -> list[dict]:
+        if self.run is None:
+            self.start(hyperopter)
+
+        keys = [params_key(self.run, params) for params in asked]
+        pending = 0
+        # Identical parameter sets in one batch are evaluated once
+        for key, params in dict(zip(keys, asked)).items():
+            cached = self.store.get(key)
+            if cached is not None:
+                self.results[key] = cached
+            elif key not in self.results:
+                self.tasks.put((key, params))
+                pending += 1
+        if pending and not self.workers:
+            logger.info("Waiting for workers to connect...")
+
+        with self.done:
+            self.done.wait_for(lambda: all(k in self.results for k in keys))
+        # Own copy per epoch - hyperopt numbers every result (current_epoch)
+        results = [dict(self.results[k]) for k in keys]
+        for key in set(keys):
+            del self.results[key]
+        return results
+
+    def close(self) -> None:
+        self.closed = True
+        self.listener.close()
+
+
+# ------------------ Worker ------------------
+def evaluate_loop(conn, hyperopter, processes: int) -> None:
+    from joblib import Parallel
+
+    with Parallel(n_jobs=processes) as parallel:
+        while True:
+            kind, batch = conn.recv()
+            if kind == "stop":
+                return
+            results = parallel(hyperopter.generate_optimizer_wrapped(p) for _, p in batch)
+            hyperopter.handle_mp_logging()
+            conn.send(("results", [(task_id, r) for (task_id, _), r in zip(batch, results)]))
+
+
+def run_worker(address: str, processes: int, retry: float = 10.0) -> None:
+    """
+    Connect to a coordinator (retrying until it is up), prepare data for its
+    hyperopt command and evaluate parameter sets until told to stop.
+    """
+    from freqtrade.commands import Arguments
+    from freqtrade.commands.optimize_commands import setup_optimize_configuration
+    from freqtrade.enums import RunMode
+    from freqtrade.loggers import setup_logging_pre
+    from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
+    from freqtrade.system import asyncio_setup
+
+    setup_logging_pre()
+    asyncio_setup()
+    authkey = get_authkey()
+    name = f"{socket.gethostname()}-{os.getpid()}"
+
+    while True:
+        try:
+            conn = Client(parse_address(address), authkey=authkey)
+            break
+        except (ConnectionRefusedError, OSError):
+            logger.info(f"Coordinator {address} not reachable, retrying in {retry:.0f}s")
+            time.sleep(retry)
+
+    conn.send(("hello", {"name": name, "capacity": processes}))
+    _, argv = conn.recv()
+    logger.info(f"Connected to {address}: freqtrade {' '.join(argv)}")
+
+    config = setup_optimize_configuration(Arguments(argv).get_parsed_arg(), RunMode.HYPEROPT)
+    # Own data file, coordinator / other workers may share this user_data
+    data_file = config["user_data_dir"] / "hyperopt_results" / f"worker-{name}.pkl"
+    hyperopter = HyperOptimizer(config, data_file)
+    try:
+        hyperopter.prepare_hyperopt()
+        conn.send(("ready", {"run": run_fingerprint(hyperopter)}))
+        evaluate_loop(conn, hyperopter, processes)
+    except EOFError:
+        logger.info("Coordinator finished")
+    finally:
+        conn.close()
+        data_file.unlink(missing_ok=True)
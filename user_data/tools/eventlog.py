@@ -0,0 +1,401 @@
+# ================================================================
+# Event Log – backtest fills as a columnar (parquet) table
+# ---------------------------------------------------------------
+# DCA depth, fill prices per stage, time to TAKE_PROFIT and how often
+# STOP_LOSS_AFTER_DCA fires are all in the orders of the backtest result,
+# nested three levels deep in a zipped JSON. The event log flattens them:
+# - one row per filled order: entry (stage 0), dca (stage 1..n), exit
+#   (stage = last DCA stage filled before it)
+# - stake, rate, amount, minutes since the trade opened, rate relative to
+#   the first entry, the order tag, plus the trade's depth / exit reason /
+#   profit on every row (filter fills by trade outcome without a join)
+# - trade_index = position of the trade in its strategy's trade list
+#   (backtest results carry no trade id; same row as load_backtest_data)
+# - <result>.events.parquet next to the backtest zip, zstd compressed,
+#   strings dictionary-encoded - millions of fills are a few MB and load
+#   as categoricals; load_events() reads only the columns asked for and
+#   pushes filters down to the row groups
+#
+# Written by `launcher.py --event-log backtesting ...` (with --export
+# trades, the default), or afterwards from a stored result with `build`.
+# The Sekka strategies keep the DCA stage in trade.enter_tag only, the
+# orders carry no tag of their own - stage comes from the fill order.
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/launcher.py --event-log backtesting --strategy SekkaLong ...
+#   python3 user_data/tools/eventlog.py build --backtest-filename user_data/backtest_results
+#   python3 user_data/tools/eventlog.py query --pair BTC/USDT --min-stage 3
+#   python3 user_data/tools/eventlog.py query --events user_data/backtest_results \
+#     --strategy OptLong --exit-reason STOP_LOSS_AFTER_DCA --export sl.csv
+# ================================================================
+
+import argparse
+import logging
+from pathlib import Path
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = TOOLS_DIR.parent / "backtest_results"
+SUFFIX = ".events.parquet"
+ROW_GROUP = 256_000
+EVENTS = ("entry", "dca", "exit")
+DCA_STOP = "STOP_LOSS_AFTER_DCA"
+TAKE_PROFIT = "TAKE_PROFIT"
+
+
+# ------------------ Schema ------------------
+def schema():
+    import pyarrow as pa
+
+    text = pa.dictionary(pa.int32(), pa.string())
+    date = pa.timestamp("ms", tz="UTC")
+    return pa.schema([
+        ("run", text),
+        ("strategy", text),
+        ("trade_index", pa.int32()),
+        ("pair", text),
+        ("open_date", date),
+        ("event", text),
+        ("stage", pa.int8()),
+        ("tag", text),
+        ("date", date),
+        ("rate", pa.float64()),
+        ("amount", pa.float64()),
+        ("stake", pa.float64()),
+        ("from_first_pct", pa.float32()),
+        ("minutes", pa.int32()),
+        ("entries", pa.int8()),
+        ("exit_reason", text),
+        ("profit_ratio", pa.float64()),
+    ])
+
+
+def order_type():
+    import pyarrow as pa
+
+    return pa.list_(pa.struct([
+        ("amount", pa.float64()),
+        ("safe_price", pa.float64()),
+        ("ft_is_entry", pa.bool_()),
+        ("ft_order_tag", pa.string()),
+        ("order_filled_timestamp", pa.int64()),
+        ("cost", pa.float64()),
+    ]))
+
+
+# ------------------ Build ------------------
+def fill_events(trades: list[dict], strategy: str, run: str):
+    """
+    One row per order of the trades of one strategy (backtest result format).
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not trades:
+        return schema().empty_table()
+
+    orders = pa.array([t.get("orders") or [] for t in trades], type=order_type())
+    offsets = orders.offsets.to_numpy()
+    parent = pc.list_parent_indices(orders).to_numpy()
+    flat = pc.list_flatten(orders)
+
+    # Entries filled so far within each trade -> stage of every order
+    is_entry = flat.field("ft_is_entry").fill_null(False).to_numpy(zero_copy_only=False)
+    filled = np.r_[0, np.cumsum(is_entry)]
+    before = filled[offsets[:-1]]
+    entries = filled[offsets[1:]] - before
+    stage = np.maximum(filled[1:] - before[parent] - 1, 0)
+    event = np.where(is_entry, np.where(stage == 0, 0, 1), 2).astype(np.int32)
+
+    rate = flat.field("safe_price").to_numpy(zero_copy_only=False)
+    first = np.where(offsets[:-1] < len(rate), offsets[:-1], 0)
+    filled_ms = flat.field("order_filled_timestamp")
+    open_ms = np.array([t["open_timestamp"] for t in trades], dtype=np.int64)
+    minutes = pc.divide(pc.subtract(filled_ms, pa.array(open_ms[parent])), 60_000)
+
+    def per_trade(key: str):
+        return pa.array([t.get(key) for t in trades]).take(pa.array(parent))
+
+    def constant(value: str):
+        return pa.DictionaryArray.from_arrays(pa.array(np.zeros(len(parent), np.int32)), [value])
+
+    tag = flat.field("ft_order_tag")
+    columns = {
+        "run": constant(run),
+        "strategy": constant(strategy),
+        "trade_index": pa.array(parent.astype(np.int32)),
+        "pair": pc.dictionary_encode(per_trade("pair")),
+        "open_date": pa.array(open_ms[parent]),
+        "event": pa.DictionaryArray.from_arrays(pa.array(event), list(EVENTS)),
+        "stage": pa.array(stage.astype(np.int8)),
+        "tag": pc.dictionary_encode(pc.if_else(pc.equal(tag, ""), pa.scalar(None, pa.string()), tag)),
+        "date": filled_ms,
+        "rate": flat.field("safe_price"),
+        "amount": flat.field("amount"),
+        "stake": flat.field("cost"),
+        "from_first_pct": pa.array(((rate / rate[first][parent] - 1) * 100).astype(np.float32)),
+        "minutes": minutes,
+        "entries": pa.array(entries[parent].astype(np.int8)),
+        "exit_reason": pc.dictionary_encode(per_trade("exit_reason")),
+        "profit_ratio": per_trade("profit_ratio"),
+    }
+    return pa.table(columns).cast(schema())
+
+
+def events_path(result: Path) -> Path:
+    """
+    backtest-result-<date>.zip -> backtest-result-<date>.events.parquet
+    """
+    return result.with_name(result.name.removesuffix(".zip").removesuffix(".json") + SUFFIX)
+
+
+def write_events(stats: dict, result: Path) -> Path:
+    """
+    Event log of all strategies of a backtest result (stats as stored / loaded).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = events_path(result)
+    run = path.name.removesuffix(SUFFIX)
+    tables = [
+        fill_events(content.get("trades", []), strategy, run)
+        for strategy, content in stats["strategy"].items()
+    ]
+    table = pa.concat_tables(tables, promote_options="permissive").unify_dictionaries()
+    tmp = path.with_suffix(".tmp")
+    pq.write_table(table, tmp, compression="zstd", row_group_size=ROW_GROUP)
+    tmp.replace(path)
+    logger.info(f"Event log: {table.num_rows} fills -> {path}")
+    return path
+
+
+def build(source: Path, force: bool = False) -> list[Path]:
+    """
+    Event logs of a stored result, or of every result of a directory without one.
+    """
+    from freqtrade.data.btanalysis import load_backtest_stats
+
+    if source.is_dir():
+        results = sorted(source.glob("backtest-result-*.zip"))
+        if not force:
+            results = [r for r in results if not events_path(r).exists()]
+    else:
+        results = [source]
+    return [write_events(load_backtest_stats(result), result) for result in results]
+
+
+# ------------------ Query ------------------
+def sources(paths: list[Path] | None) -> list[Path]:
+    """
+    Event log files: a file as is, a result zip -> its event log, a directory
+    -> all event logs in it; nothing -> the latest backtest's event log.
+    """
+    from freqtrade.data.btanalysis import get_latest_backtest_filename
+
+    if not paths:
+        paths = [RESULTS_DIR / get_latest_backtest_filename(RESULTS_DIR)]
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files += sorted(path.glob(f"*{SUFFIX}"))
+        elif path.name.endswith(SUFFIX):
+            files.append(path)
+        else:
+            files.append(events_path(path))
+    missing = [f for f in files if not f.exists()]
+    if missing:
+        raise FileNotFoundError(f"No event log {missing[0]} - run: eventlog.py build")
+    return files
+
+
+def event_filter(strategy=None, pair=None, event=None, min_stage=None,
+                 exit_reason=None, start=None, end=None):
+    """
+    pyarrow dataset expression, None = everything. Lists mean "any of".
+    """
+    import pyarrow.dataset as ds
+
+    expressions = []
+    for column, values in (("strategy", strategy), ("pair", pair), ("event", event),
+                           ("exit_reason", exit_reason)):
+        if values:
+            expressions.append(ds.field(column).isin(list(values)))
+    if min_stage is not None:
+        expressions.append(ds.field("stage") >= min_stage)
+    if start is not None:
+        expressions.append(ds.field("date") >= start)
+    if end is not None:
+        expressions.append(ds.field("date") < end)
+    if not expressions:
+        return None
+    expression = expressions[0]
+    for e in expressions[1:]:
+        expression = expression & e
+    return expression
+
+
+def load_events(paths: list[Path] | None = None, columns: list[str] | None = None, **filters):
+    """
+    Filtered events as a pyarrow Table (.to_pandas() for a DataFrame).
+    Only `columns` are read, filters skip row groups that cannot match:
+        load_events(columns=["pair", "stage", "rate"], event=["dca"], min_stage=3)
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(sources(paths), format="parquet", schema=schema())
+    return dataset.to_table(columns=columns, filter=event_filter(**filters))
+
+
+# ------------------ Report ------------------
+def depth_rows(events) -> list[list]:
+    """
+    Trades by number of DCA fills.
+    """
+    trades = events[events["event"] == "entry"]
+    rows = []
+    for depth, group in trades.groupby(trades["entries"] - 1):
+        rows.append([
+            int(depth), len(group), f"{100 * len(group) / len(trades):.1f}",
+            f"{100 * group['profit_ratio'].mean():.2f}",
+            f"{100 * (group['profit_ratio'] > 0).mean():.1f}",
+            f"{100 * (group['exit_reason'] == DCA_STOP).mean():.1f}",
+        ])
+    return rows
+
+
+def stage_rows(events) -> list[list]:
+    """
+    Entry fills by stage: stake and rate / time relative to the first entry.
+    """
+    fills = events[events["event"] != "exit"]
+    rows = []
+    for stage, group in fills.groupby("stage"):
+        rows.append([
+            int(stage), len(group), f"{group['stake'].mean():.2f}",
+            f"{group['from_first_pct'].median():.2f}", f"{group['from_first_pct'].min():.2f}",
+            f"{group['minutes'].median() / 60:.1f}",
+        ])
+    return rows
+
+
+def exit_rows(events) -> list[list]:
+    """
+    Exits by reason: depth reached and hours from the first entry.
+    """
+    exits = events[events["event"] == "exit"]
+    rows = []
+    for reason, group in exits.groupby("tag"):
+        hours = group["minutes"] / 60
+        rows.append([
+            reason, len(group), f"{group['stage'].mean():.2f}",
+            f"{hours.median():.1f}", f"{hours.quantile(0.9):.1f}",
+            f"{group['from_first_pct'].mean():.2f}",
+        ])
+    return rows
+
+
+def report(events) -> None:
+    from freqtrade.util import print_rich_table
+
+    if events.empty:
+        logger.info("No events match")
+        return
+    print_rich_table(
+        depth_rows(events),
+        ["DCA fills", "Trades", "%", "Avg profit %", "Win %", f"{DCA_STOP} %"],
+        summary="TRADES BY DCA DEPTH",
+    )
+    print_rich_table(
+        stage_rows(events),
+        ["Stage", "Fills", "Avg stake", "Median vs first %", "Min vs first %", "Median hours"],
+        summary="ENTRY FILLS BY STAGE",
+    )
+    print_rich_table(
+        exit_rows(events),
+        ["Exit", "Exits", "Avg stage", "Median hours", "p90 hours", "Avg vs first %"],
+        summary=f"EXITS ({TAKE_PROFIT} hours = time to TP)",
+    )
+
+
+# ------------------ Launcher ------------------
+def install() -> None:
+    """
+    Write the event log next to every stored backtest result (launcher.py --event-log).
+    """
+    from freqtrade.optimize import backtesting
+
+    store = backtesting.store_backtest_results
+
+    def store_with_events(config, stats, *args, **kwargs):
+        result = store(config, stats, *args, **kwargs)
+        if result:
+            write_events(stats, Path(result))
+        return result
+
+    backtesting.store_backtest_results = store_with_events
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Backtest fills as a parquet event log.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    bld = sub.add_parser("build", help="Write the event log of stored backtest results.")
+    bld.add_argument("--backtest-filename", type=Path, default=RESULTS_DIR,
+                     help="Result zip, or a directory: every result without an event log "
+                          "(default: user_data/backtest_results).")
+    bld.add_argument("--force", action="store_true", help="Rewrite existing event logs.")
+
+    qry = sub.add_parser("query", help="Filter events and summarize DCA depth / stages / exits.")
+    qry.add_argument("--events", type=Path, nargs="+", default=None,
+                     help="Event logs, result zips or directories (default: latest backtest).")
+    qry.add_argument("--strategy", nargs="+", default=None)
+    qry.add_argument("--pair", nargs="+", default=None)
+    qry.add_argument("--event", nargs="+", choices=EVENTS, default=None,
+                     help="Only these events (reports need all three).")
+    qry.add_argument("--min-stage", type=int, default=None,
+                     help="Only fills at or after this DCA stage.")
+    qry.add_argument("--exit-reason", nargs="+", default=None,
+                     help=f"Only trades that ended this way, e.g. {DCA_STOP}.")
+    qry.add_argument("--timerange", default=None, help="Fill dates, e.g. 20240101-20250101.")
+    qry.add_argument("--export", type=Path, default=None,
+                     help="Write the filtered events (.csv or .parquet) instead of the report.")
+    args = parser.parse_args(argv)
+
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+    if args.command == "build":
+        if not build(args.backtest_filename, args.force):
+            logger.info("Nothing to build")
+        return
+
+    start = end = None
+    if args.timerange:
+        from freqtrade.configuration import TimeRange
+
+        timerange = TimeRange.parse_timerange(args.timerange)
+        start, end = timerange.startdt, timerange.stopdt
+    table = load_events(args.events, strategy=args.strategy, pair=args.pair, event=args.event,
+                        min_stage=args.min_stage, exit_reason=args.exit_reason,
+                        start=start, end=end)
+    logger.info(f"{table.num_rows} events")
+    if args.export:
+        if args.export.suffix == ".parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, args.export, compression="zstd")
+        else:
+            table.to_pandas().to_csv(args.export, index=False)
+        logger.info(f"Events written to {args.export}")
+        return
+    report(table.to_pandas())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# ================================================================
+# IndicatorCache – compute identical indicator columns only once
+# ---------------------------------------------------------------
+# - Wraps talib.abstract functions (ta.RSI, ta.EMA, ...) and strategy
+#   helpers with the same source code (compute_vwap in all Sekka files)
+# - Keyed by function, arguments and the loaded frame the candles come
+#   from (pair, timeframe, candle type, length, first / last date), so
+#   spot / futures / other pairs never mix. Frames are known by identity:
+#   the ones freqtrade hands to populate_indicators and the ones
+#   dp.get_pair_dataframe returns. Anything else (resampled, merged
+#   frames) is calculated as usual - hashing the candles would cost more
+#   than an RSI
+# - Results are copied out, callers can modify them freely
+#
+# Used by multibacktest.py while indicators of several strategies are
+# calculated on the same data.
+# ================================================================
+
+import hashlib
+import inspect
+import logging
+import weakref
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+# Strategy methods shared between strategies (only cached when the source is identical)
+SHARED_HELPERS = ("compute_vwap",)
+
+
+class IndicatorCache:
+    def __init__(self):
+        self.values: dict[tuple, pd.Series | pd.DataFrame] = {}
+        self.hits = 0
+        self.misses = 0
+        self._talib: dict[str, object] = {}
+        self._frames: dict[int, tuple[weakref.ref, tuple]] = {}
+        self._installed: list[tuple[object, str]] = []
+
+    # ------------------ Frames ------------------
+    def register(self, df: pd.DataFrame, pair: str, timeframe: str, candle_type) -> None:
+        """
+        Mark df as the loaded candles of (pair, timeframe, candle type).
+        """
+        if isinstance(df, pd.DataFrame) and len(df) and "date" in df.columns:
+            self._frames[id(df)] = (weakref.ref(df), (pair, timeframe, str(candle_type)))
+
+    def source(self, df) -> tuple | None:
+        """
+        Key part of a registered frame, None for any other input.
+        """
+        entry = self._frames.get(id(df)) if isinstance(df, pd.DataFrame) else None
+        if entry is None or entry[0]() is not df or not len(df):
+            return None
+        dates = df["date"]
+        return (*entry[1], len(df), dates.iat[0], dates.iat[-1])
+
+    def wrap(self, name: str, fn):
+        cache = self
+
+        @wraps(fn)
+        def cached(df, *args, **kwargs):
+            source = cache.source(df)
+            if source is None:
+                return fn(df, *args, **kwargs)
+            key = (name, source, args, tuple(sorted(kwargs.items())))
+            if key not in cache.values:
+                cache.misses += 1
+                cache.values[key] = fn(df, *args, **kwargs)
+            else:
+                cache.hits += 1
+            value = cache.values[key]
+            if isinstance(value, (pd.Series, pd.DataFrame)):
+                # Same candles, but possibly a different index (merged / trimmed frames)
+                return value.copy().set_axis(df.index, axis=0)
+            return value.copy() if isinstance(value, np.ndarray) else value
+
+        return cached
+
+    # ------------------ Install ------------------
+    def install_talib(self) -> None:
+        """
+        Cache all talib.abstract functions. Strategies call them as ta.X at
+        runtime, so this works after the strategy modules were imported.
+        """
+        import talib
+        import talib.abstract as ta
+
+        for name in talib.get_functions():
+            if name not in self._talib:
+                self._talib[name] = getattr(ta, name)
+                setattr(ta, name, self.wrap(f"talib.{name}", self._talib[name]))
+
+    def uninstall_talib(self) -> None:
+        import talib.abstract as ta
+
+        for name, fn in self._talib.items():
+            setattr(ta, name, fn)
+        self._talib.clear()
+
+    def _patch(self, obj, name: str, fn) -> None:
+        setattr(obj, name, fn)
+        self._installed.append((obj, name))
+
+    def install_strategy(self, strategy) -> None:
+        """
+        Register the frames the strategy gets (populate_indicators input,
+        dp.get_pair_dataframe results) and cache its shared helpers.
+        """
+        cache = self
+        advise_indicators = strategy.advise_indicators
+
+        @wraps(advise_indicators)
+        def advise_registered(dataframe, metadata):
+            # dp is set by Backtesting right before the analysis
+            cache.install_dataprovider(strategy)
+            cache.register(dataframe, metadata["pair"], strategy.timeframe,
+                           strategy.config.get("candle_type_def"))
+            return advise_indicators(dataframe, metadata)
+
+        self._patch(strategy, "advise_indicators", advise_registered)
+        self.install_helpers(strategy)
+
+    def install_dataprovider(self, strategy) -> None:
+        dp = strategy.dp
+        if dp is None or "get_pair_dataframe" in vars(dp):
+            return
+        cache = self
+        get_pair_dataframe = dp.get_pair_dataframe
+
+        @wraps(get_pair_dataframe)
+        def get_registered(pair, timeframe=None, candle_type=""):
+            df = get_pair_dataframe(pair, timeframe, candle_type)
+            cache.register(df, pair, timeframe or strategy.config["timeframe"],
+                           candle_type or strategy.config.get("candle_type_def"))
+            return df
+
+        self._patch(dp, "get_pair_dataframe", get_registered)
+
+    def install_helpers(self, strategy) -> None:
+        """
+        Cache the strategy's shared helper methods. Helpers of different
+        strategies share results only if their source code is identical.
+        """
+        for name in SHARED_HELPERS:
+            method = getattr(strategy, name, None)
+            if method is None:
+                continue
+            try:
+                source = inspect.getsource(method)
+            except (OSError, TypeError):
+                continue
+            digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+            self._patch(strategy, name, self.wrap(f"{name}.{digest}", method))
+
+    def uninstall(self) -> None:
+        for obj, name in reversed(self._installed):
+            vars(obj).pop(name, None)
+        self._installed.clear()
+        self._frames.clear()
+
+    def __enter__(self) -> "IndicatorCache":
+        self.install_talib()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.uninstall_talib()
+        self.uninstall()
+        logger.info(f"Indicator cache: {self.hits} shared / {self.misses} calculated")
@@ -0,0 +1,340 @@
+# ================================================================
+# JobQueue – persistent hyperopt / backtest queue for one machine
+# ---------------------------------------------------------------
+# - Jobs live in a SQLite file, so the queue survives restarts
+# - Scheduler packs jobs onto cores and starts the next one as soon
+#   as capacity frees up (one job per strategy at a time, since
+#   run-hyperopt.sh clears the strategy's params json; one hyperopt at a
+#   time, all runs share freqtrade's user_data/hyperopt.lock - backtests
+#   run next to it)
+# - Records start / finish / runtime / exit code per job
+#
+# Runs on the host (stdlib only), jobs run through the usual scripts.
+#
+# Usage (from the repo root):
+#   python3 user_data/tools/jobqueue.py add hyperopt --strategy OptLong --epochs 1000 --cores 4
+#   python3 user_data/tools/jobqueue.py add backtest --strategy SekkaLong --timerange 20240101-
+#   python3 user_data/tools/jobqueue.py list
+#   python3 user_data/tools/jobqueue.py run --exit-when-empty
+#   python3 user_data/tools/jobqueue.py cancel 3
+# ================================================================
+
+import argparse
+import json
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_DB = ROOT / "user_data" / "jobqueue.sqlite"
+LOG_DIR = ROOT / "user_data" / "logs" / "jobqueue"
+
+CPUS = os.cpu_count() or 1
+
+# freqtrade exits with 0 when another hyperopt holds user_data/hyperopt.lock
+HYPEROPT_LOCKED = "Another running instance of freqtrade Hyperopt detected."
+
+# Same defaults as run-hyperopt.sh
+DEFAULTS = {
+    "loss": "ZeroLossMaxTrades",
+    "spaces": "buy sell",
+    "timerange": "20220101-20251230",
+    "config": "user_data/config-long.json",
+    "epochs": 2000,
+    "wallet": 100000,
+    "detail": "30m",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind        TEXT NOT NULL,
+    strategy    TEXT NOT NULL,
+    args        TEXT NOT NULL,
+    cores       INTEGER NOT NULL,
+    priority    INTEGER NOT NULL DEFAULT 0,
+    status      TEXT NOT NULL DEFAULT 'pending',
+    pid         INTEGER,
+    exit_code   INTEGER,
+    created_at  TEXT NOT NULL,
+    started_at  TEXT,
+    finished_at TEXT,
+    runtime     REAL,
+    log         TEXT
+)
+"""
+
+
+def now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def connect(db: Path) -> sqlite3.Connection:
+    db.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db, isolation_level=None, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute(SCHEMA)
+    return conn
+
+
+# ------------------ Commands per job ------------------
+def build_command(job: sqlite3.Row) -> list[str]:
+    args = json.loads(job["args"])
+    if job["kind"] == "hyperopt":
+        # Upload skipped - with several runs in parallel "latest result" is ambiguous,
+        # results stay in user_data/hyperopt_results
+        return [
+            "./run-hyperopt.sh", "--no-upload",
+            "--strategy", job["strategy"],
+            "--loss", args["loss"],
+            "--spaces", args["spaces"].replace(" ", "_"),
+            "--timerange", args["timerange"],
+            "--config", args["config"],
+            "--epochs", str(args["epochs"]),
+            "--jobs", str(job["cores"]),
+            "--wallet", str(args["wallet"]),
+            "--detail", args["detail"],
+        ] + (["--fresh"] if args.get("fresh") else [])
+
+    return [
+        "docker", "compose", "run", "--rm", "freqtrade", "backtesting",
+        "--strategy", job["strategy"],
+        "--timerange", args["timerange"],
+        "--config", args["config"],
+        "--dry-run-wallet", str(args["wallet"]),
+        "--timeframe-detail", args["detail"],
+    ]
+
+
+# ------------------ Scheduler ------------------
+class Adopted:
+    """
+    Popen stand-in for a job started by an earlier scheduler process.
+    Its exit code is unknown, so it is reported as -1.
+    """
+
+    def __init__(self, pid: int | None):
+        self.pid = pid
+
+    def poll(self) -> int | None:
+        try:
+            os.kill(self.pid, 0)
+        except (ProcessLookupError, TypeError):
+            return -1
+        except PermissionError:
+            pass
+        return None
+
+
+class Scheduler:
+    """
+    Starts pending jobs (priority, then FIFO) whenever their cores fit into the
+    free capacity. Smaller jobs further down the queue may start first when the
+    head of the queue doesn't fit yet.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, capacity: int, poll: float = 5.0):
+        self.conn = conn
+        self.capacity = capacity
+        self.poll = poll
+        self.running: dict[int, tuple[subprocess.Popen, float]] = {}
+
+    def recover(self) -> None:
+        # Jobs left "running" by a previous scheduler: still alive -> keep watching them,
+        # gone (VM preempted / rebooted) -> back into the queue
+        for job in self.conn.execute("SELECT * FROM jobs WHERE status='running'").fetchall():
+            proc = Adopted(job["pid"])
+            if job["pid"] and proc.poll() is None:
+                started = datetime.fromisoformat(job["started_at"]).timestamp()
+                self.running[job["id"]] = (proc, started)
+                print(f"Watching job {job['id']} still running from a previous scheduler")
+            else:
+                self.conn.execute(
+                    "UPDATE jobs SET status='pending', pid=NULL, started_at=NULL WHERE id=?",
+                    (job["id"],),
+                )
+                print(f"Re-queued interrupted job {job['id']}")
+
+    def used_cores(self) -> int:
+        return sum(min(self.job(job_id)["cores"], self.capacity) for job_id in self.running)
+
+    def job(self, job_id: int) -> sqlite3.Row:
+        return self.conn.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+
+    def locked_out(self, job: sqlite3.Row) -> bool:
+        """
+        Hyperopt that never ran: another hyperopt (outside the queue) held the lock.
+        """
+        if job["kind"] != "hyperopt" or not job["log"]:
+            return False
+        try:
+            return HYPEROPT_LOCKED in (ROOT / job["log"]).read_text(errors="replace")
+        except OSError:
+            return False
+
+    def reap(self) -> None:
+        for job_id, (proc, started) in list(self.running.items()):
+            code = proc.poll()
+            if code is None:
+                continue
+            del self.running[job_id]
+            runtime = time.time() - started
+            status = "done" if code == 0 else "failed"
+            if status == "done" and self.locked_out(self.job(job_id)):
+                status = "failed"
+                print(f"[{now()}] Job {job_id}: another hyperopt holds user_data/hyperopt.lock, "
+                      f"nothing was run")
+            # Cancelled jobs keep their status
+            self.conn.execute(
+                "UPDATE jobs SET status=?, exit_code=?, finished_at=?, runtime=? "
+                "WHERE id=? AND status='running'",
+                (status, code, now(), runtime, job_id),
+            )
+            print(f"[{now()}] Job {job_id} finished: exit {code} after {runtime / 60:.1f} min")
+
+    def start_next(self) -> None:
+        free = self.capacity - self.used_cores()
+        running = [self.job(job_id) for job_id in self.running]
+        busy = {job["strategy"] for job in running}
+        hyperopt = any(job["kind"] == "hyperopt" for job in running)
+        pending = self.conn.execute(
+            "SELECT * FROM jobs WHERE status='pending' ORDER BY priority DESC, id"
+        ).fetchall()
+
+        for job in pending:
+            # A job wider than the machine runs alone
+            cores = min(job["cores"], self.capacity)
+            if cores > free or job["strategy"] in busy:
+                continue
+            # freqtrade allows one hyperopt per user_data directory (hyperopt.lock)
+            if job["kind"] == "hyperopt" and hyperopt:
+                continue
+            self.launch(job)
+            free -= cores
+            busy.add(job["strategy"])
+            hyperopt = hyperopt or job["kind"] == "hyperopt"
+
+    def launch(self, job: sqlite3.Row) -> None:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        log_path = LOG_DIR / f"job-{job['id']}.log"
+        cmd = build_command(job)
+        with log_path.open("ab") as log:
+            log.write(f"$ {' '.join(cmd)}\n".encode())
+            # Own process group, so cancel can stop the script and docker together
+            proc = subprocess.Popen(cmd, cwd=ROOT, stdout=log, stderr=subprocess.STDOUT,
+                                    stdin=subprocess.DEVNULL, start_new_session=True)
+        self.running[job["id"]] = (proc, time.time())
+        self.conn.execute(
+            "UPDATE jobs SET status='running', pid=?, started_at=?, log=? WHERE id=?",
+            (proc.pid, now(), str(log_path.relative_to(ROOT)), job["id"]),
+        )
+        print(f"[{now()}] Job {job['id']} started: {job['kind']} {job['strategy']} "
+              f"on {job['cores']} core(s) -> {log_path.name}")
+
+    def loop(self, exit_when_empty: bool = False) -> None:
+        self.recover()
+        print(f"Scheduler running with {self.capacity} cores")
+        while True:
+            self.reap()
+            self.start_next()
+            if exit_when_empty and not self.running:
+                print("Queue empty, exiting")
+                return
+            time.sleep(self.poll)
+
+
+# ------------------ CLI ------------------
+def cmd_add(conn: sqlite3.Connection, args) -> None:
+    cores = args.cores or (max(1, CPUS // 2) if args.kind == "hyperopt" else 1)
+    job_args = {key: getattr(args, key) for key in DEFAULTS}
+    job_args["fresh"] = args.fresh
+    cur = conn.execute(
+        "INSERT INTO jobs (kind, strategy, args, cores, priority, created_at) VALUES (?,?,?,?,?,?)",
+        (args.kind, args.strategy, json.dumps(job_args), cores, args.priority, now()),
+    )
+    print(f"Added job {cur.lastrowid}: {args.kind} {args.strategy} ({cores} cores)")
+
+
+def cmd_list(conn: sqlite3.Connection, args) -> None:
+    query = "SELECT * FROM jobs"
+    if not args.all:
+        query += " WHERE status IN ('pending', 'running') OR finished_at >= date('now', '-7 day')"
+    rows = conn.execute(query + " ORDER BY id").fetchall()
+    print(f"{'ID':>4}  {'KIND':<9} {'STRATEGY':<14} {'CORES':>5}  {'STATUS':<10} "
+          f"{'STARTED':<20} {'RUNTIME':>8}  TIMERANGE")
+    for job in rows:
+        runtime = f"{job['runtime'] / 60:.1f}m" if job["runtime"] else ""
+        timerange = json.loads(job["args"])["timerange"]
+        print(f"{job['id']:>4}  {job['kind']:<9} {job['strategy']:<14} {job['cores']:>5}  "
+              f"{job['status']:<10} {job['started_at'] or '':<20} {runtime:>8}  {timerange}")
+
+
+def cmd_cancel(conn: sqlite3.Connection, args) -> None:
+    job = conn.execute("SELECT * FROM jobs WHERE id=?", (args.id,)).fetchone()
+    if job is None:
+        sys.exit(f"No job {args.id}")
+    if job["status"] not in ("pending", "running"):
+        sys.exit(f"Job {args.id} is already {job['status']}")
+
+    conn.execute("UPDATE jobs SET status='cancelled', finished_at=? WHERE id=?", (now(), args.id))
+    if job["status"] == "running" and job["pid"]:
+        try:
+            os.killpg(job["pid"], signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    print(f"Cancelled job {args.id}")
+
+
+def cmd_run(conn: sqlite3.Connection, args) -> None:
+    Scheduler(conn, args.cores, args.poll).loop(args.exit_when_empty)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Hyperopt / backtest job queue.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="Queue database file.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    add = sub.add_parser("add", help="Queue a job.")
+    add.add_argument("kind", choices=["hyperopt", "backtest"])
+    add.add_argument("--strategy", "-s", required=True)
+    add.add_argument("--loss", default=DEFAULTS["loss"])
+    add.add_argument("--spaces", default=DEFAULTS["spaces"])
+    add.add_argument("--timerange", "-t", default=DEFAULTS["timerange"])
+    add.add_argument("--config", "-c", default=DEFAULTS["config"])
+    add.add_argument("--epochs", "-e", type=int, default=DEFAULTS["epochs"])
+    add.add_argument("--wallet", "-w", type=int, default=DEFAULTS["wallet"])
+    add.add_argument("--detail", "-d", default=DEFAULTS["detail"])
+    add.add_argument("--cores", type=int, default=None,
+                     help=f"Cores for this job (default: hyperopt {max(1, CPUS // 2)}, backtest 1).")
+    add.add_argument("--priority", type=int, default=0, help="Higher runs first.")
+    add.add_argument("--fresh", action="store_true", help="Hyperopt: don't resume.")
+    add.set_defaults(func=cmd_add)
+
+    lst = sub.add_parser("list", help="Show queued, running and recent jobs.")
+    lst.add_argument("--all", action="store_true", help="Include older finished jobs.")
+    lst.set_defaults(func=cmd_list)
+
+    cancel = sub.add_parser("cancel", help="Cancel a pending or running job.")
+    cancel.add_argument("id", type=int)
+    cancel.set_defaults(func=cmd_cancel)
+
+    run = sub.add_parser("run", help="Run the scheduler.")
+    run.add_argument("--cores", type=int, default=CPUS,
+                     help=f"Cores to pack jobs onto (default: {CPUS}).")
+    run.add_argument("--poll", type=float, default=5.0, help="Seconds between checks.")
+    run.add_argument("--exit-when-empty", action="store_true",
+                     help="Stop once nothing is pending or running.")
+    run.set_defaults(func=cmd_run)
+
+    args = parser.parse_args(argv)
+    args.func(connect(args.db), args)
+
+
+if __name__ == "__main__":
+    main()
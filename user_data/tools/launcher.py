@@ -0,0 +1,320 @@
+# ================================================================
+# Freqtrade Launcher – freqtrade with runtime extensions
+# ---------------------------------------------------------------
+# Runs a normal freqtrade command after installing the selected
+# extensions. Everything from the freqtrade subcommand onwards is
+# passed through unchanged.
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/launcher.py --shared-frames hyperopt --strategy OptLong ...
+#   python3 user_data/tools/launcher.py --worker 10.148.0.2:7777 --processes 4
+# ================================================================
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+
+
+# ------------------ Shared Frames ------------------
+def install_shared_frames(root: Path | None = None) -> None:
+    """
+    Publish hyperopt data once as memory-mapped frames instead of
+    - unpickling hyperopt_tickerdata.pkl in every worker on every epoch
+    - pickling detail / futures / informative data into every worker task
+    """
+    from joblib import dump
+
+    from freqtrade.optimize.hyperopt import hyperopt_optimizer
+    from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
+
+    from shared_frames import SharedFrames, SharedFrameStore
+
+    stores: dict[Path, SharedFrameStore] = {}
+
+    def get_store(data_pickle_file) -> SharedFrameStore:
+        path = Path(root) if root else Path(data_pickle_file).parent / "shared_frames"
+        if path not in stores:
+            stores[path] = SharedFrameStore(path)
+        return stores[path]
+
+    def dump_shared(value, filename, *args, **kwargs):
+        # The pickle file then only holds the manifest path of the published frames
+        if isinstance(value, dict) and not isinstance(value, SharedFrames):
+            value = get_store(filename).publish("processed", value)
+        return dump(value, filename, *args, **kwargs)
+
+    prepare_hyperopt_data = HyperOptimizer.prepare_hyperopt_data
+
+    def prepare_hyperopt_data_shared(self) -> None:
+        prepare_hyperopt_data(self)
+
+        store = get_store(self.data_pickle_file)
+        bt = self.backtesting
+        if bt.detail_data:
+            bt.detail_data = store.publish("detail", bt.detail_data)
+        if bt.futures_data:
+            bt.futures_data = store.publish("futures", bt.futures_data)
+
+        # Informative pairs loaded through the dataprovider (e.g. spot data for SekkaHour)
+        dp = bt.dataprovider
+        cached = dp._DataProvider__cached_pairs_backtesting
+        if cached:
+            dp._DataProvider__cached_pairs_backtesting = store.publish("informative", cached)
+
+    hyperopt_optimizer.dump = dump_shared
+    HyperOptimizer.prepare_hyperopt_data = prepare_hyperopt_data_shared
+
+
+# ------------------ Memory Governor ------------------
+def install_memory_governor(reserve_mb: int = 1024) -> None:
+    """
+    Size the hyperopt worker pool to the memory it actually needs.
+    -j stays the upper bound (and the batch size), the governor decides how
+    many of those run at once - see worker_memory.py.
+    """
+    from joblib import Parallel
+    from joblib.externals.loky.process_executor import BrokenProcessPool
+
+    from freqtrade.optimize.hyperopt.hyperopt import Hyperopt
+
+    from worker_memory import MemoryGovernor
+
+    governors: dict[int, MemoryGovernor] = {}
+
+    def run_optimizer_parallel_governed(self, parallel, asked):
+        governor = governors.get(id(self))
+        if governor is None:
+            governor = MemoryGovernor(parallel._effective_n_jobs(), reserve_mb=reserve_mb)
+            governors[id(self)] = governor
+            logger.info(f"Memory governor: starting with {governor.workers} of "
+                        f"{governor.max_workers} workers")
+
+        while True:
+            try:
+                with governor:
+                    # Re-sizes loky's reusable executor to the governor's pool size
+                    f_val = Parallel(n_jobs=min(governor.workers, len(asked)))(
+                        self.hyperopter.generate_optimizer_wrapped(v) for v in asked
+                    )
+                break
+            except BrokenProcessPool:
+                if governor.workers == 1:
+                    raise
+                governor.worker_lost()
+
+        governor.resize()
+        return f_val
+
+    Hyperopt.run_optimizer_parallel = run_optimizer_parallel_governed
+
+
+# ------------------ Distributed ------------------
+def install_coordinator(address: str, argv: list[str], store: Path | None = None) -> None:
+    """
+    Hand hyperopt epoch batches to remote workers instead of the local pool.
+    -j sets the batch size - roughly the total number of worker processes.
+    """
+    import atexit
+
+    from freqtrade.optimize.hyperopt.hyperopt import Hyperopt
+
+    from distributed import Coordinator
+
+    coordinator = Coordinator(address, argv, store)
+    atexit.register(coordinator.close)
+
+    def run_optimizer_distributed(self, parallel, asked):
+        return coordinator.run_batch(self.hyperopter, asked)
+
+    Hyperopt.run_optimizer_parallel = run_optimizer_distributed
+
+
+# ------------------ Signal Index ------------------
+def install_signal_index() -> None:
+    """
+    Backtests / hyperopt epochs jump over candles without open trades and
+    without entry signals - see signal_index.py.
+    """
+    from freqtrade.optimize.backtesting import Backtesting
+
+    from signal_index import SignalIndex
+
+    init = Backtesting.__init__
+
+    def init_indexed(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        SignalIndex.install(self)
+
+    Backtesting.__init__ = init_indexed
+
+
+# ------------------ Parallel Analysis ------------------
+def install_parallel_analysis(workers: int) -> None:
+    """
+    Live / dry-run: analyze the pairs of a new candle on a thread pool -
+    see parallel_analysis.py.
+    """
+    from parallel_analysis import install
+
+    install(workers)
+
+
+# ------------------ Cross-Pair Indicators ------------------
+def install_cross_pair() -> None:
+    """
+    RSI / VWAP of all pairs in one vectorized pass instead of once per pair -
+    see cross_pair.py.
+    """
+    from cross_pair import install
+
+    install()
+
+
+# ------------------ Compact ------------------
+def install_compact() -> None:
+    """
+    float32 candles and indicators (volume stays float64) - see compact.py.
+    """
+    from compact import install
+
+    install()
+
+
+# ------------------ Profiler ------------------
+def install_profiler(hz: int) -> None:
+    """
+    Sample hyperopt workers and write a collapsed-stack profile next to the
+    results - see profiler.py.
+    """
+    from profiler import install
+
+    install(hz)
+
+
+# ------------------ Event Log ------------------
+def install_event_log() -> None:
+    """
+    Backtesting: one parquet row per entry / DCA / exit fill next to the
+    stored result - see eventlog.py.
+    """
+    from eventlog import install
+
+    install()
+
+
+# ------------------ Candle Cache ------------------
+def install_candle_cache(directory: Path | None = None) -> None:
+    """
+    Live / dry-run: startup candles from the local cache, only the tail is
+    downloaded - see candle_cache.py.
+    """
+    from candle_cache import install
+
+    install(directory)
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Run freqtrade with runtime extensions.",
+        usage="%(prog)s [options] <freqtrade subcommand> [freqtrade options]",
+    )
+    parser.add_argument("--shared-frames", action="store_true",
+                        help="Share hyperopt data between workers via memory-mapped files.")
+    parser.add_argument("--shared-frames-dir", type=Path, default=None,
+                        help="Directory for the mapped files "
+                             "(default: user_data/hyperopt_results/shared_frames).")
+    parser.add_argument("--auto-jobs", action="store_true",
+                        help="Size the hyperopt worker pool to available memory "
+                             "(-j becomes the upper limit).")
+    parser.add_argument("--memory-reserve", type=int, default=1024, metavar="MB",
+                        help="Memory kept free by --auto-jobs (default: 1024).")
+    parser.add_argument("--skip-idle", action="store_true",
+                        help="Backtesting / hyperopt: jump over candles without open trades "
+                             "and without entry signals.")
+    parser.add_argument("--cross-pair", action="store_true",
+                        help="Compute RSI / VWAP for all pairs at once (any subcommand, "
+                             "trade included).")
+    parser.add_argument("--compact", action="store_true",
+                        help="float32 candles / indicators (check with compact.py report first).")
+    parser.add_argument("--profile", action="store_true",
+                        help="Hyperopt: sample the workers and write a flamegraph profile "
+                             "next to the results.")
+    parser.add_argument("--profile-hz", type=int, default=100, metavar="HZ",
+                        help="Samples per second and worker for --profile (default: 100).")
+    parser.add_argument("--event-log", action="store_true",
+                        help="Backtesting: write the fills of the stored result as a parquet "
+                             "event log.")
+    parser.add_argument("--parallel-analysis", type=int, default=0, metavar="THREADS",
+                        help="Trade: analyze pairs on this many threads (default: 0 = off).")
+    parser.add_argument("--candle-cache", action="store_true",
+                        help="Trade: warm start from locally stored candles, download only "
+                             "the candles since the last stored one.")
+    parser.add_argument("--candle-cache-dir", type=Path, default=None,
+                        help="Candle cache directory "
+                             "(default: user_data/data/candle_cache/<exchange>).")
+    parser.add_argument("--coordinator", metavar="HOST:PORT",
+                        help="Hyperopt: hand epochs to workers connecting on this address.")
+    parser.add_argument("--result-store", type=Path, default=None,
+                        help="Coordinator result database "
+                             "(default: user_data/hyperopt_results/distributed.sqlite).")
+    parser.add_argument("--worker", metavar="HOST:PORT",
+                        help="Run as hyperopt worker for the coordinator at this address "
+                             "(no freqtrade subcommand needed).")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(),
+                        help="Worker: parallel evaluations on this machine (default: all cores).")
+    parser.add_argument("freqtrade_args", nargs=argparse.REMAINDER,
+                        help="freqtrade subcommand and its options.")
+    args = parser.parse_args(argv)
+
+    if not args.freqtrade_args and not args.worker:
+        parser.error("missing freqtrade subcommand")
+
+    # Tools directory must be importable from hyperopt worker processes
+    # (loky passes sys.path on to the workers)
+    if str(TOOLS_DIR) not in sys.path:
+        sys.path.insert(0, str(TOOLS_DIR))
+
+    if args.compact:
+        install_compact()
+    if args.shared_frames:
+        install_shared_frames(args.shared_frames_dir)
+    if args.auto_jobs:
+        install_memory_governor(args.memory_reserve)
+    if args.skip_idle:
+        install_signal_index()
+    if args.profile:
+        install_profiler(args.profile_hz)
+    if args.event_log:
+        install_event_log()
+    if args.candle_cache:
+        install_candle_cache(args.candle_cache_dir)
+    if args.parallel_analysis > 0:
+        install_parallel_analysis(args.parallel_analysis)
+    # After --parallel-analysis: stacks the candles, then calls the pool
+    if args.cross_pair:
+        install_cross_pair()
+
+    if args.worker:
+        from distributed import run_worker
+
+        run_worker(args.worker, args.processes)
+        return
+
+    if args.coordinator:
+        install_coordinator(args.coordinator, args.freqtrade_args, args.result_store)
+
+    from freqtrade.main import main as freqtrade_main
+
+    freqtrade_main(args.freqtrade_args)
+
+
+if __name__ == "__main__":
+    main()
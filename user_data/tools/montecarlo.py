@@ -0,0 +1,247 @@
+# ================================================================
+# Monte Carlo – robustness of a backtest trade list
+# ---------------------------------------------------------------
+# hyperopt-show --best / a backtest is one ordering of one set of trades.
+# Before new params go live, check how much of the result is luck:
+# - shuffle:   same trades, random order (drawdown / ruin depend on it,
+#              the final profit does not)
+# - bootstrap: trades drawn with replacement (profit interval)
+# - block:     runs of BLOCK consecutive trades drawn with replacement
+#              (keeps losing streaks / market phases together)
+# - Stake schedules: every trade's profit scaled by --stake-scale (all
+#   stakes bigger); --dca-scale F re-sizes the DCA ladder - the stake of
+#   DCA stage k times F^k. Each entry fill is re-priced on its own (its
+#   profit to the trade's close rate after fees, from the orders in the
+#   result), so deep-DCA trades weigh more than single entries. Exits and
+#   signals stay as backtested.
+# - --compound sizes stakes with the equity instead of the starting
+#   balance; ruin = equity ever at or below (1 - RUIN) of the starting
+#   balance
+# - All samples of a chunk are one (samples x trades) NumPy matrix -
+#   20000 resamples of a few hundred trades take about a second
+#
+# Trades are taken in close order, one after the other: overlapping
+# trades are treated as sequential, the wallet is not split between them.
+#
+# Usage (inside the container, from /freqtrade):
+#   freqtrade backtesting --strategy SekkaLong ... (candidate params)
+#   python3 user_data/tools/montecarlo.py --stake-scale 1 2 3
+#   python3 user_data/tools/montecarlo.py --dca-scale 1 1.5 2
+#   python3 user_data/tools/montecarlo.py --backtest-filename user_data/backtest_results/x.zip \
+#     --strategy SekkaLong --method block --block 20 --compound
+# ================================================================
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+SAMPLES = 20000
+CHUNK = 5000   # samples per matrix
+RUIN = 0.5
+METHODS = ("shuffle", "bootstrap", "block")
+
+
+# ------------------ Resampling ------------------
+def resample_index(rng, method: str, samples: int, trades: int, block: int) -> np.ndarray:
+    """
+    (samples x trades) trade indexes of one chunk.
+    """
+    if method == "shuffle":
+        return rng.permuted(np.broadcast_to(np.arange(trades), (samples, trades)), axis=1)
+    if method == "bootstrap":
+        return rng.integers(0, trades, (samples, trades))
+    # Circular block bootstrap
+    starts = rng.integers(0, trades, (samples, -(-trades // block)))
+    return ((starts[:, :, None] + np.arange(block)) % trades).reshape(samples, -1)[:, :trades]
+
+
+def equity_curves(index: np.ndarray, profit: np.ndarray, balance: float,
+                  scale: float, compound: bool) -> np.ndarray:
+    """
+    (samples x trades + 1) equity after each trade, starting balance first.
+    `profit` is per trade: absolute profit, or the return on the balance
+    before the trade when compounding.
+    """
+    steps = scale * profit[index]
+    if compound:
+        curves = balance * np.cumprod(np.maximum(1 + steps, 0), axis=1)
+    else:
+        curves = balance + np.cumsum(steps, axis=1)
+        # A wallet at zero stays there
+        curves[np.minimum.accumulate(curves, axis=1) <= 0] = 0
+    return np.concatenate([np.full((len(index), 1), balance), curves], axis=1)
+
+
+def curve_stats(curves: np.ndarray, balance: float, ruin: float) -> dict[str, np.ndarray]:
+    peaks = np.maximum.accumulate(curves, axis=1)
+    drawdown = peaks - curves
+    return {
+        "profit_pct": (curves[:, -1] / balance - 1) * 100,
+        "max_drawdown_abs": drawdown.max(axis=1),
+        "max_drawdown_pct": (drawdown / peaks).max(axis=1) * 100,
+        "ruined": curves.min(axis=1) <= balance * (1 - ruin),
+    }
+
+
+def simulate(profit: np.ndarray, balance: float, method: str, samples: int, block: int,
+             scale: float, compound: bool, ruin: float, seed: int | None) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    parts = []
+    for start in range(0, samples, CHUNK):
+        index = resample_index(rng, method, min(CHUNK, samples - start), len(profit), block)
+        parts.append(curve_stats(equity_curves(index, profit, balance, scale, compound), balance, ruin))
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+
+# ------------------ Trades ------------------
+def stage_profits(trades) -> np.ndarray:
+    """
+    (trades x stages) profit of every entry fill held to the trade's close
+    rate, after fees - stage 0 is the first entry, then the DCA fills.
+    A row sums to the trade's profit (without funding fees).
+    """
+    rows = []
+    for orders, close, short, fee_open, fee_close in zip(
+        trades["orders"], trades["close_rate"], trades["is_short"],
+        trades["fee_open"], trades["fee_close"],
+    ):
+        side = -1 if short else 1
+        rows.append([
+            side * o["amount"] * (close - o["safe_price"])
+            - fee_open * o["amount"] * o["safe_price"] - fee_close * o["amount"] * close
+            for o in (orders if isinstance(orders, list) else [])
+            if o.get("ft_is_entry") and o.get("order_filled_timestamp")
+        ])
+    stages = np.zeros((len(rows), max(map(len, rows), default=0) or 1))
+    for i, row in enumerate(rows):
+        stages[i, :len(row)] = row
+    return stages
+
+
+def dca_profit(profit: np.ndarray, stages: np.ndarray, factor: float) -> np.ndarray:
+    """
+    Trade profits with the stake of DCA stage k times factor^k.
+    """
+    return profit + stages @ (factor ** np.arange(stages.shape[1]) - 1)
+
+
+def load_trades(path: Path, strategy: str | None) -> tuple[str, float, np.ndarray, np.ndarray]:
+    """
+    Strategy name, starting balance, absolute profits and per-stage entry
+    profits of each trade (close order).
+    """
+    from freqtrade.data.btanalysis import load_backtest_data, load_backtest_stats
+
+    stats = load_backtest_stats(path)["strategy"]
+    strategy = strategy or next(iter(stats))
+    balance = float(stats[strategy]["starting_balance"])
+    trades = load_backtest_data(path, strategy).sort_values("close_date")
+    profit = trades["profit_abs"].to_numpy(dtype=np.float64)
+    return strategy, balance, profit, stage_profits(trades)
+
+
+def returns(profit: np.ndarray, balance: float) -> np.ndarray:
+    """
+    Return of each trade on the balance before it.
+    """
+    return profit / (balance + np.r_[0, np.cumsum(profit)[:-1]])
+
+
+# ------------------ Report ------------------
+def percentile_row(name: str, actual: float, values: np.ndarray, levels: list[float]) -> list:
+    return [name, f"{actual:.2f}", *(f"{v:.2f}" for v in np.percentile(values, levels))]
+
+
+def report(strategy: str, balance: float, profit: np.ndarray, stages: np.ndarray, args) -> None:
+    from freqtrade.util import print_rich_table
+
+    tail = (1 - args.confidence) / 2 * 100
+    levels = [tail, 50, 100 - tail]
+    headers = ["Metric", "Backtest", f"p{levels[0]:g}", "p50", f"p{levels[2]:g}"]
+    actual_index = np.arange(len(profit))[None, :]
+    dca_depth = int((np.abs(stages) > 0).sum(axis=1).max()) - 1
+    if dca_depth <= 0 and args.dca_scale != [1.0]:
+        logger.warning(f"{strategy}: no DCA fills in the result, --dca-scale changes nothing")
+
+    ruin_rows = []
+    for scale, dca in [(s, d) for s in args.stake_scale for d in args.dca_scale]:
+        schedule = f"x{scale:g}" + (f", DCA x{dca:g}^stage" if dca != 1 else "")
+        scaled = dca_profit(profit, stages, dca)
+        series = returns(scaled, balance) if args.compound else scaled
+        start = time.time()
+        actual = curve_stats(
+            equity_curves(actual_index, series, balance, scale, args.compound), balance, args.ruin
+        )
+        result = simulate(series, balance, args.method, args.samples, args.block,
+                          scale, args.compound, args.ruin, args.seed)
+        logger.info(f"{args.samples} {args.method} samples x {len(profit)} trades, "
+                    f"stake {schedule}: {time.time() - start:.2f}s")
+        rows = [
+            percentile_row(f"{label}", float(actual[key][0]), result[key], levels)
+            for key, label in (("profit_pct", "Profit %"), ("max_drawdown_pct", "Max drawdown %"),
+                               ("max_drawdown_abs", "Max drawdown abs"))
+        ]
+        print_rich_table(
+            rows, headers,
+            summary=f"{strategy} MONTE CARLO ({args.method}, stake {schedule}"
+                    f"{', compound' if args.compound else ''})",
+        )
+        ruin_rows.append([
+            schedule,
+            f"{(result['profit_pct'] < 0).mean() * 100:.2f}",
+            f"{result['ruined'].mean() * 100:.2f}",
+            "yes" if actual["ruined"][0] else "no",
+        ])
+    print_rich_table(
+        ruin_rows, ["Stake", "P(loss) %", f"P(ruin) % (-{args.ruin:.0%})", "Backtest ruined"],
+        summary=f"{strategy} RISK BY STAKE SCHEDULE",
+    )
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo robustness of a backtest trade list.")
+    parser.add_argument("--backtest-filename", type=Path, default=TOOLS_DIR.parent / "backtest_results",
+                        help="Backtest result file or directory (default: latest in "
+                             "user_data/backtest_results).")
+    parser.add_argument("--strategy", default=None,
+                        help="Strategy of a multi-strategy result (default: the first).")
+    parser.add_argument("--method", choices=METHODS, default="shuffle",
+                        help="Resampling method (default: shuffle).")
+    parser.add_argument("--samples", type=int, default=SAMPLES,
+                        help=f"Number of resamples (default: {SAMPLES}).")
+    parser.add_argument("--block", type=int, default=10,
+                        help="Trades per block for --method block (default: 10).")
+    parser.add_argument("--stake-scale", type=float, nargs="+", default=[1.0],
+                        help="Stake multipliers to evaluate, e.g. 1 2 3 (default: 1).")
+    parser.add_argument("--dca-scale", type=float, nargs="+", default=[1.0],
+                        help="DCA ladders to evaluate: stake of DCA stage k times F^k, "
+                             "e.g. 1 1.5 2 (default: 1 = as backtested).")
+    parser.add_argument("--compound", action="store_true",
+                        help="Stakes grow / shrink with the equity.")
+    parser.add_argument("--ruin", type=float, default=RUIN,
+                        help=f"Ruin = this fraction of the starting balance lost (default: {RUIN}).")
+    parser.add_argument("--confidence", type=float, default=0.9,
+                        help="Width of the reported interval (default: 0.9 = p5..p95).")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed.")
+    args = parser.parse_args(argv)
+
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+    strategy, balance, profit, stages = load_trades(args.backtest_filename, args.strategy)
+    if len(profit) < 2:
+        parser.error(f"{strategy}: {len(profit)} trades - nothing to resample")
+    logger.info(f"{strategy}: {len(profit)} trades, starting balance {balance:g}")
+    report(strategy, balance, profit, stages, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# ================================================================
+# Multi Backtest – several strategies, one data load
+# ---------------------------------------------------------------
+# - Candles loaded once for all strategies (instead of once per run)
+# - Identical indicator columns (ta.RSI / compute_vwap with the same
+#   period on the same candles) calculated once - indicator_cache.py
+# - Each strategy backtested in its own worker process
+# - Normal freqtrade result tables + strategy summary side by side,
+#   results stored like `freqtrade backtesting` (backtesting-show works)
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/multibacktest.py \
+#     --strategy-list SekkaLong SekkaHour SekkaEma \
+#     --config user_data/config-long.json --timerange 20240101-20251230
+#   (everything not listed in --help goes to freqtrade backtesting)
+# ================================================================
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from freqtrade.util import dt_now
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from backtest_pool import BacktestPool, backtest_config  # noqa: E402
+from indicator_cache import IndicatorCache  # noqa: E402
+
+
+def run_strategy(pool: BacktestPool, name: str) -> dict:
+    start = time.time()
+    content = pool.backtest(name)
+    logger.info(f"{name}: {len(content['results'])} trades in {time.time() - start:.1f}s")
+    return content
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Backtest several strategies over data loaded once.",
+        usage="%(prog)s [options] --strategy-list A B ... --config X [backtesting options]",
+    )
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Strategies backtested in parallel (default: all cores).")
+    args, freqtrade_args = parser.parse_known_args(argv)
+
+    from freqtrade.loggers import setup_logging_pre
+    from freqtrade.optimize.optimize_reports import show_backtest_results, store_backtest_results
+
+    setup_logging_pre()
+    config = backtest_config(freqtrade_args)
+
+    start = time.time()
+    pool = BacktestPool(config, args.processes)
+    names = list(pool.strategies)
+    logger.info(f"Data loaded once for {len(names)} strategies in {time.time() - start:.1f}s")
+
+    # Indicators in this process (shared columns calculated once), backtests in workers
+    with IndicatorCache() as cache:
+        for name in names:
+            cache.install_strategy(pool.strategies[name])
+            pool.analyze(name)
+
+    contents = pool.map(run_strategy, [(name,) for name in names])
+    results = pool.backtest_stats(dict(zip(names, contents)))
+    show_backtest_results(config, results)
+
+    if config.get("export", "none") in ("trades", "signals"):
+        store_backtest_results(config, results, dt_now().strftime("%Y-%m-%d_%H-%M-%S"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# ================================================================
+# ParallelAnalysis – analyze the whitelist on a thread pool (live)
+# ---------------------------------------------------------------
+# After a candle closes freqtrade runs populate_indicators /
+# populate_entry_trend / populate_exit_trend pair after pair before any
+# entry is checked. numpy and talib release the GIL for the heavy part,
+# so pairs can be analyzed side by side:
+# - Every pair with a new candle is analyzed on a bounded thread pool
+# - Results are stored in whitelist order on the bot thread, after all
+#   pairs are done - same dataframes, same order as the sequential loop
+# - Per-pair analysis time logged (slowest pairs at info, all at debug)
+#
+# Only live / dry-run (IStrategy.analyze). Installed with
+# launcher.py --parallel-analysis N.
+# ================================================================
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+logger = logging.getLogger(__name__)
+
+SLOWEST = 3   # pairs named in the timing line
+
+
+class ParallelAnalysis:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analyze")
+
+    @staticmethod
+    def run(strategy, pair: str, dataframe):
+        """
+        analyze_ticker of one pair (thread pool side, no shared state written).
+        """
+        from freqtrade.strategy.strategy_validation import StrategyResultValidator
+        from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
+
+        start = time.perf_counter()
+        validator = StrategyResultValidator(dataframe, warn_only=strategy.disable_dataframe_checks)
+        dataframe = strategy_safe_wrapper(strategy.analyze_ticker, message="")(
+            dataframe, {"pair": pair}
+        )
+        validator.assert_df(dataframe)
+        return dataframe, time.perf_counter() - start
+
+    def analyze(self, strategy, pairs: list[str]) -> None:
+        """
+        IStrategy.analyze / analyze_pair / _analyze_ticker_internal with the
+        analysis itself on the pool.
+        """
+        from freqtrade.enums import CandleType
+        from freqtrade.exceptions import StrategyError
+
+        if strategy._ft_informative_cache is not None:
+            strategy._ft_informative_cache.expire()
+
+        candle_type = strategy.config.get("candle_type_def", CandleType.SPOT)
+        last_seen = strategy._IStrategy__last_candle_seen_per_pair
+        dp = strategy.dp
+        started = time.perf_counter()
+        jobs = []
+        for pair in pairs:
+            dataframe = dp.ohlcv(pair, strategy.timeframe, candle_type=candle_type)
+            if dataframe is None or dataframe.empty:
+                logger.warning("Empty candle (OHLCV) data for pair %s", pair)
+                continue
+            last_date = dataframe.iloc[-1]["date"]
+            new_candle = last_seen.get(pair, None) != last_date
+            if strategy.process_only_new_candles and not new_candle:
+                continue
+            future = self.executor.submit(self.run, strategy, pair, dataframe)
+            jobs.append((pair, last_date, new_candle, future))
+
+        timings = {}
+        for pair, last_date, new_candle, future in jobs:
+            try:
+                dataframe, seconds = future.result()
+            except StrategyError as error:
+                logger.warning(f"Unable to analyze candle (OHLCV) data for pair {pair}: {error}")
+                continue
+            last_seen[pair] = last_date
+            dp._set_cached_df(pair, strategy.timeframe, dataframe, candle_type=candle_type)
+            dp._emit_df((pair, strategy.timeframe, candle_type), dataframe, new_candle)
+            if dataframe.empty:
+                logger.warning("Empty dataframe for pair %s", pair)
+            timings[pair] = seconds
+            logger.debug(f"Analyzed {pair} in {seconds * 1000:.0f} ms")
+
+        if timings:
+            slowest = sorted(timings.items(), key=lambda t: t[1], reverse=True)[:SLOWEST]
+            logger.info(
+                f"Parallel analysis: {len(timings)} pairs in "
+                f"{(time.perf_counter() - started) * 1000:.0f} ms on {self.workers} threads "
+                f"(sum {sum(timings.values()) * 1000:.0f} ms, slowest "
+                + ", ".join(f"{p} {s * 1000:.0f} ms" for p, s in slowest) + ")"
+            )
+
+
+def install(workers: int) -> ParallelAnalysis:
+    from freqtrade.strategy import IStrategy
+
+    parallel = ParallelAnalysis(workers)
+
+    def analyze_parallel(self, pairs: list[str]) -> None:
+        parallel.analyze(self, pairs)
+
+    IStrategy.analyze = analyze_parallel
+    return parallel
@@ -0,0 +1,251 @@
+# ================================================================
+# Plot Export – plot-dataframe for multi-year ranges
+# ---------------------------------------------------------------
+# freqtrade plot-dataframe writes every candle and every indicator value
+# into one HTML file: 4 years of 5m candles are 400k candles per pair and
+# the browser stalls. This writes the same plots (strategy plot_config,
+# --indicators1/2, backtest or DB trades), but
+# - one file per pair and calendar year
+# - series downsampled with largest-triangle-three-buckets (LTTB): at most
+#   --points points per plotted column (close and every plot_config /
+#   indicator column, each keeps its own peaks and troughs), the union of
+#   those candles is kept
+# - the candles in between are merged into the kept one (open / close at
+#   the ends, high / low / volume over the run) - no wick gets lost, entry
+#   and exit signals in a merged run show on the kept candle
+# - candles with a trade entry, DCA fill or exit stay at full resolution,
+#   DCA fills get their own markers
+# - plotly.js written once per directory, not embedded into every file
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/plot_export.py --strategy SekkaLong --config user_data/config-long.json \
+#     --timerange 20220101-20251230 -p BTC/USDT ETH/USDT --timeframe 5m
+#   (everything not listed in --help goes to freqtrade plot-dataframe)
+# ================================================================
+
+import argparse
+import copy
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+POINTS = 2000
+SIGNALS = ("enter_long", "exit_long", "enter_short", "exit_short")
+
+
+# ------------------ Downsampling ------------------
+def lttb(y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Indexes of the `points` values of y (equally spaced) that keep its visual
+    shape - Steinarsson's largest-triangle-three-buckets. NaN values are skipped.
+    """
+    valid = np.flatnonzero(np.isfinite(y))
+    n = len(valid)
+    if points < 3 or n <= points:
+        return valid
+    y = y[valid]
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(points - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point after the last bucket)
+        if i + 2 < len(edges):
+            next_x, next_y = (end + edges[i + 2] - 1) / 2, y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = n - 1, y[n - 1]
+        x = np.arange(start, end)
+        area = np.abs((a - next_x) * (y[start:end] - y[a]) - (a - x) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return valid[selected]
+
+
+def keep_rows(data: pd.DataFrame, columns: list[str], points: int, pinned: np.ndarray) -> np.ndarray:
+    """
+    Sorted candle positions to keep: LTTB of every column + pinned candles,
+    which also keep the candle after them (their own run is one candle).
+    """
+    n = len(data)
+    keep = [np.array([0]), pinned, np.minimum(pinned + 1, n - 1)]
+    for column in columns:
+        keep.append(lttb(data[column].to_numpy(dtype=np.float64, na_value=np.nan), points))
+    return np.unique(np.concatenate(keep))
+
+
+def merge_runs(data: pd.DataFrame, keep: np.ndarray) -> pd.DataFrame:
+    """
+    One candle per kept position, covering the candles up to the next one.
+    Indicator columns keep their value at the kept candle.
+    """
+    last = np.r_[keep[1:] - 1, len(data) - 1]
+    merged = data.iloc[keep].copy()
+    merged["high"] = np.fmax.reduceat(data["high"].to_numpy(dtype=np.float64), keep)
+    merged["low"] = np.fmin.reduceat(data["low"].to_numpy(dtype=np.float64), keep)
+    merged["close"] = data["close"].to_numpy()[last]
+    merged["volume"] = np.add.reduceat(data["volume"].fillna(0).to_numpy(dtype=np.float64), keep)
+    for column in SIGNALS:
+        if column in data.columns:
+            merged[column] = np.fmax.reduceat(
+                data[column].to_numpy(dtype=np.float64, na_value=np.nan), keep
+            )
+    return merged.reset_index(drop=True)
+
+
+# ------------------ Plot ------------------
+def plotted_columns(data: pd.DataFrame, plot_config: dict) -> list[str]:
+    """
+    close + numeric columns drawn by the plot config (main plot, subplots, fill_to).
+    """
+    names = ["close", "bb_lowerband", "bb_upperband"]
+    for indicators in [plot_config["main_plot"], *plot_config["subplots"].values()]:
+        for name, conf in indicators.items():
+            names += [name, conf.get("fill_to")]
+    return [
+        n for n in dict.fromkeys(names)
+        if n in data.columns and pd.api.types.is_numeric_dtype(data[n])
+    ]
+
+
+def dca_fills(trades: pd.DataFrame) -> pd.DataFrame:
+    """
+    Entry fills after the first one (DCA) of the trades: date, rate, stage.
+    """
+    rows = []
+    if "orders" in trades.columns:
+        for orders in trades["orders"].dropna():
+            entries = [o for o in orders if o.get("ft_is_entry") and o.get("order_filled_timestamp")]
+            for stage, order in enumerate(entries[1:], start=1):
+                rows.append((order["order_filled_timestamp"], order["safe_price"], stage))
+    fills = pd.DataFrame(rows, columns=["date", "rate", "stage"])
+    fills["date"] = pd.to_datetime(fills["date"], unit="ms", utc=True)
+    return fills
+
+
+def pinned_rows(dates: pd.Series, trades: pd.DataFrame, fills: pd.DataFrame) -> np.ndarray:
+    """
+    Positions of the candles a trade opened, filled a DCA order or closed in.
+    """
+    times = [fills["date"]]
+    if not trades.empty:
+        times += [trades["open_date"], trades["close_date"]]
+    times = pd.concat(times).dropna()
+    if times.empty:
+        return np.array([], dtype=np.int64)
+    pos = dates.searchsorted(times, side="right") - 1
+    return np.unique(pos[(pos >= 0) & (pos < len(dates))])
+
+
+def year_figure(pair: str, data: pd.DataFrame, trades: pd.DataFrame, fills: pd.DataFrame,
+                plot_config: dict, points: int):
+    from plotly import graph_objects as go
+
+    from freqtrade.plot.plotting import generate_candlestick_graph
+
+    pinned = pinned_rows(data["date"], trades, fills)
+    keep = keep_rows(data, plotted_columns(data, plot_config), points, pinned)
+    merged = merge_runs(data, keep)
+    fig = generate_candlestick_graph(pair=pair, data=merged, trades=trades.copy(),
+                                     plot_config=copy.deepcopy(plot_config))
+    if not fills.empty:
+        fig.add_trace(go.Scatter(
+            x=fills["date"], y=fills["rate"], mode="markers", name="DCA fill",
+            text=[f"DCA {s}" for s in fills["stage"]],
+            marker={"symbol": "diamond-open", "size": 8, "line": {"width": 2}, "color": "orange"},
+        ), 1, 1)
+    return fig, len(merged)
+
+
+def export_pair(pair: str, data: pd.DataFrame, trades: pd.DataFrame, plot_config: dict,
+                timeframe: str, directory: Path, points: int) -> list[Path]:
+    from freqtrade.plot.plotting import generate_plot_filename
+
+    fills = dca_fills(trades)
+    name = generate_plot_filename(pair, timeframe).removesuffix(".html")
+    years = data["date"].dt.year
+    paths = []
+    for year in years.unique():
+        chunk = data[years == year].reset_index(drop=True)
+        start = chunk["date"].iloc[0]
+        end = pd.Timestamp(year=int(year) + 1, month=1, day=1, tz="UTC")
+        chunk_trades = trades[(trades["open_date"] >= start) & (trades["open_date"] < end)] \
+            if not trades.empty else trades
+        chunk_fills = fills[(fills["date"] >= start) & (fills["date"] < end)]
+        fig, candles = year_figure(pair, chunk, chunk_trades, chunk_fills, plot_config, points)
+        fig["layout"].update(title=f"{pair} {year}")
+        path = directory / f"{name}-{year}.html"
+        fig.write_html(path, include_plotlyjs="directory")
+        paths.append(path)
+        logger.info(f"{pair} {year}: {len(chunk)} -> {candles} candles, "
+                    f"{len(chunk_trades)} trades, {path.stat().st_size / 1e6:.1f} MB")
+    return paths
+
+
+# ------------------ Main ------------------
+def plot_config_of(config: dict, strategy) -> dict:
+    from freqtrade.plot.plotting import create_plotconfig
+
+    return create_plotconfig(
+        config.get("indicators1", []), config.get("indicators2", []),
+        copy.deepcopy(getattr(strategy, "plot_config", None) or {}),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="plot-dataframe with per-year files and downsampled series.",
+        usage="%(prog)s [options] --strategy X --config Y [plot-dataframe options]",
+    )
+    parser.add_argument("--points", type=int, default=POINTS,
+                        help=f"Points per plotted column and year (default: {POINTS}).")
+    args, freqtrade_args = parser.parse_known_args(argv)
+
+    from datetime import UTC, datetime
+
+    from freqtrade.commands import Arguments
+    from freqtrade.configuration import setup_utils_configuration
+    from freqtrade.data.converter import trim_dataframe
+    from freqtrade.data.dataprovider import DataProvider
+    from freqtrade.enums import RunMode
+    from freqtrade.loggers import setup_logging_pre
+    from freqtrade.plot.plotting import init_plotscript
+    from freqtrade.resolvers import ExchangeResolver, StrategyResolver
+    from freqtrade.strategy import IStrategy
+    from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
+
+    setup_logging_pre()
+    config = setup_utils_configuration(
+        Arguments(["plot-dataframe", *freqtrade_args]).get_parsed_arg(), RunMode.PLOT
+    )
+    strategy = StrategyResolver.load_strategy(config)
+    exchange = ExchangeResolver.load_exchange(config)
+    IStrategy.dp = DataProvider(config, exchange)
+    strategy.ft_bot_start()
+    strategy_safe_wrapper(strategy.bot_loop_start)(current_time=datetime.now(UTC))
+    elements = init_plotscript(config, list(exchange.markets), strategy.startup_candle_count)
+    plot_config = plot_config_of(config, strategy)
+    directory = config["user_data_dir"] / "plot"
+    directory.mkdir(parents=True, exist_ok=True)
+
+    trades = elements["trades"]
+    files = []
+    start = time.time()
+    for pair, data in elements["ohlcv"].items():
+        analyzed = trim_dataframe(strategy.analyze_ticker(data, {"pair": pair}), elements["timerange"])
+        if analyzed.empty:
+            continue
+        pair_trades = trades.loc[trades["pair"] == pair] if not trades.empty else trades
+        files += export_pair(pair, analyzed, pair_trades, plot_config,
+                             config["timeframe"], directory, args.points)
+    logger.info(f"{len(files)} plot files in {directory} ({time.time() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
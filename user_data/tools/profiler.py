@@ -0,0 +1,279 @@
+# ================================================================
+# Profiler – sampling profiler for hyperopt (opt-in)
+# ---------------------------------------------------------------
+# epochs/min in hyperopt.log says a run is slow, not where the time goes.
+# - A sampler thread in every worker process records the stack of the
+#   thread running an epoch HZ times per second (idle workers are not
+#   sampled); the parent samples prepare_hyperopt_data (data load,
+#   indicators) the same way
+# - Installed on the HyperOptimizer instance (instance attribute, travels
+#   with it into the workers like signal_index.py); each process rewrites
+#   its own <pid>.collapsed after every epoch
+# - After the run the parent merges them next to the results:
+#   - <results>.collapsed: one "frame;frame;... count" line per stack
+#     (flamegraph.pl / speedscope / inferno)
+#   - <results>.profile.txt: time per category (loss, indicators,
+#     callbacks, freqtrade, other) + top-N functions (self / total)
+# - One stack walk per sample: ~0.2% of a worker at 100 Hz, fine to
+#   leave on for a 100-epoch sample run
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/launcher.py --profile hyperopt --strategy OptLong -e 100 ...
+#   python3 user_data/tools/profiler.py user_data/hyperopt_results/strategy_OptLong_<date>.collapsed
+# ================================================================
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+HZ = 100
+TOP = 25
+CATEGORIES = ("loss", "indicators", "callbacks", "freqtrade", "other")
+
+
+# ------------------ Sampler ------------------
+def frame_label(code) -> str:
+    """
+    "function (package/module.py:line)" - no ';', that separates frames.
+    Paths outside site-packages / user_data keep their parent directory.
+    """
+    path = code.co_filename.replace("\\", "/")
+    for marker in ("site-packages/", "user_data/"):
+        if marker in path:
+            path = path.split(marker, 1)[1]
+            break
+    else:
+        path = "/".join(path.rsplit("/", 2)[-2:])
+    return f"{code.co_name} ({path}:{code.co_firstlineno})".replace(";", ",")
+
+
+class Sampler:
+    """
+    One per process: samples the thread inside sampling(), nothing otherwise.
+    """
+
+    def __init__(self, hz: int):
+        self.interval = 1 / hz
+        self.stacks: Counter = Counter()
+        self._target: tuple[int, str] | None = None   # (thread ident, phase)
+        self._labels: dict = {}
+        threading.Thread(target=self._run, name="profiler", daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            target = self._target
+            if target is None:
+                continue
+            frame = sys._current_frames().get(target[0])
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                label = self._labels.get(code)
+                if label is None:
+                    label = self._labels[code] = frame_label(code)
+                stack.append(label)
+                frame = frame.f_back
+            stack.append(target[1])
+            self.stacks[";".join(reversed(stack))] += 1
+
+    @contextmanager
+    def sampling(self, phase: str):
+        self._target = (threading.get_ident(), phase)
+        try:
+            yield
+        finally:
+            self._target = None
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text("".join(f"{stack} {n}\n" for stack, n in self.stacks.copy().items()))
+        tmp.replace(path)
+
+
+_sampler: Sampler | None = None
+
+
+def get_sampler(hz: int) -> Sampler:
+    global _sampler
+    if _sampler is None:
+        _sampler = Sampler(hz)
+    return _sampler
+
+
+class Profiler:
+    """
+    Installed on one HyperOptimizer instance.
+    """
+
+    def __init__(self, hyperopter, directory: Path, hz: int):
+        self.hyperopter = hyperopter
+        self.directory = directory
+        self.hz = hz
+
+    @classmethod
+    def install(cls, hyperopter, directory: Path, hz: int) -> "Profiler":
+        profiler = cls(hyperopter, directory, hz)
+        hyperopter.generate_optimizer = profiler.generate_optimizer
+        hyperopter.prepare_hyperopt_data = profiler.prepare_hyperopt_data
+        return profiler
+
+    def _run(self, phase: str, method: str, *args):
+        hyperopter = self.hyperopter
+        sampler = get_sampler(self.hz)
+        try:
+            with sampler.sampling(phase):
+                return getattr(type(hyperopter), method)(hyperopter, *args)
+        finally:
+            sampler.write(self.directory / f"{os.getpid()}.collapsed")
+
+    def generate_optimizer(self, params_dict: dict) -> dict:
+        return self._run("epoch", "generate_optimizer", params_dict)
+
+    def prepare_hyperopt_data(self) -> None:
+        return self._run("prepare", "prepare_hyperopt_data")
+
+
+# ------------------ Report ------------------
+def read_collapsed(paths) -> Counter:
+    stacks: Counter = Counter()
+    for path in paths:
+        for line in Path(path).read_text().splitlines():
+            stack, _, n = line.rpartition(" ")
+            if stack:
+                stacks[stack] += int(n)
+    return stacks
+
+
+def frame_path(label: str) -> str:
+    return label.rpartition(" (")[2]
+
+
+def category(frames: list[str]) -> str:
+    paths = [frame_path(f) for f in frames]
+    if any(p.startswith(("hyperopts/", "freqtrade/optimize/hyperopt_loss/")) for p in paths):
+        return "loss"
+    strategy = [f for f, p in zip(frames, paths) if p.startswith("strategies/")]
+    if any(f.startswith("populate_") for f in strategy):
+        return "indicators"
+    if strategy:
+        return "callbacks"
+    if any(p.startswith("freqtrade/") for p in paths):
+        return "freqtrade"
+    return "other"
+
+
+def summarize(stacks: Counter, top: int = TOP) -> dict:
+    """
+    Samples per phase / category and the top functions by self and total samples.
+    """
+    phases: Counter = Counter()
+    categories: Counter = Counter()
+    own: Counter = Counter()
+    total: Counter = Counter()
+    for stack, n in stacks.items():
+        phase, *frames = stack.split(";")
+        phases[phase] += n
+        categories[category(frames)] += n
+        if frames:
+            own[frames[-1]] += n
+        for frame in set(frames):
+            total[frame] += n
+    return {
+        "samples": sum(phases.values()),
+        "phases": phases,
+        "categories": [(c, categories[c]) for c in CATEGORIES],
+        "self": own.most_common(top),
+        "total": total.most_common(top),
+    }
+
+
+def format_summary(summary: dict) -> str:
+    samples = max(summary["samples"], 1)
+    lines = [f"{summary['samples']} samples - " + ", ".join(
+        f"{phase} {n}" for phase, n in summary["phases"].items()
+    ), "", "Category     Samples      %"]
+    lines += [f"{c:<12} {n:>7} {100 * n / samples:>6.1f}" for c, n in summary["categories"]]
+    for title in ("self", "total"):
+        lines += ["", f"{'Top ' + title:<10} {'Samples':>8} {'%':>6}  Function"]
+        lines += [f"{'':<10} {n:>8} {100 * n / samples:>6.1f}  {f}" for f, n in summary[title]]
+    return "\n".join(lines) + "\n"
+
+
+def merge(directory: Path, target: Path, top: int = TOP) -> dict | None:
+    """
+    Per-process files of `directory` -> <target>.collapsed + <target>.profile.txt.
+    """
+    files = sorted(directory.glob("*.collapsed"))
+    if not files:
+        return None
+    stacks = read_collapsed(files)
+    collapsed = target.with_suffix(".collapsed")
+    collapsed.write_text("".join(f"{stack} {n}\n" for stack, n in stacks.most_common()))
+    summary = summarize(stacks, top)
+    target.with_suffix(".profile.txt").write_text(format_summary(summary))
+    shutil.rmtree(directory, ignore_errors=True)
+    logger.info(f"Profile of {len(files)} processes: {collapsed} ({summary['samples']} samples)")
+    return summary
+
+
+def print_summary(summary: dict) -> None:
+    from freqtrade.util import print_rich_table
+
+    samples = max(summary["samples"], 1)
+    print_rich_table(
+        [[c, n, f"{100 * n / samples:.1f}"] for c, n in summary["categories"]],
+        ["Category", "Samples", "%"], summary="PROFILE BY CATEGORY",
+    )
+    print_rich_table(
+        [[f, n, f"{100 * n / samples:.1f}"] for f, n in summary["self"]],
+        ["Function", "Self samples", "%"], summary="PROFILE TOP FUNCTIONS (self)",
+    )
+
+
+# ------------------ Launcher ------------------
+def install(hz: int = HZ, top: int = TOP) -> None:
+    """
+    Profile every hyperopt run of this process (launcher.py --profile).
+    """
+    from freqtrade.optimize.hyperopt.hyperopt import Hyperopt
+
+    start = Hyperopt.start
+
+    def start_profiled(self) -> None:
+        directory = self.results_file.with_suffix(".profile")
+        Profiler.install(self.hyperopter, directory, hz)
+        logger.info(f"Profiling hyperopt at {hz} Hz")
+        try:
+            start(self)
+        finally:
+            summary = merge(directory, self.results_file, top)
+            if summary:
+                print_summary(summary)
+
+    Hyperopt.start = start_profiled
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Summary of collapsed-stack profiles.")
+    parser.add_argument("files", nargs="+", type=Path, help="*.collapsed files (merged).")
+    parser.add_argument("--top", type=int, default=TOP, help=f"Functions listed (default: {TOP}).")
+    args = parser.parse_args(argv)
+
+    print(format_summary(summarize(read_collapsed(args.files), args.top)), end="")
+
+
+if __name__ == "__main__":
+    main()
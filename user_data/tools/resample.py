@@ -0,0 +1,170 @@
+# ================================================================
+# Resample – derive 15m / 30m / 1h / ... candles from stored 5m data
+# ---------------------------------------------------------------
+# Every extra timeframe used to be another full (rate limited) exchange
+# download. The candles of a coarser timeframe are fully defined by the
+# finer ones, so they are built locally:
+# - Source: finest stored timeframe of the pair that divides the target
+#   (spot and futures candles, standard freqtrade feather files)
+# - open first / high max / low min / close last / volume sum, per bucket
+#   in one numpy pass (reduceat), buckets aligned like the exchange (UTC)
+# - First / last bucket only written when its source candles are complete
+#   (data starting mid-bucket, bucket still open)
+# - Existing files: only the tail from the last stored candle is rebuilt
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/resample.py --timeframes 15m 30m
+#   python3 user_data/tools/resample.py --timeframes 1h --pairs BTC/USDT --trading-mode futures
+# ================================================================
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+DAY = 86400
+
+
+# ------------------ Resample ------------------
+def resample(df: pd.DataFrame, source_seconds: int, target_seconds: int) -> pd.DataFrame:
+    """
+    OHLCV of `df` (sorted, one timeframe) in target buckets. A bucket is only
+    returned when the data covers it from its first to its last source candle.
+    """
+    columns = ["date", "open", "high", "low", "close", "volume"]
+    if df.empty:
+        return df[columns].iloc[:0]
+    dates = df["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    step = np.int64(target_seconds) * 1_000_000_000
+    bucket = dates - dates % step
+
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(dates)] - 1
+    out = pd.DataFrame({
+        "date": pd.to_datetime(bucket[starts], utc=True),
+        "open": df["open"].to_numpy()[starts],
+        "high": np.maximum.reduceat(df["high"].to_numpy(), starts),
+        "low": np.minimum.reduceat(df["low"].to_numpy(), starts),
+        "close": df["close"].to_numpy()[ends],
+        "volume": np.add.reduceat(df["volume"].to_numpy(), starts),
+    })
+    # Last bucket still open in the source data, first one starting mid-bucket
+    last_source_close = dates[-1] + np.int64(source_seconds) * 1_000_000_000
+    last = len(out) - (bucket[-1] + step > last_source_close)
+    first = int(dates[0] != bucket[0])
+    return out.iloc[first:max(first, last)].reset_index(drop=True)
+
+
+def source_timeframe(available: list[str], target: str) -> str | None:
+    """
+    Finest available timeframe that the target is a multiple of.
+    """
+    from freqtrade.exchange import timeframe_to_seconds
+
+    target_seconds = timeframe_to_seconds(target)
+    candidates = [
+        tf for tf in available
+        if timeframe_to_seconds(tf) < target_seconds and target_seconds % timeframe_to_seconds(tf) == 0
+    ]
+    return min(candidates, key=timeframe_to_seconds) if candidates else None
+
+
+def derive(handler, pair: str, source: str, target: str, candle_type) -> tuple[int, int]:
+    """
+    Build / extend the target file of one pair. Returns (new candles, total).
+    """
+    from freqtrade.configuration import TimeRange
+    from freqtrade.exchange import timeframe_to_seconds
+
+    source_seconds = timeframe_to_seconds(source)
+    target_seconds = timeframe_to_seconds(target)
+    load = {"fill_missing": False, "warn_no_data": False}
+
+    existing = handler.ohlcv_load(pair, target, candle_type, **load)
+    source_start = handler.ohlcv_data_min_max(pair, source, candle_type)[0]
+    if len(existing) and existing["date"].iloc[0] <= source_start + pd.Timedelta(seconds=target_seconds):
+        # Rebuild from the last stored candle (it may have been written from partial data)
+        resume = existing["date"].iloc[-1]
+        # A first candle from before the source data was built from part of its bucket
+        keep = existing[(existing["date"] < resume) & (existing["date"] >= source_start)]
+        timerange = TimeRange("date", None, int(resume.timestamp()), 0)
+    else:
+        keep = existing.iloc[:0]
+        timerange = None
+
+    candles = handler.ohlcv_load(pair, source, candle_type, timerange=timerange, **load)
+    tail = resample(candles, source_seconds, target_seconds)
+    data = pd.concat([keep, tail], ignore_index=True) if len(keep) else tail.reset_index(drop=True)
+    if data.empty:
+        return 0, 0
+    new = len(data) - len(existing)
+    handler.ohlcv_store(pair, target, data, candle_type)
+    return new, len(data)
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Derive coarser timeframes from stored candles.",
+    )
+    parser.add_argument("--timeframes", nargs="+", required=True,
+                        help="Timeframes to build, e.g. 15m 30m 1h (up to 1d).")
+    parser.add_argument("--pairs", nargs="+", default=None,
+                        help="Only these pairs (default: every pair with data). "
+                             "Spot notation, futures pairs are matched as PAIR:USDT too.")
+    parser.add_argument("--trading-mode", nargs="+", default=["spot", "futures"],
+                        choices=["spot", "futures"], help="Candle types (default: both).")
+    parser.add_argument("--exchange", default="binance", help="Exchange directory (default: binance).")
+    parser.add_argument("--datadir", type=Path, default=None,
+                        help="Data directory (default: user_data/data/<exchange>).")
+    parser.add_argument("--data-format", default="feather", help="Data format (default: feather).")
+    args = parser.parse_args(argv)
+
+    from freqtrade.data.history.datahandlers import get_datahandler
+    from freqtrade.enums import CandleType, TradingMode
+    from freqtrade.exchange import timeframe_to_seconds
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+    for tf in args.timeframes:
+        if timeframe_to_seconds(tf) > DAY:
+            parser.error(f"{tf}: weekly / monthly candles are not aligned like the exchange")
+
+    datadir = args.datadir or TOOLS_DIR.parent / "data" / args.exchange
+    handler = get_datahandler(datadir, args.data_format)
+    wanted = set(args.pairs or [])
+    started = time.time()
+    files = 0
+
+    for mode in args.trading_mode:
+        trading_mode = TradingMode(mode)
+        candle_type = CandleType.FUTURES if trading_mode == TradingMode.FUTURES else CandleType.SPOT
+        stored: dict[str, list[str]] = {}
+        for pair, timeframe, ctype in handler.ohlcv_get_available_data(datadir, trading_mode):
+            if ctype == candle_type:
+                stored.setdefault(pair, []).append(timeframe)
+
+        for pair in sorted(stored):
+            if wanted and pair not in wanted and pair.split(":")[0] not in wanted:
+                continue
+            for target in args.timeframes:
+                source = source_timeframe(stored[pair], target)
+                if source is None:
+                    logger.warning(f"{pair} {mode}: no finer timeframe than {target} stored, skipped")
+                    continue
+                new, total = derive(handler, pair, source, target, candle_type)
+                files += 1
+                logger.info(f"{pair} {mode} {source} -> {target}: {new:+d} candles ({total} total)")
+
+    logger.info(f"Resampled {files} files in {time.time() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+# ================================================================
+# Sensitivity – how fragile are the chosen parameters
+# ---------------------------------------------------------------
+# hyperopt hands over one point (buy_params / sell_params). Before it
+# goes live, look at its neighbourhood:
+# - one-way: every parameter moved WIDTH grid steps down / up, the
+#   others kept at the optimum
+# - two-way (--two-way): every pair of parameters on a
+#   (2 WIDTH + 1)^2 grid - printed as heatmap tables
+# - Grid steps are the parameter's own hyperopt values (int / decimal
+#   resolution, categories), RealParameter: 10% of its range
+# - Loss (same loss class as hyperopt), profit, trades and drawdown per
+#   point; all points run in parallel over data loaded once
+#   (backtest_pool.py), parameters used in populate_indicators get their
+#   indicators recomputed in the worker
+# - Plateau summary per parameter: worst profit / loss one step away
+#   from the optimum - a plateau keeps both close to the optimum
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/sensitivity.py --width 2 --two-way \
+#     --strategy OptLong --config user_data/config-long.json --timerange 20220101-20251230
+#   python3 user_data/tools/sensitivity.py --params '{"DCA_STEP": 10, "ENTRY_RSI": 45}' ...
+#   (everything not listed in --help goes to freqtrade backtesting)
+# ================================================================
+
+import argparse
+import inspect
+import itertools
+import json
+import logging
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from backtest_pool import BacktestPool, backtest_config, set_params  # noqa: E402
+from walkforward import window_loss  # noqa: E402
+
+
+REAL_STEPS = 10   # RealParameter: grid step = range / REAL_STEPS
+
+
+# ------------------ Grid ------------------
+def parameter_values(param) -> list:
+    """
+    Every value hyperopt can pick for this parameter, in order (RealParameter: None).
+    """
+    from freqtrade.strategy.parameters import (
+        CategoricalParameter,
+        DecimalParameter,
+        IntParameter,
+    )
+
+    if isinstance(param, IntParameter):
+        return list(range(param.low, param.high + 1))
+    if isinstance(param, DecimalParameter):
+        scale = 10 ** param.decimals
+        return [round(n / scale, param.decimals)
+                for n in range(round(param.low * scale), round(param.high * scale) + 1)]
+    if isinstance(param, CategoricalParameter):
+        return list(param.opt_range)
+    return None
+
+
+def neighbours(param, center, width: int) -> list:
+    """
+    Up to `width` grid steps below and above the center, center included.
+    """
+    values = parameter_values(param)
+    if values is None:
+        step = (param.high - param.low) / REAL_STEPS
+        return sorted({
+            round(min(max(center + k * step, param.low), param.high), 10)
+            for k in range(-width, width + 1)
+        })
+    if center in values:
+        i = values.index(center)
+    elif all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        i = int(np.argmin([abs(v - center) for v in values]))
+        values = values[:i] + [center] + values[i + 1:]
+    else:
+        return [center]
+    return values[max(0, i - width):i + width + 1]
+
+
+def indicator_parameters(strategy, names: list[str]) -> list[str]:
+    """
+    Parameters read in populate_indicators - changing them needs new indicators.
+    """
+    try:
+        source = inspect.getsource(type(strategy).populate_indicators)
+    except (OSError, TypeError):
+        return list(names)
+    return [n for n in names if re.search(rf"\bself\.{re.escape(n)}\b", source)]
+
+
+def make_points(grids: dict[str, list], center: dict, two_way: bool) -> list[dict]:
+    """
+    Parameter sets to evaluate: the optimum, each parameter alone, each pair.
+    """
+    points = {json.dumps(center, sort_keys=True): center}
+    for name, values in grids.items():
+        for value in values:
+            point = {**center, name: value}
+            points.setdefault(json.dumps(point, sort_keys=True), point)
+    if two_way:
+        for a, b in itertools.combinations(grids, 2):
+            for va, vb in itertools.product(grids[a], grids[b]):
+                point = {**center, a: va, b: vb}
+                points.setdefault(json.dumps(point, sort_keys=True), point)
+    return list(points.values())
+
+
+# ------------------ Evaluate ------------------
+# Indicator parameter values the worker's analyzed frames were built with
+_indicator_key: dict[str, tuple] = {}
+
+
+def evaluate(pool: BacktestPool, name: str, params: dict, indicator_names: list[str]) -> dict:
+    key = tuple(params[p] for p in indicator_names)
+    if _indicator_key.get(name) != key:
+        strategy = pool.strategies[name]
+        pool.bt._set_strategy(strategy)
+        set_params(strategy, params)
+        pool.analyzed[name] = strategy.advise_all_indicators(pool.data)
+        _indicator_key[name] = key
+    content = pool.backtest(name, params)
+    loss, stats = window_loss(pool, name, content)
+    return {
+        **params,
+        "loss": loss,
+        "trades": stats["total_trades"],
+        "profit": stats["profit_total"],
+        "drawdown": stats["max_relative_drawdown"],
+    }
+
+
+# ------------------ Report ------------------
+def plateau(results: pd.DataFrame, grids: dict[str, list], center: dict) -> list[list]:
+    """
+    Per parameter: optimum vs. the worse of the two direct neighbours, and the
+    spread over the whole one-way grid.
+    """
+    at_center = results.loc[one_way(results, center, None)].iloc[0]
+    rows = []
+    for name, values in grids.items():
+        line = results.loc[one_way(results, center, name)].set_index(name).reindex(values)
+        i = values.index(center[name])
+        near = line.iloc[max(0, i - 1):i + 2].drop(index=center[name], errors="ignore")
+        rows.append([
+            name, center[name], f"{values[0]} .. {values[-1]}",
+            f"{near['profit'].min():.2%}" if len(near) else "-",
+            f"{line['profit'].min():.2%} .. {line['profit'].max():.2%}",
+            f"{near['loss'].max():.5f}" if len(near) else "-",
+            f"{line['loss'].min():.5f} .. {line['loss'].max():.5f}",
+        ])
+    rows.append(["(optimum)", "", "", f"{at_center['profit']:.2%}", "",
+                 f"{at_center['loss']:.5f}", ""])
+    return rows
+
+
+def one_way(results: pd.DataFrame, center: dict, free: str | None) -> pd.Series:
+    mask = pd.Series(True, index=results.index)
+    for name, value in center.items():
+        if name != free:
+            mask &= results[name] == value
+    return mask
+
+
+def heatmap(results: pd.DataFrame, center: dict, a: str, b: str, grids: dict, metric: str) -> list[list]:
+    fixed = one_way(results, {k: v for k, v in center.items() if k != b}, a)
+    table = results[fixed].pivot_table(index=a, columns=b, values=metric, aggfunc="first")
+    table = table.reindex(index=grids[a], columns=grids[b])
+    fmt = "{:.2%}" if metric in ("profit", "drawdown") else "{:.5f}"
+    rows = []
+    for va, row in table.iterrows():
+        cells = []
+        for vb, value in row.items():
+            text = "-" if pd.isna(value) else fmt.format(value)
+            cells.append(f"[{text}]" if va == center[a] and vb == center[b] else text)
+        rows.append([va, *cells])
+    return rows
+
+
+def show(name: str, results: pd.DataFrame, grids: dict, center: dict, two_way: bool,
+         metric: str) -> None:
+    from freqtrade.util import print_rich_table
+
+    for param, values in grids.items():
+        line = results.loc[one_way(results, center, param)].set_index(param).reindex(values)
+        print_rich_table(
+            [[f"[{v}]" if v == center[param] else v, f"{r['loss']:.5f}", f"{r['profit']:.2%}",
+              int(r["trades"]), f"{r['drawdown']:.2%}"] for v, r in line.iterrows()],
+            [param, "Loss", "Profit", "Trades", "Max DD"],
+            summary=f"{name} SENSITIVITY {param}",
+        )
+    if two_way:
+        for a, b in itertools.combinations(grids, 2):
+            print_rich_table(
+                heatmap(results, center, a, b, grids, metric),
+                [f"{a} \\ {b}", *map(str, grids[b])],
+                summary=f"{name} {metric.upper()} {a} x {b}",
+            )
+    print_rich_table(
+        plateau(results, grids, center),
+        ["Parameter", "Optimum", "Grid", "Worst profit +-1", "Profit range",
+         "Worst loss +-1", "Loss range"],
+        summary=f"{name} PLATEAU (optimum in brackets above)",
+    )
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Parameter sensitivity around an optimum.",
+        usage="%(prog)s [options] --strategy X --config Y --timerange Z [backtesting options]",
+    )
+    parser.add_argument("--params", default=None,
+                        help="Optimum as JSON (default: the strategy's current values, "
+                             "i.e. buy_params / sell_params / strategy json).")
+    parser.add_argument("--parameters", nargs="+", default=None,
+                        help="Only these parameters (default: every optimized one in --spaces).")
+    parser.add_argument("--spaces", nargs="+", default=["buy", "sell"],
+                        help="Parameter spaces (default: buy sell).")
+    parser.add_argument("--width", type=int, default=2,
+                        help="Grid steps on each side of the optimum (default: 2).")
+    parser.add_argument("--two-way", action="store_true",
+                        help="Also every pair of parameters on a 2D grid.")
+    parser.add_argument("--heatmap", choices=["profit", "loss", "drawdown"], default="profit",
+                        help="Value shown in the 2D tables (default: profit).")
+    parser.add_argument("--hyperopt-loss", default="ZeroLossMaxTrades",
+                        help="Hyperopt loss class (default: ZeroLossMaxTrades).")
+    parser.add_argument("--min-trades", type=int, default=1,
+                        help="Points with fewer trades get the maximum loss (default: 1).")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Backtests in parallel (default: all cores).")
+    parser.add_argument("--no-skip-idle", action="store_true",
+                        help="Simulate every candle (see signal_index.py).")
+    args, freqtrade_args = parser.parse_known_args(argv)
+
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+    config = backtest_config(freqtrade_args)
+    config["hyperopt_loss"] = args.hyperopt_loss
+    config["hyperopt_min_trades"] = args.min_trades
+
+    pool = BacktestPool(config, args.processes, skip_idle=not args.no_skip_idle)
+    if len(pool.strategies) != 1:
+        parser.error("sensitivity needs exactly one --strategy")
+    name, strategy = next(iter(pool.strategies.items()))
+    pool.bt._set_strategy(strategy)
+
+    parameters = {
+        pname: param for pname, param in strategy.enumerate_parameters()
+        if (pname in args.parameters if args.parameters else param.optimize and param.space in args.spaces)
+    }
+    if not parameters:
+        parser.error("no parameters to vary")
+    loaded = {pname: param.value for pname, param in strategy.enumerate_parameters()}
+    center = {**loaded, **json.loads(args.params or "{}")}
+    grids = {pname: neighbours(param, center[pname], args.width) for pname, param in parameters.items()}
+
+    indicator_names = indicator_parameters(strategy, list(center))
+    # Frames analyzed by the pool belong to the loaded values
+    _indicator_key[name] = tuple(loaded[p] for p in indicator_names)
+    points = make_points(grids, center, args.two_way)
+    points.sort(key=lambda p: json.dumps([p[n] for n in indicator_names]))
+    logger.info(
+        f"{len(points)} backtests: " + ", ".join(f"{k} {v}" for k, v in grids.items())
+        + (f" (indicators recomputed for {', '.join(indicator_names)})" if indicator_names else "")
+    )
+
+    start = time.time()
+    rows = pool.map(evaluate, [(name, p, indicator_names) for p in points])
+    logger.info(f"{len(points)} backtests in {time.time() - start:.0f}s")
+    results = pd.DataFrame(rows)
+    show(name, results, grids, center, args.two_way, args.heatmap)
+
+    out_dir = config["user_data_dir"] / "backtest_results"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = out_dir / f"sensitivity-{name}-{datetime.now():%Y-%m-%d_%H-%M-%S}"
+    results.to_csv(f"{stem}.csv", index=False)
+    Path(f"{stem}.json").write_text(json.dumps({
+        "strategy": name,
+        "optimum": {k: center[k] for k in parameters},
+        "grids": grids,
+        "hyperopt_loss": args.hyperopt_loss,
+        "two_way": args.two_way,
+    }, indent=2, default=str))
+    print(f"Results: {stem}.csv")
+
+
+if __name__ == "__main__":
+    main()
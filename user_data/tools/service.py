@@ -0,0 +1,262 @@
+# ================================================================
+# Freqtrade Service – resident process for quick repeated commands
+# ---------------------------------------------------------------
+# - freqtrade, talib, pandas imported once
+# - Candle files cached in memory (re-read when the file changes)
+# - Exchange markets cached (no market download per backtest)
+# - Strategies are still resolved per job, so edits are picked up
+#
+# Jobs run one at a time, output is streamed back to the client.
+# The client part is stdlib only and also works from the host.
+#
+# Usage:
+#   docker compose up -d ftservice                          # start the service
+#   python3 user_data/tools/service.py backtesting --strategy SekkaLong --config user_data/config-long.json
+#   python3 user_data/tools/service.py hyperopt-show --best --print-json --config user_data/config-long.json
+#   python3 user_data/tools/service.py status
+# ================================================================
+
+import contextlib
+import io
+import logging
+import os
+import signal
+import sys
+import time
+from collections import OrderedDict
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+USER_DATA = Path(__file__).resolve().parents[1]
+SOCKET = USER_DATA / "freqtrade.sock"
+
+# Commands that finish by themselves - no trade / webserver / hyperopt in here
+ALLOWED = {
+    "backtesting", "backtesting-show", "backtesting-analysis", "lookahead-analysis",
+    "hyperopt-show", "hyperopt-list", "plot-dataframe", "plot-profit",
+    "download-data", "list-data", "convert-data",
+}
+
+MARKETS_TTL = 3600  # seconds
+
+
+# ------------------ Caches ------------------
+class CandleCache:
+    """
+    Whole candle files, keyed by file and mtime. LRU, limited by memory.
+    The data handlers trim to the requested timerange afterwards.
+    """
+
+    def __init__(self, max_mb: int):
+        self.max_bytes = max_mb * 1024 * 1024
+        self.frames: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return sum(df.memory_usage(index=False).sum() for df in self.frames.values())
+
+    def install(self) -> None:
+        from freqtrade.data.history.datahandlers.arrowdatahandler import ArrowDataHandler
+        from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler
+
+        for cls in (ArrowDataHandler, JsonDataHandler):
+            cls._ohlcv_load = self._wrap(cls._ohlcv_load)
+
+    def _wrap(self, ohlcv_load):
+        cache = self
+
+        def _ohlcv_load_cached(handler, pair, timeframe, timerange, candle_type):
+            filename = handler._pair_data_filename(handler._datadir, pair, timeframe, candle_type)
+            try:
+                key = (str(filename), filename.stat().st_mtime_ns)
+            except OSError:
+                return ohlcv_load(handler, pair, timeframe, timerange, candle_type)
+
+            if key in cache.frames:
+                cache.hits += 1
+                cache.frames.move_to_end(key)
+            else:
+                cache.misses += 1
+                cache.frames[key] = ohlcv_load(handler, pair, timeframe, None, candle_type)
+                # Older versions of the same file and least recently used files go
+                for old in [k for k in cache.frames if k[0] == key[0] and k != key]:
+                    del cache.frames[old]
+                while len(cache.frames) > 1 and cache.size > cache.max_bytes:
+                    cache.frames.popitem(last=False)
+            return cache.frames[key].copy()
+
+        return _ohlcv_load_cached
+
+
+def install_markets_cache() -> dict:
+    """
+    Keep markets per exchange for MARKETS_TTL instead of downloading them for every job.
+    """
+    from freqtrade.exchange.exchange import Exchange
+
+    markets: dict = {}
+    reload_markets = Exchange._api_reload_markets
+
+    async def _api_reload_markets_cached(self, reload: bool = False) -> None:
+        key = (self._api_async.id, str(self.trading_mode))
+        cached = markets.get(key)
+        if cached and time.time() - cached["time"] < MARKETS_TTL:
+            self._api_async.set_markets(cached["markets"], cached["currencies"])
+            return
+        result = await reload_markets(self, reload)
+        if self._api_async.markets:
+            markets[key] = {
+                "markets": self._api_async.markets,
+                "currencies": self._api_async.currencies,
+                "time": time.time(),
+            }
+        return result
+
+    Exchange._api_reload_markets = _api_reload_markets_cached
+    return markets
+
+
+# ------------------ Server ------------------
+class StreamWriter(io.TextIOBase):
+    """
+    File-like object sending everything written to the client.
+    """
+
+    def __init__(self, conn, kind: str):
+        self.conn = conn
+        self.kind = kind
+
+    def write(self, text: str) -> int:
+        if text:
+            self.conn.send((self.kind, text))
+        return len(text)
+
+    def isatty(self) -> bool:
+        return False
+
+
+def run_job(argv: list[str]) -> int:
+    from freqtrade.commands import Arguments
+    from freqtrade.exceptions import ConfigurationError, FreqtradeException
+
+    try:
+        args = Arguments(argv).get_parsed_arg()
+        if "func" not in args:
+            raise FreqtradeException("No freqtrade subcommand given.")
+        return args["func"](args) or 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except (ConfigurationError, FreqtradeException) as e:
+        logger.error(str(e))
+        return 2
+    except Exception:
+        logger.exception("Fatal exception!")
+        return 1
+
+
+def serve(socket_path: Path, cache_mb: int) -> None:
+    from freqtrade.loggers import setup_logging_pre
+    from freqtrade.system import asyncio_setup, gc_set_threshold
+
+    setup_logging_pre()
+    asyncio_setup()
+    gc_set_threshold()
+
+    candles = CandleCache(cache_mb)
+    candles.install()
+    markets = install_markets_cache()
+
+    socket_path.unlink(missing_ok=True)
+    listener = Listener(str(socket_path), family="AF_UNIX")
+    os.chmod(socket_path, 0o660)
+    # docker stop -> SIGTERM -> exit through finally (removes the socket)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    started = time.time()
+    jobs = 0
+    logger.info(f"Service listening on {socket_path}")
+
+    try:
+        while True:
+            conn = listener.accept()
+            try:
+                kind, argv = conn.recv()
+                if kind == "status":
+                    conn.send(("out", (
+                        f"Up {(time.time() - started) / 60:.0f} min, {jobs} jobs\n"
+                        f"Candle cache: {len(candles.frames)} files, "
+                        f"{candles.size / 1024 / 1024:.0f} MB, "
+                        f"{candles.hits} hits / {candles.misses} misses\n"
+                        f"Markets cached: {', '.join(k[0] + ' ' + k[1] for k in markets) or '-'}\n"
+                    )))
+                    conn.send(("exit", 0))
+                    continue
+
+                if not argv or argv[0] not in ALLOWED:
+                    conn.send(("err", f"Not allowed in the service: {' '.join(argv[:1])}. "
+                                      f"Allowed: {', '.join(sorted(ALLOWED))}\n"))
+                    conn.send(("exit", 2))
+                    continue
+
+                jobs += 1
+                logger.info(f"Job {jobs}: freqtrade {' '.join(argv)}")
+                start = time.time()
+                with contextlib.redirect_stdout(StreamWriter(conn, "out")), \
+                        contextlib.redirect_stderr(StreamWriter(conn, "err")):
+                    code = run_job(argv)
+                logger.info(f"Job {jobs} finished with {code} in {time.time() - start:.1f}s")
+                conn.send(("exit", code))
+            except (EOFError, OSError):
+                # Client went away (Ctrl+C) - next job
+                logger.warning("Client disconnected")
+            finally:
+                conn.close()
+    finally:
+        listener.close()
+        socket_path.unlink(missing_ok=True)
+
+
+# ------------------ Client ------------------
+def call(socket_path: Path, kind: str, argv: list[str]) -> int:
+    try:
+        conn = Client(str(socket_path), family="AF_UNIX")
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.stderr.write(f"Service not running ({socket_path}). "
+                         "Start it with: docker compose up -d ftservice\n")
+        return 255
+
+    conn.send((kind, argv))
+    while True:
+        try:
+            stream, payload = conn.recv()
+        except EOFError:
+            sys.stderr.write("Service closed the connection\n")
+            return 1
+        if stream == "exit":
+            return payload
+        out = sys.stdout if stream == "out" else sys.stderr
+        out.write(payload)
+        out.flush()
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    socket_path = Path(os.environ.get("FREQ_SERVICE_SOCKET", SOCKET))
+
+    if argv[:1] == ["serve"]:
+        cache_mb = int(os.environ.get("FREQ_SERVICE_CACHE_MB", 2048))
+        serve(socket_path, cache_mb)
+    elif argv[:1] == ["status"]:
+        sys.exit(call(socket_path, "status", []))
+    elif not argv or argv[0] in ("-h", "--help"):
+        print("Usage: service.py serve | status | <freqtrade subcommand> [options]")
+    else:
+        sys.exit(call(socket_path, "run", argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+# ================================================================
+# Sharded Backtest – one strategy, pairs split over worker processes
+# ---------------------------------------------------------------
+# For strategies that budget per pair (SekkaPerps: free balance / pairs,
+# SekkaHour: total balance / max trades) pairs barely interact, so they
+# can be simulated in groups:
+# - Pairs split into shards, one worker process per shard
+# - Every shard gets a fixed share of the wallet and of max_open_trades
+#   (share = shard pairs / all pairs), also in config["max_open_trades"]
+#   for stake code that reads it
+# - Trades merged, wallet history summed, normal freqtrade result tables
+# - Warnings where the coupled run (all pairs, one wallet) could differ
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/sharded_backtest.py --shards 4 \
+#     --strategy SekkaPerps --config user_data/config-perps.json --timerange 20240101-20251230
+#   (everything not listed in --help goes to freqtrade backtesting)
+# ================================================================
+
+import argparse
+import logging
+import math
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from backtest_pool import BacktestPool, backtest_config  # noqa: E402
+
+
+COUNTERS = (
+    "rejected_signals", "timedout_entry_orders", "timedout_exit_orders",
+    "canceled_trade_entries", "canceled_entry_orders", "replaced_entry_orders",
+)
+WALLET_USE_WARNING = 0.9   # shard had more than this share of its wallet in trades
+PROFIT_WARNING = 0.1       # compounding across pairs matters from here on
+
+
+# ------------------ Shards ------------------
+def make_shards(pool: BacktestPool, count: int) -> list[list[str]]:
+    """
+    Pairs spread over `count` shards, longest histories first, so shards get
+    about the same number of candles.
+    """
+    pairs = sorted(pool.data, key=lambda p: len(pool.data[p]), reverse=True)
+    shards: list[list[str]] = [[] for _ in range(min(count, len(pairs)))]
+    for i, pair in enumerate(pairs):
+        shards[i % len(shards)].append(pair)
+    return shards
+
+
+def shard_max_open_trades(max_open_trades: float, shard: int, total: int) -> int:
+    if max_open_trades < 0 or max_open_trades == float("inf"):
+        return -1
+    # No position stacking: a shard never needs more slots than pairs
+    return min(shard, math.ceil(max_open_trades * shard / total))
+
+
+def run_shard(pool: BacktestPool, name: str, pairs: list[str], wallet: float,
+              max_open_trades: int) -> dict:
+    return pool.backtest(name, pairs=pairs, wallet=wallet, max_open_trades=max_open_trades)
+
+
+# ------------------ Merge ------------------
+def merge(pool: BacktestPool, contents: list[dict]) -> dict:
+    trades = [c["results"] for c in contents if len(c["results"])]
+    results = (
+        pd.concat(trades, ignore_index=True).sort_values(["open_date", "pair"], ignore_index=True)
+        if trades else contents[0]["results"]
+    )
+    wallets = [c["wallet_summary"] for c in contents if len(c["wallet_summary"])]
+    merged = {
+        "results": results,
+        "config": pool.config,
+        "locks": [lock for c in contents for lock in c["locks"]],
+        # Summed per date like freqtrade does for several currencies
+        "wallet_summary": pd.concat(wallets, ignore_index=True) if wallets else pd.DataFrame(),
+        "final_balance": sum(c["final_balance"] for c in contents),
+        "run_id": "",
+        "backtest_start_time": min(c["backtest_start_time"] for c in contents),
+        "backtest_end_time": max(c["backtest_end_time"] for c in contents),
+        "min_date": min(c["min_date"] for c in contents),
+        "max_date": max(c["max_date"] for c in contents),
+        "pairs": sorted(p for c in contents for p in c["pairs"]),
+    }
+    for key in COUNTERS:
+        merged[key] = sum(c[key] for c in contents)
+    return merged
+
+
+def peak_open(trades: pd.DataFrame) -> int:
+    """
+    Highest number of trades open at the same time.
+    """
+    if trades.empty:
+        return 0
+    events = pd.concat([
+        pd.DataFrame({"date": trades["open_date"], "delta": 1, "order": 1}),
+        pd.DataFrame({"date": trades["close_date"], "delta": -1, "order": 0}),
+    ]).sort_values(["date", "order"])
+    return int(events["delta"].cumsum().max())
+
+
+def peak_wallet_use(trades: pd.DataFrame, wallet: float) -> float:
+    """
+    Highest share of the balance (wallet + realized profit) tied up in trades,
+    from the filled entry orders (DCA included) and the trade closes.
+    """
+    events = []
+    for trade in trades.itertuples():
+        committed = 0.0
+        for order in trade.orders:
+            if order["ft_is_entry"]:
+                cost = order["cost"] / (trade.leverage or 1)
+                committed += cost
+                events.append((order["order_filled_timestamp"], 1, cost, 0.0))
+        events.append((trade.close_timestamp, 0, -committed, trade.profit_abs))
+    in_trades = realized = peak = 0.0
+    for _, _, delta, profit in sorted(events):
+        in_trades += delta
+        realized += profit
+        peak = max(peak, in_trades / max(wallet + realized, 1e-9))
+    return peak
+
+
+# ------------------ Divergence ------------------
+def divergence_warnings(pool: BacktestPool, name: str, shards: list[dict],
+                        merged: dict) -> list[str]:
+    if len(shards) == 1:
+        return []
+    strategy = pool.strategies[name]
+    max_open_trades = pool.max_open_trades[name]
+    pairs = len(merged["pairs"])
+    warnings = []
+
+    if 0 <= max_open_trades < pairs:
+        peak = peak_open(merged["results"])
+        warnings.append(
+            f"max_open_trades {max_open_trades} < {pairs} pairs: slots are split per shard "
+            f"instead of shared. Merged result had up to {peak} trades open at once"
+            + (" - more than the coupled run allows." if peak > max_open_trades else ".")
+        )
+    for shard in shards:
+        if shard["content"]["rejected_signals"]:
+            warnings.append(
+                f"Shard {shard['shard']} rejected {shard['content']['rejected_signals']} entries "
+                f"for lack of a slot ({shard['max_open_trades']} slots) - the coupled run "
+                "may have had a free slot for them."
+            )
+        used = peak_wallet_use(shard["content"]["results"], shard["wallet"])
+        if used > WALLET_USE_WARNING:
+            warnings.append(
+                f"Shard {shard['shard']} had up to {used:.0%} of its wallet in trades - in the "
+                "coupled run those entries / DCAs compete with the other pairs for one balance."
+            )
+
+    stake_from_wallet = (
+        pool.config.get("stake_amount") == "unlimited"
+        or "custom_stake_amount" in vars(type(strategy))
+    )
+    profit = merged["results"]["profit_abs"].sum() / pool.wallet if len(merged["results"]) else 0
+    if stake_from_wallet and abs(profit) > PROFIT_WARNING:
+        warnings.append(
+            f"Stakes follow the wallet and total profit is {profit:.1%}: each shard only "
+            "compounds its own profits, the coupled run compounds all pairs together."
+        )
+    if pool.config.get("enable_protections") and getattr(strategy, "protections", None):
+        warnings.append("Protections are evaluated per shard - global locks do not cross shards.")
+    return warnings
+
+
+def show_shards(shards: list[dict], stake_currency: str) -> None:
+    from freqtrade.util import print_rich_table
+
+    rows = []
+    for shard in shards:
+        trades = shard["content"]["results"]
+        profit = trades["profit_abs"].sum() if len(trades) else 0.0
+        rows.append([
+            shard["shard"],
+            ", ".join(shard["pairs"]),
+            f"{shard['wallet']:.2f}",
+            shard["max_open_trades"],
+            len(trades),
+            f"{profit:.2f} ({profit / shard['wallet']:.2%})",
+        ])
+    print_rich_table(
+        rows,
+        ["Shard", "Pairs", f"Wallet {stake_currency}", "Max open", "Trades",
+         f"Profit {stake_currency}"],
+        summary="SHARDS",
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Backtest one strategy with its pairs split over worker processes.",
+        usage="%(prog)s [options] --strategy X --config Y [backtesting options]",
+    )
+    parser.add_argument("--shards", type=int, default=None,
+                        help="Number of pair groups (default: --processes).")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Shards backtested in parallel (default: all cores).")
+    parser.add_argument("--no-skip-idle", action="store_true",
+                        help="Simulate every candle (see signal_index.py).")
+    args, freqtrade_args = parser.parse_known_args(argv)
+
+    from freqtrade.loggers import setup_logging_pre
+    from freqtrade.optimize.optimize_reports import show_backtest_results, store_backtest_results
+    from freqtrade.util import dt_now
+
+    setup_logging_pre()
+    config = backtest_config(freqtrade_args)
+    pool = BacktestPool(config, args.processes, skip_idle=not args.no_skip_idle)
+    if len(pool.strategies) != 1:
+        parser.error("sharded backtest needs exactly one --strategy")
+    name = next(iter(pool.strategies))
+
+    groups = make_shards(pool, args.shards or pool.processes)
+    total = sum(len(g) for g in groups)
+    shards = [{
+        "shard": i + 1,
+        "pairs": pairs,
+        "wallet": pool.wallet * len(pairs) / total,
+        "max_open_trades": shard_max_open_trades(pool.max_open_trades[name], len(pairs), total),
+    } for i, pairs in enumerate(groups)]
+    logger.info(f"{total} pairs in {len(shards)} shards, "
+                f"{min(pool.processes, len(shards))} in parallel")
+
+    contents = pool.map(run_shard, [
+        (name, s["pairs"], s["wallet"], s["max_open_trades"]) for s in shards
+    ])
+    for shard, content in zip(shards, contents):
+        shard["content"] = content
+    merged = merge(pool, contents)
+
+    results = pool.backtest_stats({name: merged})
+    show_backtest_results(config, results)
+    show_shards(shards, config["stake_currency"])
+    for warning in divergence_warnings(pool, name, shards, merged):
+        logger.warning(warning)
+
+    if config.get("export", "none") in ("trades", "signals"):
+        store_backtest_results(config, results, dt_now().strftime("%Y-%m-%d_%H-%M-%S"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# ================================================================
+# SharedFrames – memory-mapped dataframe store for hyperopt workers
+# ---------------------------------------------------------------
+# - Writes each dataframe once as raw .npy column groups
+# - Workers attach copy-on-write views by manifest path
+# - Pickles as the manifest path only (no per-worker data copy)
+# ================================================================
+
+import atexit
+import json
+import logging
+import os
+import pickle
+import shutil
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+# Original keys (dataprovider uses (pair, timeframe, CandleType) tuples) - kept exact
+KEYS = "keys.pkl"
+
+
+# ------------------ Store ------------------
+class SharedFrameStore:
+    """
+    Directory holding published frame sets.
+    Everything published by this process is removed again on exit.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._published: list[Path] = []
+        atexit.register(self.cleanup)
+
+    def publish(self, name: str, frames: dict) -> "SharedFrames":
+        """
+        Write frames to disk and return a SharedFrames mapping backed by them.
+        """
+        target = self.root / f"{name}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        target.mkdir(parents=True, exist_ok=True)
+        self._published.append(target)
+
+        entries = []
+        for i, (key, df) in enumerate(frames.items()):
+            entries.append(_write_frame(target, f"f{i}", key, df))
+
+        manifest = target / MANIFEST
+        with manifest.open("w") as f:
+            json.dump({"frames": entries}, f, default=str)
+        with (target / KEYS).open("wb") as f:
+            pickle.dump(list(frames.keys()), f)
+
+        size_mb = sum(p.stat().st_size for p in target.iterdir()) / 1024 / 1024
+        logger.info(f"Published {len(entries)} {name} frames to {target} ({size_mb:.1f} MB)")
+        return attach(str(manifest))
+
+    def cleanup(self) -> None:
+        for path in self._published:
+            shutil.rmtree(path, ignore_errors=True)
+        self._published = []
+
+
+def _write_frame(target: Path, prefix: str, key, df: pd.DataFrame) -> dict:
+    # Columns sharing a dtype go into one (ncols, rows) array -> one mapping per group
+    groups: dict[str, list] = {}
+    columns = []
+    for col in df.columns:
+        series = df[col]
+        dtype = series.dtype
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            values = series.to_numpy(dtype=f"datetime64[{dtype.unit}]").view("i8")
+            group = f"datetime-{dtype.unit}"
+            columns.append({"name": col, "kind": "datetime", "unit": dtype.unit,
+                            "tz": str(dtype.tz), "group": group,
+                            "pos": len(groups.setdefault(group, []))})
+            groups[group].append(values)
+        elif isinstance(dtype, np.dtype) and dtype.kind in "biufM":
+            group = dtype.str
+            columns.append({"name": col, "kind": "array", "group": group,
+                            "pos": len(groups.setdefault(group, []))})
+            groups[group].append(series.to_numpy())
+        else:
+            # Strings / tags / extension types - rare in processed data, keep as pickle
+            filename = f"{prefix}_c{len(columns)}.pkl"
+            series.to_pickle(target / filename)
+            columns.append({"name": col, "kind": "pickle", "file": filename})
+
+    files = {}
+    for g, (group, arrays) in enumerate(groups.items()):
+        filename = f"{prefix}_g{g}.npy"
+        np.save(target / filename, np.stack(arrays))
+        files[group] = filename
+
+    entry = {"key": key, "rows": len(df), "columns": columns, "files": files}
+    if not isinstance(df.index, pd.RangeIndex):
+        np.save(target / f"{prefix}_index.npy", df.index.to_numpy())
+        entry["index"] = f"{prefix}_index.npy"
+    else:
+        entry["index_start"] = int(df.index.start)
+    return entry
+
+
+# ------------------ Attach ------------------
+def _read_frame(base: Path, entry: dict) -> pd.DataFrame:
+    # Copy-on-write mappings: untouched pages stay shared between all workers,
+    # writes made by one epoch stay private to that epoch's frames
+    mapped = {group: np.load(base / filename, mmap_mode="c")
+              for group, filename in entry["files"].items()}
+
+    data = {}
+    for col in entry["columns"]:
+        if col["kind"] == "datetime":
+            ints = mapped[col["group"]][col["pos"]]
+            dates = pd.Series(ints.view(f"datetime64[{col['unit']}]"), copy=False)
+            data[col["name"]] = dates.dt.tz_localize(col["tz"])
+        elif col["kind"] == "array":
+            data[col["name"]] = mapped[col["group"]][col["pos"]]
+        else:
+            data[col["name"]] = pd.read_pickle(base / col["file"]).to_numpy()
+
+    if "index" in entry:
+        index = pd.Index(np.load(base / entry["index"]))
+    else:
+        start = entry.get("index_start", 0)
+        index = pd.RangeIndex(start, start + entry["rows"])
+
+    # copy=False keeps one block per column on top of the mappings
+    df = pd.DataFrame(data, copy=False)
+    df.index = index
+    return df
+
+
+def attach(manifest_path: str) -> "SharedFrames":
+    """
+    Open a published frame set.
+    Returns fresh DataFrame objects on every call, so per-epoch mutations
+    (signal columns, trimming) never leak into the next epoch.
+    """
+    manifest = Path(manifest_path)
+    with manifest.open() as f:
+        entries = json.load(f)["frames"]
+    with (manifest.parent / KEYS).open("rb") as f:
+        keys = pickle.load(f)
+    frames = {key: _read_frame(manifest.parent, e) for key, e in zip(keys, entries)}
+    return SharedFrames(manifest_path, frames)
+
+
+class SharedFrames(dict):
+    """
+    dict of key -> DataFrame backed by a published frame set.
+    Pickles as its manifest path, so sending it to a worker costs a few bytes.
+    """
+
+    def __init__(self, manifest_path: str, frames: dict):
+        super().__init__(frames)
+        self.manifest_path = manifest_path
+
+    def __reduce__(self):
+        return (attach, (self.manifest_path,))
@@ -0,0 +1,126 @@
+# ================================================================
+# SignalIndex – let the backtest jump between entry candles
+# ---------------------------------------------------------------
+# Sekka entries (rsi <= ENTRY_RSI & vwap_gap < ENTRY_VWAP_GAP) fire on few
+# candles, DCA trades are open only part of the time. Every other candle
+# freqtrade still walks through all pairs for nothing.
+#
+# - After the signals of a run are calculated, the candle times carrying an
+#   entry signal are collected into one sorted index (all pairs)
+# - While no trade is open, the time loop jumps straight to the next
+#   signal candle; while trades are open it runs candle by candle as usual
+# - Pair row indexes are fast-forwarded with searchsorted after a jump
+#
+# Built from the signals of each run, so it is always right for the
+# parameter values of that run (hyperopt epochs included).
+# Not used with dynamic pairlists or strategies that use bot_loop_start.
+# ================================================================
+
+import logging
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+_NS = np.array([], dtype=np.int64)
+
+
+def to_ns(value) -> int:
+    return pd.Timestamp(value).value
+
+
+class SignalIndex:
+    """
+    Installed on one Backtesting instance (instance attributes, so it also
+    travels with the pickled backtesting object into hyperopt workers).
+    """
+
+    def __init__(self, bt):
+        self.bt = bt
+        self.signals = _NS            # candle times (ns) with an entry signal, all pairs
+        self.dates: dict[str, np.ndarray] = {}
+        self.now = 0
+        self.simulated = 0
+        self.candles = 0
+
+    @classmethod
+    def install(cls, bt) -> "SignalIndex | None":
+        from freqtrade.strategy import IStrategy
+
+        strategies = getattr(bt, "strategylist", [])
+        if bt.dynamic_pairlist or any(
+            type(s).bot_loop_start is not IStrategy.bot_loop_start for s in strategies
+        ):
+            logger.info("Signal index not used (dynamic pairlist or bot_loop_start)")
+            return None
+        index = cls(bt)
+        bt._get_ohlcv_as_lists = index.get_ohlcv_as_lists
+        bt._time_generator = index.time_generator
+        bt._sync_pair_index = index.sync_pair_index
+        return index
+
+    # ------------------ Index ------------------
+    def get_ohlcv_as_lists(self, processed: dict) -> dict:
+        from freqtrade.optimize.backtesting import DATE_IDX, LONG_IDX, SHORT_IDX
+
+        bt = self.bt
+        data = type(bt)._get_ohlcv_as_lists(bt, processed)
+
+        signals = []
+        self.dates = {}
+        for pair, rows in data.items():
+            dates = np.fromiter((r[DATE_IDX].value for r in rows), dtype=np.int64, count=len(rows))
+            self.dates[pair] = dates
+            entry = [i for i, r in enumerate(rows) if r[LONG_IDX] == 1 or r[SHORT_IDX] == 1]
+            signals.append(dates[entry])
+        self.signals = np.unique(np.concatenate(signals)) if signals else _NS
+        return data
+
+    # ------------------ Backtesting replacements ------------------
+    def time_generator(self, start_date, end_date):
+        from freqtrade.persistence import LocalTrade
+
+        bt = self.bt
+        step = bt.timeframe_td
+        step_ns = int(step.total_seconds() * 1e9)
+        current_time = start_date + step
+        end_ns = to_ns(end_date)
+        self.now = to_ns(current_time)
+        self.simulated = 0
+        self.candles = max(0, (end_ns - self.now) // step_ns + 1)
+
+        while self.now <= end_ns:
+            yield current_time
+            self.simulated += 1
+            current_time += step
+            self.now += step_ns
+
+            if not LocalTrade.bt_trades_open:
+                i = self.signals.searchsorted(self.now)
+                target = self.signals[i] if i < len(self.signals) else end_ns + step_ns
+                if target > self.now:
+                    skipped = int((target - self.now) // step_ns)
+                    if bt._is_backtest_runmode:
+                        # Nothing open - balance is constant, keep the wallet history complete
+                        stake = bt.strategy.config["stake_currency"]
+                        if total := bt.wallets.get_total(stake):
+                            bt.wallet_captures.extend(
+                                (current_time + k * step, stake, 1, total) for k in range(skipped)
+                            )
+                    current_time += timedelta(microseconds=skipped * step_ns // 1000)
+                    self.now += skipped * step_ns
+                    bt._increment_progress(skipped)
+
+        if bt._is_backtest_runmode and self.candles:
+            logger.info(f"Signal index: simulated {self.simulated} of {self.candles} candles "
+                        f"({len(self.signals)} signal candles)")
+
+    def sync_pair_index(self, data: dict, pair: str, row_index: int, current_time) -> int:
+        dates = self.dates.get(pair)
+        if dates is None or row_index >= len(dates) or dates[row_index] >= self.now:
+            return row_index
+        # Candles were skipped - jump to the row of the current candle
+        return int(dates.searchsorted(self.now))
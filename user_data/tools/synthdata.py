@@ -0,0 +1,385 @@
+# ================================================================
+# Synthdata – synthetic OHLCV for scale and stress tests
+# ---------------------------------------------------------------
+# The 10 downloaded Binance pairs say nothing about 100 pairs, 1m data or
+# a market that never saw a 2022. This writes standard freqtrade feather
+# files (own data directory) for any pairs / timeframes / timerange:
+# - regime:    log returns from a bull / bear / chop Markov regime chain,
+#              fat tails (Student t) and volatility clustering
+# - bootstrap: blocks of real candles (returns, wicks, volume) drawn from
+#              the pairs of a downloaded data directory
+# - crashes:   sudden drops spread over a few candles (with wicks)
+# - gaps:      exchange outages - candles missing, price moved meanwhile
+# - futures:   twin PAIR:USDT series = spot * exp(basis), basis mean
+#              reverting; mark candles + 8h funding rates from the basis
+# - Finest timeframe generated, coarser ones resampled from it
+#   (resample.py), so all timeframes of a pair agree
+#
+# Deterministic: every pair has its own generator seeded from --seed and
+# the pair name - same pair, same candles, whatever else is generated.
+# The parameters are stored in <datadir>/synthetic.json.
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/synthdata.py --count 100 --timeframes 5m 1h --seed 7
+#   python3 user_data/tools/synthdata.py --pairs BTC/USDT ETH/USDT --model bootstrap --timeframes 1m
+#   freqtrade backtesting --datadir user_data/data/synthetic ...
+# ================================================================
+
+import argparse
+import json
+import logging
+import sys
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+MANIFEST = "synthetic.json"
+DAY = 86400
+YEAR = 365 * DAY
+
+# Annual log drift / volatility per regime, regime length in days
+REGIMES = {"bull": (0.9, 0.55), "bear": (-0.8, 0.85), "chop": (0.0, 0.35)}
+REGIME_DAYS = (10, 90)
+VOL_MEMORY_DAYS = 2          # half-life of the volatility clustering
+TAIL_DF = 4                  # Student t degrees of freedom
+BASIS_STD = 0.0015           # futures / spot log basis
+BASIS_HALF_LIFE_DAYS = 1
+FUNDING_HOURS = 8
+FUNDING_BASE = 0.0001
+FUNDING_PER_BASIS = 0.1      # rate per unit of average basis over the funding period
+FUNDING_CAP = 0.0075
+FUTURES_VOLUME = 3.0         # futures volume / spot volume
+MARK_TIMEFRAME = "1h"        # exchange mark_ohlcv_timeframe / funding_fee_timeframe
+GAP_HOURS = (1, 6)
+CRASH_CANDLES = (1, 12)
+
+
+# ------------------ Returns ------------------
+# Both models return per-candle log returns plus upper / lower wick
+# (log distance beyond open / close) and relative volume.
+def regime_returns(rng, n: int, step: int) -> tuple:
+    from scipy.signal import lfilter
+
+    day = DAY // step
+    dt = step / YEAR
+    lengths = rng.integers(REGIME_DAYS[0] * day, REGIME_DAYS[1] * day + 1, n // (REGIME_DAYS[0] * day) + 2)
+    k = len(REGIMES)
+    states = (rng.integers(k) + np.cumsum(rng.integers(1, k, len(lengths)))) % k
+    state = np.repeat(states, lengths)[:n]
+    mu, sigma = (np.array(v)[state] for v in zip(*REGIMES.values()))
+
+    eps = rng.standard_t(TAIL_DF, n) / np.sqrt(TAIL_DF / (TAIL_DF - 2))
+    # Volatility clustering: scale by the recent average move (mean 1)
+    a = 0.5 ** (1 / (VOL_MEMORY_DAYS * day))
+    recent = lfilter([1 - a], [1, -a], np.abs(eps))
+    cluster = np.r_[1.0, recent[:-1] / np.abs(eps).mean()]
+    scale = sigma * np.sqrt(dt) * cluster
+    returns = mu * dt + scale * eps
+    upper = np.abs(rng.normal(0, 0.6, n)) * scale
+    lower = np.abs(rng.normal(0, 0.6, n)) * scale
+    volume = rng.lognormal(0, 0.5, n) * (0.5 + np.abs(eps) * cluster)
+    return returns, upper, lower, volume
+
+
+def load_sources(datadir: Path, data_format: str, timeframe: str) -> list[np.ndarray]:
+    """
+    (returns, upper, lower, volume) rows of every spot pair with this timeframe.
+    """
+    from freqtrade.data.history.datahandlers import get_datahandler
+    from freqtrade.enums import CandleType, TradingMode
+
+    handler = get_datahandler(datadir, data_format)
+    sources = []
+    for pair, tf, _ in handler.ohlcv_get_available_data(datadir, TradingMode.SPOT):
+        if tf != timeframe:
+            continue
+        df = handler.ohlcv_load(pair, tf, CandleType.SPOT, fill_missing=False, warn_no_data=False)
+        o, h, l, c, v = (df[col].to_numpy(dtype=np.float64) for col in ("open", "high", "low", "close", "volume"))
+        if len(c) < 2 or (c <= 0).any():
+            continue
+        sources.append(np.stack([
+            np.log(c[1:] / c[:-1]),
+            np.log(h[1:] / np.maximum(o[1:], c[1:])),
+            np.log(np.minimum(o[1:], c[1:]) / l[1:]),
+            v[1:] / max(np.median(v), 1e-12),
+        ]))
+    return sources
+
+
+def bootstrap_returns(rng, n: int, sources: list[np.ndarray], block: int) -> tuple:
+    """
+    Blocks of `block` consecutive real candles, each from a random pair and position.
+    """
+    usable = [s for s in sources if s.shape[1] > block]
+    if not usable:
+        raise ValueError(f"no source pair with more than {block} candles")
+    rows = np.concatenate(usable, axis=1)
+    offsets = np.cumsum([0] + [s.shape[1] for s in usable[:-1]])
+    starts = np.concatenate([o + np.arange(s.shape[1] - block) for o, s in zip(offsets, usable)])
+    chosen = rng.choice(starts, n // block + 1)
+    index = (chosen[:, None] + np.arange(block)).ravel()[:n]
+    returns, upper, lower, volume = rows[:, index]
+    return returns, np.maximum(upper, 0), np.maximum(lower, 0), volume
+
+
+# ------------------ Events ------------------
+def inject_crashes(rng, returns, lower, per_year: float, depth: tuple[float, float], years: float) -> int:
+    count = rng.poisson(per_year * years)
+    for pos in rng.integers(0, len(returns), count):
+        drop = np.log(1 - rng.uniform(*depth))
+        length = int(rng.integers(CRASH_CANDLES[0], CRASH_CANDLES[1] + 1))
+        returns[pos:pos + length] += drop / length
+        lower[pos:pos + length] += -drop / length / 2
+    return count
+
+
+def outage_mask(rng, n: int, step: int, per_year: float, years: float) -> np.ndarray:
+    keep = np.ones(n, dtype=bool)
+    for pos in rng.integers(0, n, rng.poisson(per_year * years)):
+        hours = rng.uniform(*GAP_HOURS)
+        keep[pos:pos + max(1, int(hours * 3600 // step))] = False
+    return keep
+
+
+# ------------------ Candles ------------------
+def candles(dates, p0: float, v0: float, returns, upper, lower, volume) -> pd.DataFrame:
+    close = p0 * np.exp(np.cumsum(returns))
+    open_ = np.r_[p0, close[:-1]]
+    return pd.DataFrame({
+        "date": dates,
+        "open": open_,
+        "high": np.maximum(open_, close) * np.exp(upper),
+        "low": np.minimum(open_, close) * np.exp(-lower),
+        "close": close,
+        "volume": v0 * volume,
+    })
+
+
+def futures_twin(rng, spot: pd.DataFrame, step: int) -> tuple[pd.DataFrame, np.ndarray]:
+    """
+    Futures candles and the basis they were built with.
+    """
+    from scipy.signal import lfilter
+
+    n = len(spot)
+    phi = 0.5 ** (step / (BASIS_HALF_LIFE_DAYS * DAY))
+    basis = lfilter([BASIS_STD * np.sqrt(1 - phi ** 2)], [1, -phi], rng.normal(0, 1, n))
+    factor = np.exp(basis)
+    close = spot["close"].to_numpy() * factor
+    open_ = np.r_[spot["open"].iloc[0] * factor[0], close[:-1]]
+    futures = pd.DataFrame({
+        "date": spot["date"],
+        "open": open_,
+        "high": np.maximum(open_, np.maximum(close, spot["high"].to_numpy() * factor)),
+        "low": np.minimum(open_, np.minimum(close, spot["low"].to_numpy() * factor)),
+        "close": close,
+        "volume": spot["volume"].to_numpy() * FUTURES_VOLUME,
+    })
+    return futures, basis
+
+
+def funding_rates(dates: pd.Series, basis: np.ndarray) -> pd.DataFrame:
+    """
+    One rate every FUNDING_HOURS from the average basis of the period, capped.
+    """
+    ns = dates.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    period = ns // (FUNDING_HOURS * 3600 * 1_000_000_000)
+    starts = np.flatnonzero(np.r_[True, period[1:] != period[:-1]])
+    mean = np.add.reduceat(basis, starts) / np.diff(np.r_[starts, len(basis)])
+    rate = np.clip(FUNDING_BASE + FUNDING_PER_BASIS * mean, -FUNDING_CAP, FUNDING_CAP)
+    # Paid at the end of the period, i.e. with the first candle of the next one
+    settle = pd.to_datetime((period[starts] + 1) * FUNDING_HOURS * 3600, unit="s", utc=True)
+    # "funding_rate" column; older freqtrade stores the rate as OHLCV candles (rate in "open")
+    return pd.DataFrame({
+        "date": settle, "funding_rate": rate,
+        "open": rate, "high": rate, "low": rate, "close": rate, "volume": 0.0,
+    })
+
+
+# ------------------ Generate ------------------
+def pair_rng(seed: int, pair: str, stream: int = 0):
+    return np.random.default_rng([seed, zlib.crc32(pair.encode()), stream])
+
+
+def generate_pair(pair: str, settings: dict, sources: list | None) -> dict[str, pd.DataFrame]:
+    """
+    Base timeframe frames of one pair: {"spot", "futures", "mark", "funding_rate"}.
+    """
+    step = settings["step"]
+    start, stop = settings["start"], settings["stop"]
+    dates = pd.date_range(
+        pd.Timestamp(start - start % step, unit="s", tz="UTC"),
+        pd.Timestamp(stop - 1, unit="s", tz="UTC"), freq=f"{step}s",
+    )
+    n = len(dates)
+    years = n * step / YEAR
+    rng = pair_rng(settings["seed"], pair)
+
+    p0 = 10 ** rng.uniform(-3, 4.5)
+    v0 = 10 ** rng.uniform(3, 6) / p0 * step / 300
+    if settings["model"] == "bootstrap":
+        series = bootstrap_returns(rng, n, sources, settings["block"])
+    else:
+        series = regime_returns(rng, n, step)
+    returns, upper, lower, volume = (np.array(s, dtype=np.float64) for s in series)
+    inject_crashes(rng, returns, lower, settings["crashes"], settings["crash_depth"], years)
+    keep = outage_mask(rng, n, step, settings["gaps"], years)
+
+    spot = candles(dates, p0, v0, returns, upper, lower, volume)
+    frames = {"spot": spot[keep].reset_index(drop=True)}
+    if settings["futures"]:
+        futures, basis = futures_twin(pair_rng(settings["seed"], pair, 1), spot, step)
+        frames["futures"] = futures[keep].reset_index(drop=True)
+        frames["funding_rate"] = funding_rates(spot["date"], basis)
+    return frames
+
+
+def write_pair(handler, pair: str, frames: dict, timeframes: list[str], step: int,
+               markets: list[str]) -> int:
+    from freqtrade.enums import CandleType
+    from freqtrade.exchange import timeframe_to_seconds
+
+    from resample import resample
+
+    futures_pair = f"{pair}:{pair.split('/')[1]}"
+    written = 0
+    for market, candle_type, name in (("spot", CandleType.SPOT, pair),
+                                      ("futures", CandleType.FUTURES, futures_pair)):
+        if market not in markets:
+            continue
+        base = frames[market]
+        for tf in timeframes:
+            seconds = timeframe_to_seconds(tf)
+            df = base if seconds == step else resample(base, step, seconds).reset_index(drop=True)
+            handler.ohlcv_store(name, tf, df, candle_type)
+            written += len(df)
+    if "futures" in markets:
+        mark_seconds = timeframe_to_seconds(MARK_TIMEFRAME)
+        # Mark price follows the index, i.e. spot
+        mark = resample(frames["spot"], step, mark_seconds).reset_index(drop=True)
+        handler.ohlcv_store(futures_pair, MARK_TIMEFRAME, mark, CandleType.MARK)
+        handler.ohlcv_store(futures_pair, MARK_TIMEFRAME, frames["funding_rate"], CandleType.FUNDING_RATE)
+        written += len(mark) + len(frames["funding_rate"])
+    return written
+
+
+def market_pairs(exchange_name: str, count: int, futures: bool) -> list[str]:
+    """
+    First `count` active USDT spot pairs of the exchange (with a USDT
+    perpetual when futures are generated), so backtests find the markets.
+    """
+    from coverage import make_exchange
+
+    exchange = make_exchange(exchange_name, "spot")
+    try:
+        markets = exchange.markets
+    finally:
+        exchange.close()
+    pairs = sorted(
+        symbol for symbol, m in markets.items()
+        if m.get("spot") and m.get("active", True) and m.get("quote") == "USDT"
+        and (not futures or f"{symbol}:USDT" in markets)
+    )
+    if len(pairs) < count:
+        logger.warning(f"Only {len(pairs)} matching pairs on {exchange_name}")
+    return pairs[:count]
+
+
+# ------------------ Main ------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Write synthetic OHLCV data.")
+    names = parser.add_mutually_exclusive_group(required=True)
+    names.add_argument("--pairs", nargs="+", help="Pair names, e.g. BTC/USDT ETH/USDT.")
+    names.add_argument("--count", type=int,
+                       help="Generate this many pairs, named after the exchange's USDT markets.")
+    parser.add_argument("--exchange", default="binance", help="Exchange for --count (default: binance).")
+    parser.add_argument("--timeframes", nargs="+", default=["5m", "30m", "1h"],
+                        help="Timeframes; the finest is generated, the rest resampled (default: 5m 30m 1h).")
+    parser.add_argument("--timerange", default="20220101-20251230",
+                        help="Range to generate (default: 20220101-20251230).")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42).")
+    parser.add_argument("--model", choices=["regime", "bootstrap"], default="regime",
+                        help="Return model (default: regime).")
+    parser.add_argument("--source", type=Path, default=TOOLS_DIR.parent / "data" / "binance",
+                        help="bootstrap: real data to draw from (default: user_data/data/binance).")
+    parser.add_argument("--block", default="1d",
+                        help="bootstrap: block length as a timeframe (default: 1d).")
+    parser.add_argument("--crashes", type=float, default=1.0,
+                        help="Crashes per pair and year (default: 1).")
+    parser.add_argument("--crash-depth", type=float, nargs=2, default=[0.2, 0.5], metavar=("MIN", "MAX"),
+                        help="Crash size as fraction of the price (default: 0.2 0.5).")
+    parser.add_argument("--gaps", type=float, default=2.0,
+                        help="Outages (missing candles) per pair and year (default: 2).")
+    parser.add_argument("--trading-mode", nargs="+", default=["spot", "futures"],
+                        choices=["spot", "futures"], help="Markets (default: both, futures as twins).")
+    parser.add_argument("--datadir", type=Path, default=TOOLS_DIR.parent / "data" / "synthetic",
+                        help="Output directory (default: user_data/data/synthetic).")
+    parser.add_argument("--data-format", default="feather", help="Data format (default: feather).")
+    args = parser.parse_args(argv)
+
+    from freqtrade.configuration import TimeRange
+    from freqtrade.data.history.datahandlers import get_datahandler
+    from freqtrade.exchange import timeframe_to_seconds
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+    if str(TOOLS_DIR) not in sys.path:
+        sys.path.insert(0, str(TOOLS_DIR))
+
+    timeframes = sorted(set(args.timeframes), key=timeframe_to_seconds)
+    step = timeframe_to_seconds(timeframes[0])
+    futures = "futures" in args.trading_mode
+    for tf in timeframes[1:] + ([MARK_TIMEFRAME] if futures else []):
+        if timeframe_to_seconds(tf) % step or timeframe_to_seconds(tf) > DAY:
+            parser.error(f"{tf} is not built from {timeframes[0]} candles")
+    timerange = TimeRange.parse_timerange(args.timerange)
+    if not timerange.startts or not timerange.stopts:
+        parser.error("--timerange needs a start and an end")
+
+    settings = {
+        "seed": args.seed, "model": args.model, "step": step,
+        "start": timerange.startts, "stop": timerange.stopts,
+        "block": max(1, timeframe_to_seconds(args.block) // step),
+        "crashes": args.crashes, "crash_depth": tuple(args.crash_depth), "gaps": args.gaps,
+        "futures": futures,
+    }
+    sources = None
+    if args.model == "bootstrap":
+        sources = load_sources(args.source, args.data_format, timeframes[0])
+        if not sources:
+            parser.error(f"no {timeframes[0]} spot data in {args.source}")
+        logger.info(f"Bootstrap from {len(sources)} pairs of {args.source}")
+
+    pairs = args.pairs or market_pairs(args.exchange, args.count, futures)
+
+    handler = get_datahandler(args.datadir, args.data_format)
+    start = time.time()
+    candles_written = 0
+    for i, pair in enumerate(pairs, 1):
+        frames = generate_pair(pair, settings, sources)
+        candles_written += write_pair(handler, pair, frames, timeframes, step, args.trading_mode)
+        if i % 10 == 0 or i == len(pairs):
+            logger.info(f"{i}/{len(pairs)} pairs ({time.time() - start:.0f}s)")
+
+    manifest = {
+        "pairs": pairs, "timeframes": timeframes, "timerange": args.timerange,
+        "trading_mode": args.trading_mode, "source": str(args.source) if sources else None,
+        **{k: v for k, v in settings.items() if k not in ("start", "stop", "futures")},
+    }
+    args.datadir.mkdir(parents=True, exist_ok=True)
+    (args.datadir / MANIFEST).write_text(json.dumps(manifest, indent=1))
+    logger.info(
+        f"{candles_written} candles of {len(pairs)} pairs written to {args.datadir} "
+        f"in {time.time() - start:.0f}s - use --datadir {args.datadir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+# ================================================================
+# Walk-Forward – optimize in-sample, test out-of-sample, in parallel
+# ---------------------------------------------------------------
+# - Splits the timerange into windows: train N days, then test M days
+#   rolling  : train window moves with the test window
+#   anchored : train always starts at the beginning of the timerange
+# - Each window: optuna search on the train part (same spaces / loss as
+#   hyperopt), best parameters backtested on the test part
+# - Windows run in parallel over data loaded once (backtest_pool.py)
+# - Test trades of all windows stitched into one equity curve
+#
+# Usage (inside the container, from /freqtrade):
+#   python3 user_data/tools/walkforward.py --train 365 --test 90 --epochs 200 \
+#     --strategy OptLong --config user_data/config-long.json --timerange 20220101-20251230
+#   (everything not listed in --help goes to freqtrade backtesting)
+# ================================================================
+
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from backtest_pool import BacktestPool, backtest_config  # noqa: E402
+
+
+# ------------------ Windows ------------------
+def make_windows(start: datetime, end: datetime, train: int, test: int,
+                 anchored: bool = False) -> list[dict]:
+    windows = []
+    test_start = start + timedelta(days=train)
+    while test_start < end:
+        windows.append({
+            "train_start": start if anchored else test_start - timedelta(days=train),
+            "train_end": test_start,
+            "test_start": test_start,
+            "test_end": min(test_start + timedelta(days=test), end),
+        })
+        test_start += timedelta(days=test)
+    return windows
+
+
+def data_range(pool: BacktestPool) -> tuple[datetime, datetime]:
+    """
+    First / last candle of the backtest (without the startup candles).
+    """
+    startup = pool.bt.required_startup
+    frames = [df for df in pool.data.values() if len(df) > startup]
+    start = min(df["date"].iloc[startup] for df in frames)
+    end = max(df["date"].iloc[-1] for df in frames)
+    return start.to_pydatetime(), end.to_pydatetime() + timedelta(seconds=1)
+
+
+# ------------------ Optimize ------------------
+_loss = None
+
+
+def window_loss(pool: BacktestPool, name: str, content: dict) -> tuple[float, dict]:
+    """
+    Loss of a backtest with the configured hyperopt loss (MAX_LOSS below min trades).
+    """
+    global _loss
+    from freqtrade.optimize.hyperopt.hyperopt_optimizer import MAX_LOSS
+    from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
+
+    if _loss is None:
+        _loss = HyperOptLossResolver.load_hyperoptloss(pool.config)
+
+    stats = pool.stats(name, content)
+    if stats["total_trades"] < pool.config.get("hyperopt_min_trades", 1):
+        return MAX_LOSS, stats
+    loss = _loss.hyperopt_loss_function(
+        results=content["results"],
+        trade_count=stats["total_trades"],
+        min_date=content["min_date"],
+        max_date=content["max_date"],
+        config=pool.config,
+        processed=pool.analyzed[name],
+        backtest_stats=stats,
+        starting_balance=pool.wallet,
+    )
+    return loss, stats
+
+
+def run_window(pool: BacktestPool, name: str, number: int, window: dict,
+               spaces: list[str], epochs: int, seed: int) -> dict:
+    import optuna
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    strategy = pool.strategies[name]
+    dimensions = {
+        pname: param.get_space(pname)
+        for pname, param in strategy.enumerate_parameters()
+        if param.optimize and param.space in spaces
+    }
+    study = optuna.create_study(
+        sampler=optuna.samplers.TPESampler(seed=seed + number), direction="minimize"
+    )
+
+    for _ in range(epochs if dimensions else 1):
+        trial = study.ask(dimensions)
+        content = pool.backtest(name, trial.params, window["train_start"], window["train_end"])
+        loss, _ = window_loss(pool, name, content)
+        study.tell(trial, loss)
+
+    best = study.best_trial
+    train = pool.backtest(name, best.params, window["train_start"], window["train_end"])
+    test = pool.backtest(name, best.params, window["test_start"], window["test_end"])
+    train_stats = pool.stats(name, train)
+    test_stats = pool.stats(name, test)
+    logger.info(f"Window {number}: loss {best.value:.5f}, "
+                f"{test_stats['total_trades']} test trades, "
+                f"{test_stats['profit_total']:.2%} test profit")
+
+    trades = test["results"].copy()
+    trades["window"] = number
+    return {
+        "window": number,
+        **{k: v.isoformat() for k, v in window.items()},
+        "params": best.params,
+        "loss": best.value,
+        "train_trades": train_stats["total_trades"],
+        "train_profit": train_stats["profit_total"],
+        "test_trades": test_stats["total_trades"],
+        "test_profit": test_stats["profit_total"],
+        "test_drawdown": test_stats["max_relative_drawdown"],
+        "trades": trades,
+    }
+
+
+# ------------------ Report ------------------
+def stitch(results: list[dict], wallet: float) -> pd.DataFrame:
+    """
+    Test trades of all windows in close order with the running balance.
+    Every window starts from the same wallet, so profits add up (no compounding
+    across windows).
+    """
+    trades = [r["trades"] for r in results if len(r["trades"])]
+    if not trades:
+        return pd.DataFrame(columns=["close_date", "pair", "window", "profit_abs", "equity"])
+    df = pd.concat(trades, ignore_index=True).sort_values("close_date", ignore_index=True)
+    df["equity"] = wallet + df["profit_abs"].cumsum()
+    return df[["close_date", "pair", "window", "profit_abs", "profit_ratio", "equity"]]
+
+
+def max_drawdown(equity: pd.Series, wallet: float) -> float:
+    curve = pd.concat([pd.Series([wallet]), equity], ignore_index=True)
+    return float((1 - curve / curve.cummax()).max())
+
+
+def show(name: str, results: list[dict], equity: pd.DataFrame, wallet: float) -> None:
+    from freqtrade.util import print_rich_table
+
+    rows = []
+    for r in results:
+        rows.append([
+            r["window"],
+            f"{r['train_start'][:10]} -> {r['train_end'][:10]}",
+            f"{r['test_start'][:10]} -> {r['test_end'][:10]}",
+            ", ".join(f"{k}={v}" for k, v in r["params"].items()),
+            f"{r['loss']:.5f}",
+            f"{r['train_trades']} / {r['train_profit']:.2%}",
+            f"{r['test_trades']} / {r['test_profit']:.2%}",
+            f"{r['test_drawdown']:.2%}",
+        ])
+    print_rich_table(
+        rows,
+        ["#", "Train", "Test", "Parameters", "Loss", "Train trades / profit",
+         "Test trades / profit", "Test DD"],
+        summary=f"WALK-FORWARD {name}",
+    )
+
+    profit = equity["profit_abs"].sum() if len(equity) else 0.0
+    drawdown = max_drawdown(equity["equity"], wallet) if len(equity) else 0.0
+    print(f"Stitched out-of-sample: {len(equity)} trades, "
+          f"profit {profit:.2f} ({profit / wallet:.2%}), max drawdown {drawdown:.2%}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Walk-forward optimization over rolling or anchored windows.",
+        usage="%(prog)s [options] --strategy X --config Y --timerange Z [backtesting options]",
+    )
+    parser.add_argument("--train", type=int, default=365, help="Train window in days (default: 365).")
+    parser.add_argument("--test", type=int, default=90, help="Test window in days (default: 90).")
+    parser.add_argument("--anchored", action="store_true",
+                        help="Train from the start of the timerange instead of a rolling window.")
+    parser.add_argument("--epochs", type=int, default=100, help="Optuna trials per window (default: 100).")
+    parser.add_argument("--spaces", nargs="+", default=["buy", "sell"],
+                        help="Parameter spaces to optimize (default: buy sell).")
+    parser.add_argument("--hyperopt-loss", default="ZeroLossMaxTrades",
+                        help="Hyperopt loss class (default: ZeroLossMaxTrades).")
+    parser.add_argument("--min-trades", type=int, default=1,
+                        help="Train windows with fewer trades get the maximum loss (default: 1).")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Windows optimized in parallel (default: all cores).")
+    parser.add_argument("--no-skip-idle", action="store_true",
+                        help="Simulate every candle (see signal_index.py).")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42).")
+    args, freqtrade_args = parser.parse_known_args(argv)
+
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+    config = backtest_config(freqtrade_args)
+    config["hyperopt_loss"] = args.hyperopt_loss
+    config["hyperopt_min_trades"] = args.min_trades
+
+    pool = BacktestPool(config, args.processes, skip_idle=not args.no_skip_idle)
+    if len(pool.strategies) != 1:
+        parser.error("walk-forward needs exactly one --strategy")
+    name = next(iter(pool.strategies))
+
+    start, end = data_range(pool)
+    windows = make_windows(start, end, args.train, args.test, args.anchored)
+    if not windows:
+        parser.error(f"timerange {start:%Y-%m-%d} -> {end:%Y-%m-%d} is shorter than "
+                     f"--train {args.train} days")
+    logger.info(f"{len(windows)} windows, {args.epochs} epochs each, "
+                f"{min(pool.processes, len(windows))} in parallel")
+
+    results = pool.map(run_window, [
+        (name, i + 1, w, args.spaces, args.epochs, args.seed) for i, w in enumerate(windows)
+    ])
+    equity = stitch(results, pool.wallet)
+    show(name, results, equity, pool.wallet)
+
+    out_dir = config["user_data_dir"] / "backtest_results"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = out_dir / f"walkforward-{name}-{datetime.now():%Y-%m-%d_%H-%M-%S}"
+    equity.to_csv(f"{stem}.csv", index=False)
+    Path(f"{stem}.json").write_text(json.dumps({
+        "strategy": name,
+        "train_days": args.train,
+        "test_days": args.test,
+        "anchored": args.anchored,
+        "epochs": args.epochs,
+        "hyperopt_loss": args.hyperopt_loss,
+        "windows": [{k: v for k, v in r.items() if k != "trades"} for r in results],
+    }, indent=2, default=str))
+    print(f"Equity curve: {stem}.csv, windows: {stem}.json")
+
+
+if __name__ == "__main__":
+    main()
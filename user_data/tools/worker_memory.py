@@ -0,0 +1,116 @@
+# ================================================================
+# WorkerMemory – memory-aware sizing of the hyperopt worker pool
+# ---------------------------------------------------------------
+# - Samples the private memory (USS) of every worker while epochs run
+# - Sizes the pool so peak worker memory fits into available RAM
+# - Grows / shrinks the pool between batches, halves it on OOM kills
+# ================================================================
+
+import logging
+import os
+import threading
+from pathlib import Path
+
+import psutil
+
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+# cgroup v2 limit of the container (docker --memory), if any
+CGROUP_MAX = Path("/sys/fs/cgroup/memory.max")
+CGROUP_CURRENT = Path("/sys/fs/cgroup/memory.current")
+
+
+def available_memory() -> int:
+    """
+    Bytes still available to this process tree - host RAM or the container limit,
+    whichever is smaller.
+    """
+    available = psutil.virtual_memory().available
+    try:
+        limit = CGROUP_MAX.read_text().strip()
+        if limit != "max":
+            available = min(available, int(limit) - int(CGROUP_CURRENT.read_text()))
+    except (OSError, ValueError):
+        pass
+    return max(available, 0)
+
+
+class MemoryGovernor:
+    """
+    Decides how many hyperopt workers may run at the same time.
+
+    Starts with `initial` workers, measures their peak USS while they run and
+    after every batch re-sizes the pool to
+        (available + memory of running workers - reserve) / peak per worker
+    clamped to [1, max_workers].
+    """
+
+    def __init__(self, max_workers: int, reserve_mb: int = 1024, initial: int = 2,
+                 interval: float = 0.5):
+        self.max_workers = max(1, max_workers)
+        self.reserve = reserve_mb * MB
+        self.workers = min(self.max_workers, max(1, initial))
+        self.interval = interval
+        self.peak_worker = 0       # highest USS seen for a single worker
+        self._running_total = 0    # USS of all workers at the last sample
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ------------------ Sampling ------------------
+    def _sample(self) -> None:
+        total = 0
+        for child in psutil.Process(os.getpid()).children(recursive=True):
+            try:
+                uss = child.memory_full_info().uss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            total += uss
+            self.peak_worker = max(self.peak_worker, uss)
+        self._running_total = total
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "MemoryGovernor":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="memory-governor", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self._sample()
+
+    # ------------------ Sizing ------------------
+    def resize(self) -> int:
+        """
+        Re-size the pool from the measurements of the last batch.
+        Returns the new number of workers.
+        """
+        if not self.peak_worker:
+            return self.workers
+
+        budget = available_memory() + self._running_total - self.reserve
+        fits = int(budget // self.peak_worker)
+        workers = min(self.max_workers, max(1, fits))
+        if workers != self.workers:
+            logger.info(
+                f"Worker pool {self.workers} -> {workers} "
+                f"(peak {self.peak_worker / MB:.0f} MB per worker, "
+                f"{budget / MB:.0f} MB budget)"
+            )
+            self.workers = workers
+        return self.workers
+
+    def worker_lost(self) -> int:
+        """
+        A worker got killed (usually the OOM killer) - halve the pool.
+        """
+        self.workers = max(1, self.workers // 2)
+        logger.warning(f"Worker terminated unexpectedly, reducing pool to {self.workers}")
+        return self.workers